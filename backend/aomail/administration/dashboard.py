@@ -94,7 +94,8 @@ def get_costs_info(request: HttpRequest) -> Response:
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        for statistic in Statistics.objects.all():
+        statistics = Statistics.objects.only("nb_tokens_input", "nb_tokens_output")
+        for statistic in statistics.iterator(chunk_size=2000):
             total_nb_tokens_input += statistic.nb_tokens_input
             total_nb_tokens_output += statistic.nb_tokens_output
 
@@ -275,7 +276,7 @@ def search_user_info(request: HttpRequest) -> Response:
         subscription = Subscription.objects.get(user=user)
         trial_period = timedelta(days=14)
         statistics = Statistics.objects.get(user=user)
-        social_apis = SocialAPI.objects.filter(user=user)
+        social_apis = SocialAPI.objects.filter(user=user).only("type_api", "email")
 
         nb_tokens_input = statistics.nb_tokens_input
         nb_tokens_output = statistics.nb_tokens_output
@@ -1,5 +1,6 @@
 import json
 from aomail.models import Statistics
+from django.db.models import F
 from django.contrib.auth.models import User
 import re
 
@@ -15,10 +16,10 @@ def update_tokens_stats(user: User, result: dict) -> dict:
     Returns:
         dict: The modified result dictionary with 'tokens_input' and 'tokens_output' keys removed.
     """
-    statistics = Statistics.objects.get(user=user)
-    statistics.nb_tokens_input += result.pop("tokens_input")
-    statistics.nb_tokens_output += result.pop("tokens_output")
-    statistics.save()
+    Statistics.objects.filter(user=user).update(
+        nb_tokens_input=F("nb_tokens_input") + result.pop("tokens_input"),
+        nb_tokens_output=F("nb_tokens_output") + result.pop("tokens_output"),
+    )
     return result
 
 
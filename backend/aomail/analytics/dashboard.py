@@ -25,7 +25,7 @@ from aomail.constants import (
     USELESS,
 )
 from django.contrib.auth.models import User
-from django.db.models import Count, Value
+from django.db.models import Count, Q, Value
 from django.db.models.functions import Substr, StrIndex, Length
 
 LOGGER = logging.getLogger(__name__)
@@ -43,8 +43,8 @@ def get_emails_received_data(user: User) -> dict:
         # Get top 5 senders with their counts and names
         top_senders = (
             Email.objects.filter(user=user)
-            .values("sender__email", "sender__name")
-            .annotate(count=Count("sender__email"))
+            .values("sender_email", "sender_name")
+            .annotate(count=Count("sender_email"))
             .order_by("-count")[:5]
         )
 
@@ -53,9 +53,9 @@ def get_emails_received_data(user: User) -> dict:
             Email.objects.filter(user=user)
             .annotate(
                 domain=Substr(
-                    "sender__email",
-                    StrIndex("sender__email", Value("@")) + 1,
-                    Length("sender__email"),
+                    "sender_email",
+                    StrIndex("sender_email", Value("@")) + 1,
+                    Length("sender_email"),
                 )
             )
             .values("domain")
@@ -69,8 +69,8 @@ def get_emails_received_data(user: User) -> dict:
 
         ordered_senders = [
             {
-                "email": sender["sender__email"],
-                "name": sender["sender__name"] or "",  # Ensure name is never null
+                "email": sender["sender_email"],
+                "name": sender["sender_name"] or "",  # Ensure name is never null
                 "value": sender["count"],
             }
             for sender in top_senders
@@ -108,48 +108,51 @@ def dashboard_data(request: HttpRequest) -> Response:
         user = request.user
         categories = Category.objects.filter(user=user)
 
-        distribution = {}
-        for category in categories:
-            nb_emails_important = Email.objects.filter(
-                user=user, category=category.id, priority=IMPORTANT
-            )
-            nb_emails_informative = Email.objects.filter(
-                user=user, category=category.id, priority=INFORMATIVE
-            )
-            nb_emails_useless = Email.objects.filter(
-                user=user, category=category.id, priority=USELESS
-            )
-
-            nb_emails_answer_required = Email.objects.filter(
-                user=user, category=category.id, answer=ANSWER_REQUIRED
-            )
-            nb_emails_might_require_answer = Email.objects.filter(
-                user=user, category=category.id, answer=MIGHT_REQUIRE_ANSWER
-            )
-            nb_emails_no_answer_required = Email.objects.filter(
-                user=user, category=category.id, answer=NO_ANSWER_REQUIRED
-            )
-
-            nb_emails_highly_relevant = Email.objects.filter(
-                user=user, category=category.id, relevance=HIGHLY_RELEVANT
-            )
-            nb_emails_possibly_relevant = Email.objects.filter(
-                user=user, category=category.id, relevance=POSSIBLY_RELEVANT
-            )
-            nb_emails_not_relevant = Email.objects.filter(
-                user=user, category=category.id, relevance=NOT_RELEVANT
+        # count every classification of every category in a single grouped query
+        category_counts = (
+            Email.objects.filter(user=user)
+            .values("category")
+            .annotate(
+                nb_emails_important=Count("id", filter=Q(priority=IMPORTANT)),
+                nb_emails_informative=Count("id", filter=Q(priority=INFORMATIVE)),
+                nb_emails_useless=Count("id", filter=Q(priority=USELESS)),
+                nb_emails_answer_required=Count("id", filter=Q(answer=ANSWER_REQUIRED)),
+                nb_emails_might_require_answer=Count(
+                    "id", filter=Q(answer=MIGHT_REQUIRE_ANSWER)
+                ),
+                nb_emails_no_answer_required=Count(
+                    "id", filter=Q(answer=NO_ANSWER_REQUIRED)
+                ),
+                nb_emails_highly_relevant=Count(
+                    "id", filter=Q(relevance=HIGHLY_RELEVANT)
+                ),
+                nb_emails_possibly_relevant=Count(
+                    "id", filter=Q(relevance=POSSIBLY_RELEVANT)
+                ),
+                nb_emails_not_relevant=Count("id", filter=Q(relevance=NOT_RELEVANT)),
             )
+        )
+        counts_by_category = {counts["category"]: counts for counts in category_counts}
 
+        distribution = {}
+        for category in categories:
+            counts = counts_by_category.get(category.id, {})
             distribution[category.name] = {
-                "nbEmailsImportant": nb_emails_important.count(),
-                "nbEmailsInformative": nb_emails_informative.count(),
-                "nbEmailsUseless": nb_emails_useless.count(),
-                "nbEmailsAnswerRequired": nb_emails_answer_required.count(),
-                "nbEmailsMightRequireAnswer": nb_emails_might_require_answer.count(),
-                "nbEmailsNoAnswerRequired": nb_emails_no_answer_required.count(),
-                "nbEmailsHighlyRelevant": nb_emails_highly_relevant.count(),
-                "nbEmailsPossiblyRelevant": nb_emails_possibly_relevant.count(),
-                "nbEmailsNotRelevant": nb_emails_not_relevant.count(),
+                "nbEmailsImportant": counts.get("nb_emails_important", 0),
+                "nbEmailsInformative": counts.get("nb_emails_informative", 0),
+                "nbEmailsUseless": counts.get("nb_emails_useless", 0),
+                "nbEmailsAnswerRequired": counts.get("nb_emails_answer_required", 0),
+                "nbEmailsMightRequireAnswer": counts.get(
+                    "nb_emails_might_require_answer", 0
+                ),
+                "nbEmailsNoAnswerRequired": counts.get(
+                    "nb_emails_no_answer_required", 0
+                ),
+                "nbEmailsHighlyRelevant": counts.get("nb_emails_highly_relevant", 0),
+                "nbEmailsPossiblyRelevant": counts.get(
+                    "nb_emails_possibly_relevant", 0
+                ),
+                "nbEmailsNotRelevant": counts.get("nb_emails_not_relevant", 0),
             }
 
         emails_received_data = get_emails_received_data(user)
@@ -30,7 +30,7 @@ from aomail.constants import (
 )
 from django.contrib.auth.models import User
 from django.utils import timezone
-from django.db.models import QuerySet
+from django.db.models import Count, Q, QuerySet
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from aomail.utils.email_processing import camel_to_snake
@@ -371,22 +371,18 @@ def get_aomail_data(social_apis: list[SocialAPI]) -> dict:
     Returns:
         dict: A dictionary containing Aomail data statistics.
     """
-    num_emails_received = Email.objects.filter(social_api__in=social_apis).count()
-    num_emails_read = Email.objects.filter(
-        social_api__in=social_apis, read=True
-    ).count()
-    num_emails_archived = Email.objects.filter(
-        social_api__in=social_apis, archive=True
-    ).count()
-    num_emails_reply_later = Email.objects.filter(
-        social_api__in=social_apis, answer_later=True
-    ).count()
+    counts = Email.objects.filter(social_api__in=social_apis).aggregate(
+        received=Count("id"),
+        read=Count("id", filter=Q(read=True)),
+        archived=Count("id", filter=Q(archive=True)),
+        reply_later=Count("id", filter=Q(answer_later=True)),
+    )
 
     return {
-        "nbEmailsReceived": num_emails_received,
-        "nbEmailsRead": num_emails_read,
-        "nbEmailsArchived": num_emails_archived,
-        "nbEmailsReplyLater": num_emails_reply_later,
+        "nbEmailsReceived": counts["received"],
+        "nbEmailsRead": counts["read"],
+        "nbEmailsArchived": counts["archived"],
+        "nbEmailsReplyLater": counts["reply_later"],
     }
 
 
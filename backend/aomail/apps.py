@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AomailConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "aomail"
+
+    def ready(self):
+        from aomail import signals  # noqa: F401
@@ -98,14 +98,7 @@ def subscribe_listeners(type_api: str, user: User, email: str) -> bool:
             return True
 
     elif type_api == MICROSOFT:
-        subscribed_email = webhook_microsoft.subscribe_to_email_notifications(
-            user, email
-        )
-        subscribed_contact = webhook_microsoft.subscribe_to_contact_notifications(
-            user, email
-        )
-        if subscribed_email and subscribed_contact:
-            return True
+        return webhook_microsoft.subscribe_to_all_notifications(user, email)
 
     return False
 
@@ -574,7 +567,9 @@ def link_oauth_account(
         social_api = SocialAPI.objects.get(user=user, email=email)
         social_api.refresh_token = refresh_token_encrypted
         social_api.access_token = access_token
-        social_api.save()
+        social_api.save(
+            update_fields=["refresh_token", "access_token", "last_fetched_date"]
+        )
         LOGGER.info(f"Social API for user ID: {user.id} tokens updated successfully")
     except SocialAPI.DoesNotExist:
         social_api = SocialAPI.objects.create(
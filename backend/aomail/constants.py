@@ -22,6 +22,17 @@ PASSWORD_MAX_LENGTH = 128
 # ----------------------- PICTURES ------------------------#
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BACKEND_DIR, "media")
+DEFAULT_AGENT_ICON_PATH = os.path.join(CURRENT_DIR, "assets", "default-agent-icon.png")
+IMAGE_CONTENT_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+ICON_CACHE_MAX_SIZE = 64 * 1024  # icons bigger than 64 KiB are streamed from disk
+ICON_CACHE_MAX_AGE = 3600  # time in seconds
+ICON_CACHE_MAX_ENTRIES = 256
 
 # ----------------------- URLS AND CORS -----------------------#
 DOMAIN = os.getenv("DOMAIN")
@@ -60,6 +71,9 @@ PREMIUM_PLAN = "premium"
 ENTREPRISE_PLAN = "entreprise"
 ALLOWED_PLANS = [START_PLAN, PREMIUM_PLAN, ENTREPRISE_PLAN]
 ALLOW_ALL = ALLOWED_PLANS + [INACTIVE]
+SUBSCRIPTION_BLOCK_CACHE_TTL = 60  # time in seconds
+SUBSCRIPTION_CACHE_TTL = 60  # time in seconds
+PREFERENCE_CACHE_TTL = 60  # time in seconds
 
 ######################## ARTIFICIAL INTELLIGENCE ########################
 IMPORTANT = "important"
@@ -110,6 +124,9 @@ GOOGLE_WEB_CONFIG = {
         "client_secret": GOOGLE_CLIENT_SECRET,
     }
 }
+GOOGLE_SERVICES_CACHE_TTL = 300  # time in seconds when the token expiry is unknown
+GOOGLE_SERVICES_CACHE_MARGIN = 60  # time in seconds kept before the token expiry
+GOOGLE_WEBHOOK_MAX_WORKERS = 8
 GOOGLE = "google"
 
 ######################## MICROSOFT API ########################
@@ -128,7 +145,26 @@ MICROSOFT_SCOPES = [
     MICROSOFT_MAILBOX_SETTINGS_SCOPE,
 ]
 MICROSOFT_AUTHORITY = "https://login.microsoftonline.com/common"
+MICROSOFT_WEBHOOK_MAX_WORKERS = 8
+MICROSOFT_CONTACT_NOTIFICATION_WINDOW = 2  # time in seconds
+MICROSOFT_EMAIL_NOTIFICATION_WINDOW = 1  # time in seconds
+MICROSOFT_LIFECYCLE_DEDUPE_WINDOW = 10  # time in seconds
+MICROSOFT_RESUBSCRIBE_LOCK_TTL = 60  # time in seconds
 GRAPH_URL = "https://graph.microsoft.com/v1.0/"
+MICROSOFT_TOKEN_CACHE_TTL = 300
+MICROSOFT_TOKEN_CACHE_MARGIN = 60
+GRAPH_CACHE_MAX_SIZE = 4096
+GRAPH_CACHE_TTL = 300
+GRAPH_PAGE_SIZE = 1000  # maximum $top accepted by Graph message listings
+GRAPH_BATCH_MAX_REQUESTS = 20
+GRAPH_TIMEOUT = (3.05, 15)  # (connect, read) in seconds
+GRAPH_PAGING_TIMEOUT = (3.05, 60)
+ATTACHMENT_CHUNK_SIZE = 64 * 1024
+CONTACTS_BULK_BATCH_SIZE = 500
+MICROSOFT_EMAIL_CACHE_TTL = 3600
+MICROSOFT_LICENSE_CACHE_TTL = 24 * 3600
+PROFILE_IMAGE_CACHE_TTL = 24 * 3600
+PROFILE_IMAGE_CHUNK_SIZE = 48 * 1024  # multiple of 3 to keep base64 groups aligned
 MICROSOFT_CLIENT_ID = os.getenv("MICROSOFT_CLIENT_ID")
 MICROSOFT_CLIENT_SECRET = os.getenv("MICROSOFT_CLIENT_SECRET")
 MICROSOFT_TENANT_ID = os.getenv("MICROSOFT_TENANT_ID")
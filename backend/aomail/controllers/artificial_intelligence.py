@@ -25,7 +25,7 @@ from django.template.loader import render_to_string
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from aomail.utils.security import block_user, subscription
+from aomail.utils.security import block_user, get_cached_preference, subscription
 from aomail.constants import (
     EMAIL_ADMIN,
     ALLOWED_PLANS,
@@ -47,7 +47,6 @@ from aomail.email_providers.google import (
 from aomail.utils.tree_knowledge import Search
 from aomail.models import (
     SocialAPI,
-    Preference,
     Contact,
     Email,
     Agent,
@@ -171,7 +170,7 @@ def get_new_email_response(request: HttpRequest) -> Response:
 
     if is_only_signature or is_nearly_empty:
         try:
-            preference = Preference.objects.get(user=user)
+            preference = get_cached_preference(user.id)
             base_prompt = (
                 preference.generate_email_response_prompt
                 if preference.generate_email_response_prompt
@@ -296,7 +295,7 @@ def improve_draft(request: HttpRequest) -> Response:
     gen_email_conv = GenerateEmailConversation(
         user, length, formality, subject, body, chat_history
     )
-    language = Preference.objects.get(user=user).language
+    language = get_cached_preference(user.id).language
 
     for i in range(MAX_RETRIES):
         try:
@@ -358,10 +357,9 @@ def search_emails_ai(request: HttpRequest) -> Response:
     user = request.user
     emails = data["emails"]
     query = data["query"]
-    language = Preference.objects.get(user=user).language
-    preference = Preference.objects.get(user=user)
+    preference = get_cached_preference(user.id)
     result: dict = llm_functions.search_emails(
-        query, language, preference.llm_provider, preference.llm_model
+        query, preference.language, preference.llm_provider, preference.llm_model
     )
     search_params = result["search_params"]
     update_tokens_stats(user, result)
@@ -485,7 +483,7 @@ def search_tree_knowledge(request: HttpRequest) -> Response:
                 status=status.HTTP_200_OK,
             )
 
-        language = Preference.objects.get(user=user).language
+        language = get_cached_preference(user.id).language
         answer = search.get_answer(keypoints, language)
         emails_ids = []
 
@@ -540,7 +538,7 @@ def find_user_view_ai(request: HttpRequest) -> Response:
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    preference = Preference.objects.get(user=request.user)
+    preference = get_cached_preference(request.user.id)
     recipients_dict = llm_functions.extract_contacts_recipients(
         search_query, preference.llm_provider, preference.llm_model
     )
@@ -622,7 +620,7 @@ def new_email_ai(request: HttpRequest) -> Response:
         input_data = serializer.validated_data["inputData"]
         length = serializer.validated_data["length"]
         formality = serializer.validated_data["formality"]
-        preference = Preference.objects.get(user=user)
+        preference = get_cached_preference(user.id)
         language = preference.language
         signature = ""
 
@@ -690,7 +688,7 @@ def correct_email_language(request: HttpRequest) -> Response:
         subject = serializer.validated_data["subject"]
         body = serializer.validated_data["body"]
 
-        preference = Preference.objects.get(user=request.user)
+        preference = get_cached_preference(request.user.id)
         result = llm_functions.correct_mail_language_mistakes(
             body, subject, preference.llm_provider, preference.llm_model
         )
@@ -728,7 +726,7 @@ def check_email_copywriting(request: HttpRequest) -> Response:
         subject = serializer.validated_data["subject"]
         body = serializer.validated_data["body"]
 
-        preference = Preference.objects.get(user=request.user)
+        preference = get_cached_preference(request.user.id)
         result = llm_functions.improve_email_copywriting(
             body, subject, preference.llm_provider, preference.llm_model
         )
@@ -767,7 +765,7 @@ def generate_email_response_keywords(request: HttpRequest) -> Response:
         subject = serializer.validated_data["subject"]
         body = serializer.validated_data["body"]
 
-        preference = Preference.objects.get(user=request.user)
+        preference = get_cached_preference(request.user.id)
         result = llm_functions.generate_response_keywords(
             (
                 preference.generate_response_keywords_prompt
@@ -834,7 +832,7 @@ def generate_email_answer(request: HttpRequest) -> Response:
             "language": agent.language,
         }
 
-        preference = Preference.objects.get(user=request.user)
+        preference = get_cached_preference(request.user.id)
         base_prompt = (
             preference.generate_email_response_prompt
             if preference.generate_email_response_prompt
@@ -915,7 +913,7 @@ def handle_email_action(request: HttpRequest) -> Response:
 
         chat_history = dict_to_chat_history(history)
 
-        preference = Preference.objects.get(user=user)
+        preference = get_cached_preference(user.id)
         language = preference.language
 
         try:
@@ -9,14 +9,13 @@ Endpoints:
 
 import json
 from rest_framework.decorators import api_view
-from aomail.utils.security import block_user, subscription
+from aomail.utils.security import block_user, get_cached_preference, subscription
 from django.http import HttpRequest
 from aomail.constants import ALLOWED_PLANS
 from aomail.ai_providers import llm_functions
 from aomail.ai_providers.utils import update_tokens_stats
 from rest_framework import status
 from rest_framework.response import Response
-from aomail.models import Preference
 
 
 @api_view(["POST"])
@@ -36,7 +35,7 @@ def review_user_description(request: HttpRequest) -> dict:
     """
     parameters: dict = json.loads(request.body)
     user_description: str = parameters["description"]
-    preference = Preference.objects.get(user=request.user)
+    preference = get_cached_preference(request.user.id)
     result = llm_functions.review_user_description(
         user_description, preference.llm_provider, preference.llm_model
     )
@@ -64,7 +63,7 @@ def generate_categories_scratch(request: HttpRequest) -> dict:
     parameters: dict = json.loads(request.body)
     user_topics: str = parameters["userTopics"]
     chat_history: str = parameters.get("chatHistory")
-    preference = Preference.objects.get(user=request.user)
+    preference = get_cached_preference(request.user.id)
     result = llm_functions.generate_categories_scratch(
         user_topics,
         chat_history,
@@ -95,7 +94,7 @@ def generate_prioritization_scratch(request: HttpRequest) -> dict:
     """
     parameters: dict = json.loads(request.body)
     user_input: str = parameters["userInput"]
-    preference = Preference.objects.get(user=request.user)
+    preference = get_cached_preference(request.user.id)
     result = llm_functions.generate_prioritization_scratch(
         user_input, preference.llm_provider, preference.llm_model
     )
@@ -16,7 +16,8 @@ import json
 import logging
 import os
 from datetime import timedelta
-from django.http import HttpRequest, HttpResponse
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import status
@@ -52,6 +53,15 @@ from aomail.email_providers.imap import (
 ######################## LOGGING CONFIGURATION ########################
 LOGGER = logging.getLogger(__name__)
 READ_EMAILS_MARKER = "read"
+EMAIL_DELETE_BATCH_SIZE = 5000
+EMAIL_ACTION_UPDATE_FIELDS = {
+    "read": ["read", "read_date"],
+    "unread": ["read", "read_date"],
+    "replyLater": ["answer_later"],
+    "unreplyLater": ["answer_later"],
+    "archive": ["archive", "read", "read_date"],
+    "unarchive": ["archive"],
+}
 
 
 @api_view(["GET"])
@@ -67,9 +77,9 @@ def get_first_email(request: HttpRequest) -> Response:
         Response: {"email": "<email_address>"} if an email is found.
     """
     user = request.user
-    social_api = SocialAPI.objects.filter(user=user).first()
+    email = SocialAPI.objects.filter(user=user).values_list("email", flat=True).first()
 
-    return Response({"email": social_api.email}, status=status.HTTP_200_OK)
+    return Response({"email": email}, status=status.HTTP_200_OK)
 
 
 @api_view(["GET"])
@@ -242,7 +252,19 @@ def get_simple_email_data(request: HttpRequest) -> Response:
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        queryset = Email.objects.filter(id__in=email_ids, user=user)
+        queryset = (
+            Email.objects.filter(id__in=email_ids, user=user)
+            .select_related(None)
+            .defer(
+                "user",
+                "social_api",
+                "email_provider",
+                "read_date",
+                "sender",
+                "category",
+            )
+            .prefetch_related("attachments", "cc_senders", "bcc_senders")
+        )
 
         emails_data = []
         for email in queryset:
@@ -251,8 +273,8 @@ def get_simple_email_data(request: HttpRequest) -> Response:
                     "id": email.id,
                     "subject": email.subject,
                     "sender": {
-                        "email": email.sender.email,
-                        "name": email.sender.name,
+                        "email": email.sender_email,
+                        "name": email.sender_name,
                     },
                     "providerId": email.provider_id,
                     "shortSummary": decrypt_text(
@@ -333,9 +355,7 @@ def delete_emails(request: HttpRequest) -> Response:
             )
 
         if priority == READ_EMAILS_MARKER:
-            emails = Email.objects.filter(user=user, read=True)
-            for email in emails:
-                email.delete()
+            delete_emails_in_batches(Email.objects.filter(user=user, read=True))
 
             return Response(
                 {"message": "Read emails deleted successfully"},
@@ -343,18 +363,7 @@ def delete_emails(request: HttpRequest) -> Response:
             )
 
         if clean:
-            emails = Email.objects.filter(user=user, priority=priority)
-            for email in emails:
-                email.delete()
-
-        else:
-            email_ids: list[int] = parameters.get("emailIds", [])
-            for email_id in email_ids:
-                try:
-                    email = Email.objects.get(user=user, id=email_id)
-                    email.delete()
-                except Email.DoesNotExist:
-                    pass
+            delete_emails_in_batches(Email.objects.filter(user=user, priority=priority))
     else:
         for email_id in email_ids:
             try:
@@ -406,6 +415,19 @@ def delete_emails(request: HttpRequest) -> Response:
     )
 
 
+def delete_emails_in_batches(emails: QuerySet[Email]):
+    """
+    Deletes the given emails and their related rows, EMAIL_DELETE_BATCH_SIZE emails at a time.
+
+    Args:
+        emails (QuerySet[Email]): The emails to delete.
+    """
+    email_ids = list(emails.values_list("id", flat=True))
+    for start in range(0, len(email_ids), EMAIL_DELETE_BATCH_SIZE):
+        batch_ids = email_ids[start : start + EMAIL_DELETE_BATCH_SIZE]
+        Email.objects.filter(id__in=batch_ids).delete()
+
+
 @api_view(["PUT"])
 @subscription(ALLOW_ALL)
 def update_emails(request: HttpRequest) -> Response:
@@ -434,7 +456,19 @@ def update_emails(request: HttpRequest) -> Response:
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        emails = Email.objects.filter(user=user, id__in=email_ids)
+        emails = (
+            Email.objects.filter(user=user, id__in=email_ids)
+            .select_related(None)
+            .select_related("social_api")
+            .only(
+                "provider_id",
+                "read",
+                "read_date",
+                "answer_later",
+                "archive",
+                "social_api",
+            )
+        )
 
         if not emails.exists():
             return Response(
@@ -506,7 +540,8 @@ def update_emails(request: HttpRequest) -> Response:
             elif action == "unarchive":
                 email.archive = False
 
-            email.save()
+            if action in EMAIL_ACTION_UPDATE_FIELDS:
+                email.save(update_fields=EMAIL_ACTION_UPDATE_FIELDS[action])
 
         return Response(
             {"message": "Emails updated successfully"}, status=status.HTTP_200_OK
@@ -546,13 +581,20 @@ def retrieve_attachment_data(
         )
     elif social_api.type_api == MICROSOFT and not social_api.imap_config:
         attachment_data = email_operations_microsoft.get_attachment_data(
-            social_api, email.provider_id, attachment_name
+            social_api, email.provider_id, attachment_name, stream=True
         )
 
     if attachment_data:
-        response = HttpResponse(
-            attachment_data["data"], content_type="application/octet-stream"
-        )
+        if isinstance(attachment_data["data"], bytes):
+            response = HttpResponse(
+                attachment_data["data"], content_type="application/octet-stream"
+            )
+        else:
+            response = StreamingHttpResponse(
+                attachment_data["data"], content_type="application/octet-stream"
+            )
+            if attachment_data["contentLength"]:
+                response["Content-Length"] = attachment_data["contentLength"]
         response["Content-Disposition"] = f'attachment; filename="{attachment_name}"'
         return response
     else:
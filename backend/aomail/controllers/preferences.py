@@ -19,13 +19,13 @@ Endpoints:
 import json
 import logging
 from django.contrib.auth.models import User
-from django.http import HttpRequest
+from django.http import Http404, HttpRequest
 from datetime import timedelta
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from aomail.utils.security import subscription
+from aomail.utils.security import get_cached_preference, subscription
 from aomail.constants import ALLOW_ALL
 from aomail.models import Preference, Subscription
 from aomail.ai_providers.prompts import (
@@ -45,6 +45,16 @@ from aomail.ai_providers.prompts import (
 
 
 LOGGER = logging.getLogger(__name__)
+LLM_SETTINGS_FIELDS = [
+    "llm_provider",
+    "llm_model",
+    "improve_email_draft_prompt",
+    "improve_email_response_prompt",
+    "categorize_and_summarize_email_prompt",
+    "generate_email_response_prompt",
+    "generate_email_prompt",
+    "generate_response_keywords_prompt",
+]
 LANGUAGES = ["french", "american", "german", "russian", "spanish", "chinese", "indian"]
 THEMES = ["dark", "light"]
 
@@ -144,7 +154,7 @@ def get_user_language(request: HttpRequest) -> Response:
     user = request.user
 
     try:
-        language = Preference.objects.get(user=user).language
+        language = get_cached_preference(user.id).language
         return Response({"language": language}, status=status.HTTP_200_OK)
     except Exception as e:
         LOGGER.error(
@@ -185,7 +195,7 @@ def set_user_language(request: HttpRequest) -> Response:
     try:
         preferences = Preference.objects.get(user=user)
         preferences.language = language
-        preferences.save()
+        preferences.save(update_fields=["language"])
         return Response(
             {"message": "Language updated successfully"}, status=status.HTTP_200_OK
         )
@@ -212,7 +222,7 @@ def get_user_theme(request: HttpRequest) -> Response:
     """
     user = request.user
     try:
-        theme = Preference.objects.get(user=user).theme
+        theme = get_cached_preference(user.id).theme
         return Response({"theme": theme}, status=status.HTTP_200_OK)
     except Exception as e:
         LOGGER.error(f"Failed to retrieve user theme: {str(e)}")
@@ -252,7 +262,7 @@ def set_user_theme(request: HttpRequest) -> Response:
     try:
         preference = Preference.objects.get(user=user)
         preference.theme = theme
-        preference.save()
+        preference.save(update_fields=["theme"])
         return Response(
             {"message": "Theme updated successfully"}, status=status.HTTP_200_OK
         )
@@ -279,7 +289,7 @@ def get_user_timezone(request: HttpRequest) -> Response:
     """
     user = request.user
     try:
-        timezone = Preference.objects.get(user=user).timezone
+        timezone = get_cached_preference(user.id).timezone
         return Response({"timezone": timezone}, status=status.HTTP_200_OK)
     except Exception as e:
         LOGGER.error(f"Failed to retrieve user timezone: {str(e)}")
@@ -314,7 +324,7 @@ def set_user_timezone(request: HttpRequest) -> Response:
     try:
         preference = Preference.objects.get(user=user)
         preference.timezone = timezone
-        preference.save()
+        preference.save(update_fields=["timezone"])
         return Response(
             {"message": "Timezone updated successfully"}, status=status.HTTP_200_OK
         )
@@ -386,7 +396,13 @@ def prioritization(request: HttpRequest) -> Response:
         preference.informative_guidelines = informative_guidelines
     if useless_guidelines:
         preference.useless_guidelines = useless_guidelines
-    preference.save()
+    preference.save(
+        update_fields=[
+            "important_guidelines",
+            "informative_guidelines",
+            "useless_guidelines",
+        ]
+    )
 
     return Response(
         {"message": "Guidelines updated successfully"}, status=status.HTTP_200_OK
@@ -406,7 +422,7 @@ def get_user_guidelines(request: HttpRequest) -> Response:
         Response: JSON response containing the user's current guidelines for email prioritization.
     """
     try:
-        preference = Preference.objects.get(user=request.user)
+        preference = get_cached_preference(request.user.id)
         return Response(
             {
                 "importantGuidelines": preference.important_guidelines,
@@ -441,7 +457,10 @@ def get_user_llm_settings(request: HttpRequest) -> Response:
     """
     Retrieve the LLM settings for the authenticated user.
     """
-    preference = get_object_or_404(Preference, user=request.user)
+    try:
+        preference = get_cached_preference(request.user.id)
+    except Preference.DoesNotExist:
+        raise Http404
 
     return Response(
         {
@@ -568,7 +587,7 @@ def update_user_llm_settings(request: HttpRequest) -> Response:
     ):
         preference.generate_response_keywords_prompt = generate_response_keywords_prompt
 
-    preference.save()
+    preference.save(update_fields=LLM_SETTINGS_FIELDS)
 
     return Response(
         {"message": "LLM settings updated successfully"}, status=status.HTTP_200_OK
@@ -591,7 +610,7 @@ def reset_user_llm_settings(request: HttpRequest) -> Response:
         preference.generate_response_keywords_prompt = None
         preference.llm_model = None
         preference.llm_provider = "google"
-        preference.save()
+        preference.save(update_fields=LLM_SETTINGS_FIELDS)
 
         return Response(
             {"message": "LLM settings and prompts reset to default"},
@@ -612,7 +631,7 @@ def reset_user_llm_settings(request: HttpRequest) -> Response:
         if parameters.get("generateResponseKeywordsPrompt"):
             preference.generate_response_keywords_prompt = None
 
-        preference.save()
+        preference.save(update_fields=LLM_SETTINGS_FIELDS)
 
         return Response(
             {"message": "Prompt reset to default"}, status=status.HTTP_200_OK
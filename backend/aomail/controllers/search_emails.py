@@ -63,15 +63,21 @@ def get_emails_data(request: HttpRequest) -> Response:
             )
 
         formatted_data = defaultdict(lambda: defaultdict(list))
-        queryset = Email.objects.filter(id__in=email_ids, user=user)
+        queryset = (
+            Email.objects.filter(id__in=email_ids, user=user)
+            .select_related(None)
+            .select_related("category")
+            .defer("user", "social_api", "email_provider", "read_date", "sender")
+            .prefetch_related("attachments", "cc_senders", "bcc_senders")
+        )
 
         for email in queryset:
             email_data = {
                 "id": email.id,
                 "subject": email.subject,
                 "sender": {
-                    "email": email.sender.email,
-                    "name": email.sender.name,
+                    "email": email.sender_email,
+                    "name": email.sender_name,
                 },
                 "providerId": email.provider_id,
                 "shortSummary": decrypt_text(
@@ -157,8 +163,10 @@ def get_email_content(request: HttpRequest) -> Response:
         )
 
     try:
-        email = Email.objects.get(user=request.user, id=email_id)
-        decrypted_content = decrypt_text(EMAIL_HTML_CONTENT_KEY, email.html_content)
+        email = Email.objects.select_related("body").get(user=request.user, id=email_id)
+        decrypted_content = decrypt_text(
+            EMAIL_HTML_CONTENT_KEY, email.body.html_content
+        )
         return Response({"content": decrypted_content}, status=status.HTTP_200_OK)
     except Email.DoesNotExist:
         return Response(
@@ -251,9 +259,9 @@ def construct_filters(user: User, parameters: dict) -> tuple[dict, Q]:
         if "subject" in parameters:
             and_filters["subject__icontains"] = parameters["subject"]
         if "senderEmail" in parameters:
-            and_filters["sender__email__icontains"] = parameters["senderEmail"]
+            and_filters["sender_email__icontains"] = parameters["senderEmail"]
         if "senderName" in parameters:
-            and_filters["sender__name__icontains"] = parameters["senderName"]
+            and_filters["sender_name__icontains"] = parameters["senderName"]
         if "sentDate" in parameters:
             and_filters["date__gte"] = parameters["sentDate"]
         if "readDate" in parameters:
@@ -273,10 +281,11 @@ def construct_filters(user: User, parameters: dict) -> tuple[dict, Q]:
             and_filters["cc_senders__name__in"] = parameters["CCNames"]
         if "search" in parameters:
             search = parameters.get("search", "")
+            # the cc_senders terms join CC_sender, so this OR cannot use the trigram indexes alone
             or_filters_search |= (
                 Q(subject__icontains=search)
-                | Q(sender__email__icontains=search)
-                | Q(sender__name__icontains=search)
+                | Q(sender_email__icontains=search)
+                | Q(sender_name__icontains=search)
                 | Q(cc_senders__email__icontains=search)
                 | Q(cc_senders__name__icontains=search)
             )
@@ -286,10 +295,11 @@ def construct_filters(user: User, parameters: dict) -> tuple[dict, Q]:
             category_obj = Category.objects.get(name=parameters["category"], user=user)
             and_filters["category"] = category_obj
         search = parameters.get("search", "")
+        # the cc_senders terms join CC_sender, so this OR cannot use the trigram indexes alone
         or_filters |= (
             Q(subject__icontains=search)
-            | Q(sender__email__icontains=search)
-            | Q(sender__name__icontains=search)
+            | Q(sender_email__icontains=search)
+            | Q(sender_name__icontains=search)
             | Q(cc_senders__email__icontains=search)
             | Q(cc_senders__name__icontains=search)
         )
@@ -11,13 +11,22 @@ Endpoints:
 - ✅ update_user_description: Updates the user description of the given email.
 """
 
-import importlib
-import json
+import hashlib
 import logging
+import orjson
 import os
 import threading
+from cachetools import LRUCache
+from functools import lru_cache
 from django.core.exceptions import ObjectDoesNotExist
-from django.http import HttpRequest, FileResponse, Http404
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotModified,
+    FileResponse,
+    Http404,
+)
+from django.utils.http import parse_etags
 from aomail.email_providers.google import authentication as auth_google
 from aomail.email_providers.microsoft import authentication as auth_microsoft
 from aomail.email_providers.microsoft import (
@@ -29,6 +38,17 @@ from aomail.email_providers.google import (
 from aomail.email_providers.imap import (
     email_operations as email_operations_imap,
 )
+from aomail.email_providers.google import (
+    compose_email as compose_email_google,
+    profile as profile_google,
+    troubleshooting as troubleshooting_google,
+)
+from aomail.email_providers.microsoft import (
+    compose_email as compose_email_microsoft,
+    profile as profile_microsoft,
+    troubleshooting as troubleshooting_microsoft,
+)
+from aomail.email_providers.smtp import compose_email as compose_email_smtp
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
@@ -37,62 +57,104 @@ from aomail.utils.security import subscription
 from aomail.constants import (
     ALLOW_ALL,
     ALLOWED_PLANS,
+    DEFAULT_AGENT_ICON_PATH,
     GOOGLE,
+    ICON_CACHE_MAX_AGE,
+    ICON_CACHE_MAX_ENTRIES,
+    ICON_CACHE_MAX_SIZE,
+    IMAGE_CONTENT_TYPES,
     MEDIA_ROOT,
     MICROSOFT,
 )
 from aomail.models import (
     SocialAPI,
-    Sender,
     Contact,
 )
-from aomail.utils.serializers import (
-    SenderSerializer,
-    ContactSerializer,
-)
+from aomail.utils.serializers import SenderSerializer
 
 
 ######################## LOGGING CONFIGURATION ########################
 LOGGER = logging.getLogger(__name__)
 
 
+######################## ICON CACHE ########################
+# image path -> (mtime, raw bytes, ETag)
+ICON_CACHE = LRUCache(maxsize=ICON_CACHE_MAX_ENTRIES)
+ICON_CACHE_LOCK = threading.Lock()
+with open(DEFAULT_AGENT_ICON_PATH, "rb") as default_agent_icon:
+    DEFAULT_AGENT_ICON_BYTES = default_agent_icon.read()
+DEFAULT_AGENT_ICON_ETAG = (
+    f'"{hashlib.blake2b(DEFAULT_AGENT_ICON_BYTES, digest_size=8).hexdigest()}"'
+)
+
+
+######################## API FORWARDING TABLE ########################
+# (type_api, api_module) -> {api_method: api_function}
+API_FUNCTIONS = {
+    (GOOGLE, "profile"): {
+        "get_profile_image": profile_google.get_profile_image,
+    },
+    (GOOGLE, "compose_email"): {
+        "send_email": compose_email_google.send_email,
+    },
+    (GOOGLE, "troubleshooting"): {
+        "check_connectivity": troubleshooting_google.check_connectivity,
+        "synchronize": troubleshooting_google.synchronize,
+    },
+    (MICROSOFT, "profile"): {
+        "get_profile_image": profile_microsoft.get_profile_image,
+    },
+    (MICROSOFT, "compose_email"): {
+        "send_email": compose_email_microsoft.send_email,
+        "send_schedule_email": compose_email_microsoft.send_schedule_email,
+    },
+    (MICROSOFT, "troubleshooting"): {
+        "check_connectivity": troubleshooting_microsoft.check_connectivity,
+        "synchronize": troubleshooting_microsoft.synchronize,
+    },
+    ("smtp", "compose_email"): {
+        "send_email": compose_email_smtp.send_email,
+    },
+}
+
+
 ######################## ENDPOINTS HANDLING GMAIL & OUTLOOK ########################
 @api_view(["GET"])
 @subscription(ALLOW_ALL)
 def get_profile_image(request: Request):
-    return forward_request(request._request, "profile", "get_profile_image")
+    return forward_request(request, "profile", "get_profile_image")
 
 
 @api_view(["POST"])
 @subscription(ALLOW_ALL)
 def send_email(request: Request):
-    return forward_request(request._request, "compose_email", "send_email")
+    return forward_request(request, "compose_email", "send_email")
 
 
 @api_view(["POST"])
 @subscription(ALLOW_ALL)
 def send_schedule_email(request: Request):
-    return forward_request(request._request, "compose_email", "send_schedule_email")
+    return forward_request(request, "compose_email", "send_schedule_email")
 
 
 @api_view(["POST"])
 @subscription(ALLOWED_PLANS)
 def check_connectivity(request: Request):
-    return forward_request(request._request, "troubleshooting", "check_connectivity")
+    return forward_request(request, "troubleshooting", "check_connectivity")
 
 
 @api_view(["POST"])
 @subscription(ALLOWED_PLANS)
 def synchronize(request: Request):
-    return forward_request(request._request, "troubleshooting", "synchronize")
+    return forward_request(request, "troubleshooting", "synchronize")
 
 
-def forward_request(request: HttpRequest, api_module: str, api_method: str) -> Response:
+def forward_request(request: Request, api_module: str, api_method: str) -> Response:
     """
     Forwards the request to the appropriate API method based on type_api.
 
     Args:
-        request (HttpRequest): The HTTP request object containing the following parameters in the body or headers:
+        request (Request): The DRF request object containing the following parameters in the body or headers:
             email (str, optional): User's email address.
         api_module (str): The module containing the API methods.
         api_method (str): The specific API method to be called.
@@ -104,26 +166,8 @@ def forward_request(request: HttpRequest, api_module: str, api_method: str) -> R
     """
     user = request.user
     if request.method == "POST":
-        content_type = request.content_type
-
-        if content_type.startswith("application/json"):
-            try:
-                parameters = json.loads(request.body)
-                email = parameters.get("email") or request.headers.get("email")
-            except json.JSONDecodeError:
-                return Response(
-                    {"error": "Invalid JSON in request body"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-        elif content_type.startswith("multipart/form-data"):
-            email = request.POST.get("email") or request.headers.get("email")
-            parameters = request.POST.dict()
-            parameters.update({"attachments": request.FILES.getlist("attachments")})
-        else:
-            return Response(
-                {"error": "Unsupported Content-Type"},
-                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-            )
+        # parsed once by the DRF parsers and reused by the API method
+        email = request.data.get("email") or request.headers.get("email")
     elif request.method == "GET":
         email = request.headers.get("email")
     else:
@@ -151,33 +195,119 @@ def forward_request(request: HttpRequest, api_module: str, api_method: str) -> R
 
     type_api = (
         social_api.type_api
-        if not (api_method == "send_email" and social_api.imap_config)
+        if not (api_method == "send_email" and social_api.imap_config_id)
         else "smtp"
     )
-    if social_api.imap_config and api_method != "send_email":
+    if social_api.imap_config_id and api_method != "send_email":
         return Response(
             {"error": "Unsupported method for IMAP"},
             status=status.HTTP_400_BAD_REQUEST,
         )
-    module_name = f"aomail.email_providers.{type_api}.{api_module}"
-    try:
-        module = importlib.import_module(module_name)
-        if hasattr(module, api_method):
-            api_function = getattr(module, api_method)
-            return api_function(request)
-        else:
-            return Response(
-                {"error": f"Unsupported API method: {api_method}"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-    except ImportError:
+    api_functions = API_FUNCTIONS.get((type_api, api_module))
+    if api_functions is None:
         return Response(
             {"error": f"Unsupported API: {type_api}"},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    api_function = api_functions.get(api_method)
+    if api_function is None:
+        return Response(
+            {"error": f"Unsupported API method: {api_method}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    return api_function(request)
+
 
 ######################## PICTURES ########################
+@lru_cache(maxsize=512)
+def resolve_image(image_name: str, subdir: str) -> tuple[str, str | None]:
+    """
+    Resolves the absolute path and content type of an image stored in the media directory.
+
+    Args:
+        image_name (str): The name of the image file.
+        subdir (str): The media subdirectory where the image is stored.
+
+    Returns:
+        tuple[str, str | None]: The absolute image path and its content type,
+                                or None as content type if the format is unsupported.
+    """
+    image_path = os.path.join(MEDIA_ROOT, subdir, image_name)
+    content_type = IMAGE_CONTENT_TYPES.get(image_name[image_name.rfind(".") :].lower())
+    return image_path, content_type
+
+
+def serve_cached_icon(
+    request: HttpRequest, image_path: str, content_type: str
+) -> HttpResponse:
+    """
+    Serve a small icon from an in-process bytes cache with HTTP caching headers.
+
+    The cache entry is refreshed whenever the file modification time changes.
+    Files bigger than ICON_CACHE_MAX_SIZE are streamed from disk.
+
+    Args:
+        request (HttpRequest): The HTTP request object that represents the client request.
+        image_path (str): The absolute path of the icon.
+        content_type (str): The content type of the icon.
+
+    Returns:
+        HttpResponse: The icon bytes, or a 304 response if the client copy is still valid.
+
+    Raises:
+        OSError: If the icon cannot be read from disk.
+    """
+    stat_result = os.stat(image_path)
+    if stat_result.st_size > ICON_CACHE_MAX_SIZE:
+        return FileResponse(open(image_path, "rb"), content_type=content_type)
+
+    with ICON_CACHE_LOCK:
+        cached = ICON_CACHE.get(image_path)
+    if cached is None or cached[0] != stat_result.st_mtime:
+        with open(image_path, "rb") as image_file:
+            image_bytes = image_file.read()
+        etag = f'"{hashlib.blake2b(image_bytes, digest_size=8).hexdigest()}"'
+        cached = (stat_result.st_mtime, image_bytes, etag)
+        with ICON_CACHE_LOCK:
+            ICON_CACHE[image_path] = cached
+
+    _, image_bytes, etag = cached
+    return build_icon_response(request, image_bytes, etag, content_type)
+
+
+def serve_default_agent_icon(request: HttpRequest) -> HttpResponse:
+    """Serve the default agent icon preloaded in memory at import time."""
+    return build_icon_response(
+        request, DEFAULT_AGENT_ICON_BYTES, DEFAULT_AGENT_ICON_ETAG, "image/png"
+    )
+
+
+def build_icon_response(
+    request: HttpRequest, image_bytes: bytes, etag: str, content_type: str
+) -> HttpResponse:
+    """
+    Build an icon response with HTTP caching headers.
+
+    Args:
+        request (HttpRequest): The HTTP request object that represents the client request.
+        image_bytes (bytes): The raw bytes of the icon.
+        etag (str): The quoted ETag of the icon.
+        content_type (str): The content type of the icon.
+
+    Returns:
+        HttpResponse: The icon bytes, or a 304 response if the client copy is still valid.
+    """
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(image_bytes, content_type=content_type)
+    response["ETag"] = etag
+    response["Cache-Control"] = f"public, max-age={ICON_CACHE_MAX_AGE}"
+    return response
+
+
 def serve_image(request: HttpRequest, image_name: str) -> Response:
     """
     Serve an image file from the server's media directory.
@@ -192,19 +322,13 @@ def serve_image(request: HttpRequest, image_name: str) -> Response:
     Raises:
         Http404: If the image is not found or the image format is unsupported.
     """
-    image_path = os.path.join(MEDIA_ROOT, "pictures", image_name)
-    if os.path.exists(image_path):
-        _, ext = os.path.splitext(image_path)
-        content_type = (
-            "image/jpeg"
-            if ext.lower() == ".jpg"
-            else "image/png" if ext.lower() == ".png" else None
-        )
-        if content_type:
-            return FileResponse(open(image_path, "rb"), content_type=content_type)
-        else:
-            raise Http404("Unsupported image format")
-    else:
+    image_path, content_type = resolve_image(image_name, "pictures")
+    if not content_type:
+        raise Http404("Unsupported image format")
+
+    try:
+        return FileResponse(open(image_path, "rb"), content_type=content_type)
+    except OSError:
         raise Http404("Image not found")
 
 
@@ -217,35 +341,20 @@ def serve_agent_icon(request: HttpRequest, image_name: str) -> Response:
         image_name (str): The name of the image file to be served.
 
     Returns:
-        FileResponse: A file response containing the image if found and valid.
-
-    Raises:
-        Http404: If the image is not found or the image format is unsupported.
+        HttpResponse: The image if found and valid, the default agent icon otherwise.
     """
-    image_path = os.path.join(MEDIA_ROOT, "agent_icon", image_name)
-    if os.path.exists(image_path):
-        _, ext = os.path.splitext(image_path)
-        content_type = (
-            "image/jpeg"
-            if ext.lower() == ".jpg"
-            else "image/png" if ext.lower() == ".png" else None
+    image_path, content_type = resolve_image(image_name, "agent_icon")
+    if not content_type:
+        LOGGER.error(
+            f"Unsupported image format: {image_path} Returning default agent icon"
         )
-        if content_type:
-            return FileResponse(open(image_path, "rb"), content_type=content_type)
-        else:
-            LOGGER.error(
-                f"Unsupported image format: {image_path} Returning default agent icon"
-            )
-            return FileResponse(
-                open(os.getcwd() + "/aomail/assets/default-agent-icon.png", "rb"),
-                content_type="image/png",
-            )
-    else:
+        return serve_default_agent_icon(request)
+
+    try:
+        return serve_cached_icon(request, image_path, content_type)
+    except OSError:
         LOGGER.error(f"Image not found: {image_path} Returning default agent icon")
-        return FileResponse(
-            open(os.getcwd() + "/aomail/assets/default-agent-icon.png", "rb"),
-            content_type="image/png",
-        )
+        return serve_default_agent_icon(request)
 
 
 ############################# CONTACT ##############################
@@ -259,17 +368,12 @@ def get_user_contacts(request: HttpRequest) -> Response:
         request (HttpRequest): The HTTP request object.
 
     Returns:
-        Response: JSON response containing user's contacts or an error message if no contacts are found.
+        Response: JSON response containing user's contacts.
     """
-    try:
-        user_contacts = Contact.objects.filter(user=request.user)
-    except Contact.DoesNotExist:
-        return Response(
-            {"error": "No contacts found"}, status=status.HTTP_404_NOT_FOUND
-        )
-
-    contacts_serializer = ContactSerializer(user_contacts, many=True)
-    return Response(contacts_serializer.data, status=status.HTTP_200_OK)
+    user_contacts = Contact.objects.filter(user=request.user).values(
+        "id", "email", "username", "provider_id"
+    )
+    return Response(list(user_contacts), status=status.HTTP_200_OK)
 
 
 ######################## DATABASE OPERATIONS ########################
@@ -287,16 +391,17 @@ def get_emails_linked(request: HttpRequest) -> Response:
                       or {"error": "Details of the specific error."} if there's an issue with the retrieval.
     """
     try:
-        social_apis = SocialAPI.objects.filter(user=request.user)
-        emails_linked = []
-        for social_api in social_apis:
-            emails_linked.append(
-                {
-                    "email": social_api.email,
-                    "typeApi": social_api.type_api,
-                    "isServerConfig": social_api.imap_config != None,
-                }
-            )
+        social_apis = SocialAPI.objects.filter(user=request.user).values(
+            "email", "type_api", "imap_config_id"
+        )
+        emails_linked = [
+            {
+                "email": social_api["email"],
+                "typeApi": social_api["type_api"],
+                "isServerConfig": social_api["imap_config_id"] is not None,
+            }
+            for social_api in social_apis
+        ]
         return Response(emails_linked, status=status.HTTP_200_OK)
     except Exception as e:
         LOGGER.error(f"Error retrieving linked emails: {str(e)}")
@@ -331,7 +436,7 @@ def search_emails(request: HttpRequest) -> Response:
         Response: A JSON response with the search results categorized by email provider and email address,
                       or {"error": "Details of the specific error."} if there's an issue with the search process.
     """
-    data: dict = json.loads(request.body)
+    data: dict = orjson.loads(request.body)
     user = request.user
     emails: list = data["emails"]
     max_results: int = data["max_results"]
@@ -357,7 +462,7 @@ def search_emails(request: HttpRequest) -> Response:
         social_api = SocialAPI.objects.get(email=email)
         type_api = social_api.type_api
 
-        if type_api == GOOGLE and not social_api.imap_config:
+        if type_api == GOOGLE and not social_api.imap_config_id:
             services = auth_google.authenticate_service(user, email, ["gmail"])
             search_result = threading.Thread(
                 target=append_to_result,
@@ -380,7 +485,7 @@ def search_emails(request: HttpRequest) -> Response:
                     ),
                 ),
             )
-        elif type_api == MICROSOFT and not social_api.imap_config:
+        elif type_api == MICROSOFT and not social_api.imap_config_id:
             access_token = auth_microsoft.refresh_access_token(
                 auth_microsoft.get_social_api(user, email)
             )
@@ -405,7 +510,7 @@ def search_emails(request: HttpRequest) -> Response:
                     ),
                 ),
             )
-        elif social_api.imap_config:
+        elif social_api.imap_config_id:
             search_result = threading.Thread(
                 target=append_to_result,
                 args=(
@@ -449,20 +554,20 @@ def update_user_description(request: HttpRequest) -> Response:
     Returns:
         Response: A JSON response indicating success or failure of the update operation.
     """
-    data: dict = json.loads(request.body)
+    data: dict = orjson.loads(request.body)
     user = request.user
     email = data.get("email")
     user_description = data.get("userDescription", "")
 
     if email:
-        try:
-            social_api = SocialAPI.objects.get(user=user, email=email)
-            social_api.user_description = user_description
-            social_api.save()
+        updated = SocialAPI.objects.filter(user=user, email=email).update(
+            user_description=user_description
+        )
+        if updated:
             return Response(
                 {"message": "User description updated"}, status=status.HTTP_200_OK
             )
-        except SocialAPI.DoesNotExist:
+        else:
             return Response(
                 {"error": "Email not found"}, status=status.HTTP_400_BAD_REQUEST
             )
@@ -487,17 +592,21 @@ def get_user_description(request: HttpRequest) -> Response:
         Response: A JSON response containing the user description if found,
                       or an error message if no email is provided or if the email is not found.
     """
-    data: dict = json.loads(request.body)
+    data: dict = orjson.loads(request.body)
     user = request.user
     email = data.get("email")
 
     if email:
-        try:
-            social_api = SocialAPI.objects.get(user=user, email=email)
+        user_description = (
+            SocialAPI.objects.filter(user=user, email=email)
+            .values_list("user_description", flat=True)
+            .first()
+        )
+        if user_description is not None:
             return Response(
-                {"description": social_api.user_description}, status=status.HTTP_200_OK
+                {"description": user_description}, status=status.HTTP_200_OK
             )
-        except SocialAPI.DoesNotExist:
+        else:
             return Response(
                 {"error": "Email not found"}, status=status.HTTP_400_BAD_REQUEST
             )
@@ -523,11 +632,11 @@ def create_sender(request: HttpRequest) -> Response:
         Response: Either {"id": <sender_id>} if the sender is successfully created,
                       or serializer errors with status HTTP 400 Bad Request if validation fails.
     """
-    data: dict = json.loads(request.body)
+    data: dict = orjson.loads(request.body)
     serializer = SenderSerializer(data=data)
 
     if serializer.is_valid():
-        sender = Sender.objects.create(email=data["email"], name=data["name"])
+        sender = serializer.save()
         return Response({"id": sender.id}, status=status.HTTP_201_CREATED)
     else:
         return Response(
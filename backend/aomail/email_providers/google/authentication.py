@@ -9,7 +9,8 @@ Endpoints:
 
 import json
 import logging
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from django.http import HttpRequest, HttpResponseRedirect
 from rest_framework.response import Response
 from rest_framework import status
@@ -32,6 +33,8 @@ from aomail.constants import (
     REDIRECT_URI_LINK_EMAIL,
     REDIRECT_URI_SIGNUP,
     GOOGLE_SCOPES,
+    GOOGLE_SERVICES_CACHE_MARGIN,
+    GOOGLE_SERVICES_CACHE_TTL,
     SOCIAL_API_REFRESH_TOKEN_KEY,
 )
 from aomail.models import SocialAPI, Subscription
@@ -41,6 +44,12 @@ from aomail.models import SocialAPI, Subscription
 LOGGER = logging.getLogger(__name__)
 
 
+######################## SERVICES CACHE ########################
+SERVICES_CACHE_LOCK = threading.Lock()
+# (user_id, email, services, thread_id) -> (services, expiration date in UTC)
+SERVICES_CACHE: dict[tuple[int, str, tuple[str, ...], int], tuple[dict, datetime]] = {}
+
+
 def generate_auth_url(request: HttpRequest) -> HttpResponseRedirect:
     """
     Generate a connection URL to obtain the authorization code.
@@ -345,7 +354,7 @@ def save_credentials(creds: credentials.Credentials, user: User, email: str):
     try:
         social_api = SocialAPI.objects.get(user=user, email=email)
         social_api.access_token = creds.token
-        social_api.save()
+        social_api.save(update_fields=["access_token", "last_fetched_date"])
     except Exception as e:
         LOGGER.error(f"Failed to save credentials: {str(e)}")
 
@@ -397,6 +406,15 @@ def authenticate_service(
         dict or None: A dictionary of Google API service endpoints for the requested services,
                       or None if authentication fails or if no valid services are specified.
     """
+    required_services = required_services or ["gmail", "people"]
+    # httplib2 is not thread-safe: services are only reused by the thread that built them
+    key = (user.id, email, tuple(required_services), threading.get_ident())
+    now = datetime.utcnow()
+    with SERVICES_CACHE_LOCK:
+        cached = SERVICES_CACHE.get(key)
+    if cached and cached[1] > now:
+        return cached[0]
+
     creds = get_credentials(user, email)
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -409,5 +427,15 @@ def authenticate_service(
             )
             return None
 
-    services = build_services(creds, required_services or ["gmail", "people"])
+    services = build_services(creds, required_services)
+
+    if creds.expiry:
+        expires_at = creds.expiry - timedelta(seconds=GOOGLE_SERVICES_CACHE_MARGIN)
+    else:
+        expires_at = now + timedelta(seconds=GOOGLE_SERVICES_CACHE_TTL)
+    with SERVICES_CACHE_LOCK:
+        for expired_key in [k for k, v in SERVICES_CACHE.items() if v[1] <= now]:
+            del SERVICES_CACHE[expired_key]
+        SERVICES_CACHE[key] = (services, expires_at)
+
     return services
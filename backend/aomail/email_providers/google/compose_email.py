@@ -8,13 +8,11 @@ Endpoints:
 import logging
 import threading
 from rest_framework import status
-from django.http import HttpRequest
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from rest_framework.decorators import api_view
+from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
 from aomail.utils.security import subscription
 from aomail.constants import ALLOW_ALL
 from aomail.email_providers.google.authentication import (
@@ -30,14 +28,13 @@ from aomail.ai_providers.utils import update_tokens_stats
 LOGGER = logging.getLogger(__name__)
 
 
-@api_view(["POST"])
 @subscription(ALLOW_ALL)
-def send_email(request: HttpRequest) -> Response:
+def send_email(request: Request) -> Response:
     """
     Sends an email using the Gmail API.
 
     Args:
-        request (HttpRequest): HTTP request object containing POST data with email details.
+        request (Request): HTTP request object containing POST data with email details.
 
     Returns:
         Response: Response indicating success or error.
@@ -244,7 +241,7 @@ def reply_email_google(email_entry: Email, prompt: str) -> bool:
 
         response = generate_email_response(
             email_entry.subject,
-            email_entry.html_content,
+            email_entry.body.html_content,
             prompt,
             agent_settings,
             signature,
@@ -10,12 +10,11 @@ import logging
 import re
 import time
 from rest_framework import status
-from django.http import HttpRequest
 from django.contrib.auth.models import User
 from collections import defaultdict
 from google.oauth2 import credentials
 from googleapiclient.discovery import build
-from rest_framework.decorators import api_view
+from rest_framework.request import Request
 from rest_framework.response import Response
 from aomail.utils.security import subscription
 from aomail.constants import (
@@ -269,14 +268,13 @@ def set_all_contacts(user: User, email: str):
         )
 
 
-@api_view(["GET"])
 @subscription(ALLOW_ALL)
-def get_profile_image(request: HttpRequest) -> Response:
+def get_profile_image(request: Request) -> Response:
     """
     Retrieves the profile image URL of the user from Google People API.
 
     Args:
-        request (HttpRequest): The HTTP request object containing the user and email headers.
+        request (Request): The HTTP request object containing the user and email headers.
 
     Returns:
         Response: A JSON response containing the profile image URL or an error message.
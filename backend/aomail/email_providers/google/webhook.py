@@ -8,21 +8,24 @@ Endpoints:
 import base64
 import logging
 import threading
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from rest_framework import status
 from django.utils import timezone
 from django.http import HttpRequest
 from django.contrib.auth.models import User
-from django.db import IntegrityError
+from django.db import close_old_connections
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from aomail.constants import (
     GOOGLE_PROJECT_ID,
     GOOGLE_TOPIC_NAME,
+    GOOGLE_WEBHOOK_MAX_WORKERS,
 )
 from aomail.email_providers.google.authentication import authenticate_service
-from aomail.models import GoogleListener, SocialAPI, Subscription
+from aomail.models import GoogleListener, SocialAPI
+from aomail.utils.security import is_user_blocked
 from aomail.email_providers.utils import email_to_db
 from aomail.email_providers.google import authentication as auth_google
 
@@ -31,6 +34,70 @@ from aomail.email_providers.google import authentication as auth_google
 LOGGER = logging.getLogger(__name__)
 
 
+######################## NOTIFICATIONS PROCESSING ########################
+EXECUTOR = ThreadPoolExecutor(max_workers=GOOGLE_WEBHOOK_MAX_WORKERS)
+PENDING_LOCK = threading.Lock()
+# email addresses with a processing queued but not started yet
+PENDING: set[str] = set()
+
+
+def submit_email_processing(email: str) -> bool:
+    """
+    Submit the processing of a notified mailbox to the worker pool.
+
+    Gmail often sends several notifications for the same mailbox within seconds.
+    Notifications received while a processing is queued and not started yet are coalesced into it.
+    Once the processing has started, a new notification submits a new processing.
+
+    Args:
+        email (str): The email address of the notified mailbox.
+
+    Returns:
+        bool: True if the processing was submitted, False if it was deduplicated.
+    """
+    with PENDING_LOCK:
+        if email in PENDING:
+            return False
+        PENDING.add(email)
+
+    EXECUTOR.submit(process_notification, email)
+    return True
+
+
+def process_notification(email: str):
+    """
+    Save the latest email of a notified mailbox to the database, or unsubscribe blocked users.
+
+    Runs in the worker pool so the webhook can acknowledge Google immediately.
+
+    Args:
+        email (str): The email address of the notified mailbox.
+    """
+    with PENDING_LOCK:
+        PENDING.discard(email)
+
+    close_old_connections()
+    try:
+        social_api = SocialAPI.objects.select_related("user").get(email=email)
+
+        if is_user_blocked(social_api.user_id):
+            LOGGER.info(
+                f"User with email: {email} is blocked. Unsubscribing user from Google notifications."
+            )
+            unsubscribe_from_email_notifications(social_api.user, email)
+        else:
+            email_to_db(social_api)
+
+    except SocialAPI.DoesNotExist:
+        pass
+    except Exception as e:
+        LOGGER.error(
+            f"Error processing the Google notification for email {email}: {str(e)}"
+        )
+    finally:
+        close_old_connections()
+
+
 def check_and_resubscribe_to_missing_resources(user: User, email: str):
     """
     Check all subscriptions for the given user and resubscribe to missing resources (email).
@@ -61,39 +128,21 @@ def receive_mail_notifications(request: HttpRequest) -> Response:
         Response: A JSON response indicating the status of the notification processing.
     """
     try:
-        envelope = json.loads(request.body.decode("utf-8"))
+        envelope = orjson.loads(request.body)
         message_data = envelope["message"]
 
-        decoded_data = base64.b64decode(message_data["data"]).decode("utf-8")
-        decoded_json: dict = json.loads(decoded_data)
+        decoded_json: dict = orjson.loads(base64.b64decode(message_data["data"]))
         email = decoded_json.get("emailAddress")
 
         LOGGER.info(
             f"Email notification received from Google API. Starting email processing for: {email}"
         )
 
-        try:
-            social_api = SocialAPI.objects.get(email=email)
-            subscription = Subscription.objects.get(user=social_api.user)
-
-            if subscription.is_block:
-                LOGGER.info(
-                    f"User with email: {email} is blocked. Unsubscribing user from Google notifications."
-                )
-                unsubscribe_from_email_notifications(social_api.user, email)
-            else:
-                threading.Thread(target=email_to_db, args=(social_api,)).start()
-
-        except SocialAPI.DoesNotExist:
-            pass
+        if email and not submit_email_processing(email):
+            LOGGER.info(f"Skipping duplicated Google notification for email: {email}")
 
         return Response({"status": "Notification received"}, status=status.HTTP_200_OK)
 
-    except IntegrityError:
-        return Response(
-            {"status": "Email already exists in database"}, status=status.HTTP_200_OK
-        )
-
     except Exception as e:
         LOGGER.error(f"Error processing the notification: {str(e)}")
         return Response(
@@ -7,12 +7,18 @@ Endpoints:
 - ✅ auth_url_regrant: Get authorization URL for regranting consent.
 """
 
+import atexit
+import base64
 import json
 import logging
 import requests
+import threading
+import time
 from datetime import datetime
 from collections import defaultdict
 from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rest_framework.decorators import api_view
 from django.contrib.auth.models import User
 from django.http import HttpRequest, HttpResponseRedirect
@@ -24,12 +30,15 @@ from aomail.utils.security import subscription
 from aomail.utils import security
 from aomail.constants import (
     ALLOWED_PLANS,
+    GRAPH_TIMEOUT,
     GRAPH_URL,
     MICROSOFT_AUTHORITY,
     MICROSOFT_CLIENT_ID,
     MICROSOFT_CLIENT_SECRET,
     MICROSOFT_CLIENT_STATE,
     MICROSOFT_SCOPES,
+    MICROSOFT_TOKEN_CACHE_MARGIN,
+    MICROSOFT_TOKEN_CACHE_TTL,
     REDIRECT_URI_LINK_EMAIL,
     REDIRECT_URI_SIGNUP,
     SOCIAL_API_REFRESH_TOKEN_KEY,
@@ -41,6 +50,40 @@ from aomail.models import SocialAPI, Subscription
 LOGGER = logging.getLogger(__name__)
 
 
+######################## HTTP SESSION ########################
+class TimeoutAdapter(HTTPAdapter):
+    """HTTP adapter applying GRAPH_TIMEOUT to requests sent without an explicit timeout."""
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = GRAPH_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+# Shared session so Graph API calls reuse keep-alive connections instead of a new TLS handshake each time
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    TimeoutAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+atexit.register(SESSION.close)
+
+
+######################## ACCESS TOKEN CACHE ########################
+TOKEN_CACHE_LOCK = threading.Lock()
+# social_api_id -> (access_token, expiration time on the monotonic clock)
+TOKEN_CACHE: dict[int, tuple[str, float]] = {}
+
+
 def generate_auth_url(request: HttpRequest) -> HttpResponseRedirect:
     """
     Generate a connection URL to obtain the authorization code for Microsoft.
@@ -326,7 +369,7 @@ def is_token_valid(access_token: str) -> bool:
     """
     sample_url = f"{GRAPH_URL}me"
     headers = get_headers(access_token)
-    response = requests.get(sample_url, headers=headers)
+    response = SESSION.get(sample_url, headers=headers)
     return response.status_code == 200
 
 
@@ -343,6 +386,13 @@ def refresh_access_token(social_api: SocialAPI) -> str | None:
     access_token = social_api.access_token
 
     if is_token_valid(access_token):
+        expires_at = get_token_expiration(access_token)
+        if expires_at is not None:
+            ttl = int(expires_at - time.time()) - MICROSOFT_TOKEN_CACHE_MARGIN
+        else:
+            # opaque token: its remaining lifetime is unknown, keep it only briefly
+            ttl = MICROSOFT_TOKEN_CACHE_TTL - MICROSOFT_TOKEN_CACHE_MARGIN
+        cache_access_token(social_api, access_token, ttl)
         return access_token
 
     refresh_url = f"{MICROSOFT_AUTHORITY}/oauth2/v2.0/token"
@@ -364,7 +414,11 @@ def refresh_access_token(social_api: SocialAPI) -> str | None:
     if "access_token" in response_data:
         access_token = response_data["access_token"]
         social_api.access_token = access_token
-        social_api.save()
+        social_api.save(update_fields=["access_token", "last_fetched_date"])
+        expires_in = response_data.get("expires_in", MICROSOFT_TOKEN_CACHE_TTL)
+        cache_access_token(
+            social_api, access_token, int(expires_in) - MICROSOFT_TOKEN_CACHE_MARGIN
+        )
         return access_token
     else:
         error = response_data.get("error_description", response.reason)
@@ -372,3 +426,92 @@ def refresh_access_token(social_api: SocialAPI) -> str | None:
             f"Failed to refresh access token for email {social_api.email}: {error}"
         )
         return None
+
+
+def get_token_expiration(access_token: str) -> float | None:
+    """
+    Reads the expiration time from the `exp` claim of a JWT access token.
+
+    Access tokens of personal Microsoft accounts are opaque, their expiration cannot be read.
+
+    Args:
+        access_token (str): The access token to inspect.
+
+    Returns:
+        float | None: The expiration time as a Unix timestamp, or None if it is unknown.
+    """
+    try:
+        payload = access_token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+def cache_access_token(social_api: SocialAPI, access_token: str, ttl: int):
+    """
+    Stores a valid access token in the process cache.
+
+    Tokens without remaining lifetime after the margin are not cached.
+
+    Args:
+        social_api (SocialAPI): The SocialAPI instance the access token belongs to.
+        access_token (str): The valid access token.
+        ttl (int): Number of seconds the access token can be reused without being checked.
+    """
+    if ttl <= 0:
+        return
+
+    with TOKEN_CACHE_LOCK:
+        TOKEN_CACHE[social_api.id] = (access_token, time.monotonic() + ttl)
+
+
+def cached_access_token(social_api: SocialAPI) -> str | None:
+    """
+    Returns a valid access token for the provided SocialAPI instance, reusing the cached one when possible.
+
+    Avoids checking or refreshing the token against Microsoft on every Graph API call.
+
+    Args:
+        social_api (SocialAPI): The SocialAPI instance containing the access and refresh tokens.
+
+    Returns:
+        str | None: A valid access token, otherwise None.
+    """
+    with TOKEN_CACHE_LOCK:
+        cached = TOKEN_CACHE.get(social_api.id)
+
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+
+    return refresh_access_token(social_api)
+
+
+def invalidate_access_token(social_api: SocialAPI):
+    """
+    Removes the cached access token of the provided SocialAPI instance, e.g. after Microsoft rejected it.
+
+    Args:
+        social_api (SocialAPI): The SocialAPI instance whose access token is no longer valid.
+    """
+    with TOKEN_CACHE_LOCK:
+        TOKEN_CACHE.pop(social_api.id, None)
+
+
+def get_cached_access_token(user: User, email: str) -> str | None:
+    """
+    Returns a valid access token for the account of the user, reusing the cached one when possible.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the account.
+
+    Returns:
+        str | None: A valid access token, otherwise None.
+    """
+    social_api = get_social_api(user, email)
+    if social_api is None:
+        return None
+    return cached_access_token(social_api)
@@ -10,9 +10,8 @@ import base64
 import logging
 import threading
 import requests
-from django.http import HttpRequest
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.request import Request
 from rest_framework.response import Response
 from aomail.utils.security import subscription
 from email.mime.application import MIMEApplication
@@ -34,14 +33,13 @@ from aomail.ai_providers.google.client import generate_email_response
 LOGGER = logging.getLogger(__name__)
 
 
-@api_view(["POST"])
 @subscription(ALLOW_ALL)
-def send_schedule_email(request: HttpRequest) -> Response:
+def send_schedule_email(request: Request) -> Response:
     """
     Schedule the sending of an email using the Microsoft Graph API with deferred delivery.
 
     Args:
-        request (HttpRequest): HTTP request object containing POST data with email details.
+        request (Request): HTTP request object containing POST data with email details.
 
     Returns:
         Response: Response indicating success or error.
@@ -163,14 +161,13 @@ def send_schedule_email(request: HttpRequest) -> Response:
         )
 
 
-@api_view(["POST"])
 @subscription(ALLOW_ALL)
-def send_email(request: HttpRequest) -> Response:
+def send_email(request: Request) -> Response:
     """
     Sends an email using the Microsoft Graph API.
 
     Args:
-        request (HttpRequest): HTTP request object containing POST data with email details.
+        request (Request): HTTP request object containing POST data with email details.
 
     Returns:
         Response: Response indicating success or error.
@@ -418,7 +415,7 @@ def reply_email_microsoft(email_entry: Email, prompt: str) -> bool:
 
         response = generate_email_response(
             email_entry.subject,
-            email_entry.html_content,
+            email_entry.body.html_content,
             prompt,
             agent_settings,
             signature,
@@ -3,24 +3,113 @@ Provides email search and operation functions using Microsoft Graph API.
 """
 
 import datetime
+import hashlib
 import logging
 import requests
-from django.utils.timezone import make_aware
+import threading
+from collections.abc import AsyncIterator
+from email.utils import parsedate_to_datetime
+from asgiref.sync import sync_to_async
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 from django.contrib.auth.models import User
 from aomail.email_providers.microsoft.authentication import (
+    SESSION,
+    cached_access_token,
     get_headers,
     get_social_api,
-    refresh_access_token,
 )
 from aomail.utils import email_processing
-from aomail.constants import GRAPH_URL
-from aomail.models import Attachment, Email, SocialAPI
+from aomail.constants import (
+    ATTACHMENT_CHUNK_SIZE,
+    GRAPH_CACHE_MAX_SIZE,
+    GRAPH_CACHE_TTL,
+    GRAPH_PAGE_SIZE,
+    GRAPH_URL,
+)
+from aomail.models import Attachment, SocialAPI
 
 
 ######################## LOGGING CONFIGURATION ########################
 LOGGER = logging.getLogger(__name__)
 
 
+######################## GRAPH RESPONSES CACHE ########################
+GRAPH_CACHE_LOCK = threading.RLock()
+# hash of (authorization, url, params) -> JSON body of a successful GET
+GRAPH_CACHE = TTLCache(maxsize=GRAPH_CACHE_MAX_SIZE, ttl=GRAPH_CACHE_TTL)
+
+
+def graph_get(url: str, headers: dict, params: dict = None) -> dict:
+    """
+    Sends a GET request to Microsoft Graph API.
+
+    Args:
+        url (str): The Microsoft Graph API URL.
+        headers (dict): Headers of the request.
+        params (dict, optional): Query parameters of the request.
+
+    Returns:
+        dict: The JSON body of the response.
+
+    Raises:
+        requests.HTTPError: If the request fails.
+    """
+    response = SESSION.get(url, headers=headers, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+def cached_graph_get(url: str, headers: dict, params: dict = None) -> dict:
+    """
+    Sends a GET request to Microsoft Graph API, reusing the response of an identical recent request.
+
+    Only meant for small metadata of immutable resources that are read several times, such as attachments.
+    Message bodies and inbox listings must use graph_get.
+    The key includes the Authorization header so cached responses are never shared between mailboxes.
+
+    Args:
+        url (str): The Microsoft Graph API URL.
+        headers (dict): Headers of the request.
+        params (dict, optional): Query parameters of the request.
+
+    Returns:
+        dict: The JSON body of the response.
+
+    Raises:
+        requests.HTTPError: If the request fails. Failed responses are not cached.
+    """
+    key = hashlib.blake2b(
+        f"{headers.get('Authorization')}\n{url}?{urlencode(params or {})}".encode()
+    ).digest()
+
+    with GRAPH_CACHE_LOCK:
+        data = GRAPH_CACHE.get(key)
+    if data is not None:
+        return data
+
+    data = graph_get(url, headers, params)
+
+    with GRAPH_CACHE_LOCK:
+        GRAPH_CACHE[key] = data
+
+    return data
+
+
+def escape_search_query(search_query: str) -> str:
+    """
+    Escapes a user query so it can be wrapped in double quotes in a Graph $search parameter.
+
+    Args:
+        search_query (str): The raw query typed by the user.
+
+    Returns:
+        str: The query with backslashes and double quotes escaped.
+    """
+    return search_query.replace("\\", "\\\\").replace('"', '\\"')
+
+
 def parse_name_and_email(
     sender: dict[str, dict],
 ) -> tuple[str, str] | tuple[None, None]:
@@ -95,20 +184,20 @@ def delete_email(social_api: SocialAPI, email_id: str) -> dict:
         dict: A dictionary containing a success message if the email is moved to the trash successfully,
               or an error message if the operation fails.
     """
-    access_token = refresh_access_token(social_api)
+    access_token = cached_access_token(social_api)
     headers = get_headers(access_token)
     url = f"{GRAPH_URL}/me/messages/{email_id}/move"
     data = {"destinationId": "deleteditems"}
 
-    response = requests.post(url, headers=headers, json=data)
+    response = SESSION.post(url, headers=headers, json=data)
 
-    if "id" in response.text:
-        return {"message": "Email moved to trash successfully!"}
-    elif "error" in response.text:
+    if response.ok:
         return {"message": "Email moved to trash successfully!"}
     else:
         LOGGER.error(
-            f"Failed to move email to trash for Social API email: {social_api.email}: {response.text}"
+            "Failed to move email to trash for Social API email: %s: %.512s",
+            social_api.email,
+            response.text,
         )
         return {"error": f"Failed to move email to trash: {response.text}"}
 
@@ -121,10 +210,10 @@ def set_email_read(social_api: SocialAPI, email_id: int):
         social_api (SocialAPI): The SocialAPI instance containing the user's access and refresh tokens.
         email_id (int): The ID of the email to be marked as read.
     """
-    access_token = refresh_access_token(social_api)
+    access_token = cached_access_token(social_api)
     headers = get_headers(access_token)
     data = {"isRead": True}
-    requests.patch(f"{GRAPH_URL}/me/messages/{email_id}/", headers=headers, json=data)
+    SESSION.patch(f"{GRAPH_URL}/me/messages/{email_id}/", headers=headers, json=data)
 
 
 def set_email_unread(social_api: SocialAPI, email_id: int):
@@ -135,10 +224,93 @@ def set_email_unread(social_api: SocialAPI, email_id: int):
         social_api (SocialAPI): The SocialAPI instance containing the user's access and refresh tokens.
         email_id (int): The ID of the email to be marked as unread.
     """
-    access_token = refresh_access_token(social_api)
+    access_token = cached_access_token(social_api)
     headers = get_headers(access_token)
     data = {"isRead": False}
-    requests.patch(f"{GRAPH_URL}/me/messages/{email_id}/", headers=headers, json=data)
+    SESSION.patch(f"{GRAPH_URL}/me/messages/{email_id}/", headers=headers, json=data)
+
+
+def search_folders(
+    graph_endpoints: list[str], headers: dict, params: dict, max_results: int
+) -> list[dict]:
+    """
+    Runs the same message search concurrently on several mail folder endpoints.
+
+    Each folder is requested once with $top=max_results (at most GRAPH_PAGE_SIZE).
+    '@odata.nextLink' is only followed when Graph splits the results over several pages.
+
+    Args:
+        graph_endpoints (list[str]): Microsoft Graph endpoints of the folders to search in.
+        headers (dict): Headers of the requests.
+        params (dict): Query parameters of the search.
+        max_results (int): The maximum number of messages to retrieve per folder.
+
+    Returns:
+        list[dict]: The messages found without duplicates, in the order of the endpoints.
+    """
+    params = {**params, "$top": min(max_results, GRAPH_PAGE_SIZE)}
+
+    def run_request(graph_endpoint: str) -> list[dict]:
+        messages = []
+        url, url_params = graph_endpoint, params
+        try:
+            while url and len(messages) < max_results:
+                response = SESSION.get(url, headers=headers, params=url_params)
+                response.raise_for_status()
+                data: dict = response.json()
+                messages.extend(data.get("value", []))
+                # The next link already contains the query parameters
+                url, url_params = data.get("@odata.nextLink"), None
+        except Exception as e:
+            LOGGER.error(f"Failed to search emails for url: {graph_endpoint}: {str(e)}")
+
+        return messages[:max_results]
+
+    if not graph_endpoints:
+        return []
+
+    # A message can be listed by several folders: keep its first occurrence only
+    messages = {}
+    with ThreadPoolExecutor(max_workers=len(graph_endpoints)) as executor:
+        for folder_messages in executor.map(run_request, graph_endpoints):
+            for message in folder_messages:
+                messages.setdefault(message["id"], message)
+
+    return list(messages.values())
+
+
+def expand_attachments(params: dict):
+    """
+    Updates search parameters so listed messages include the ID and name of their attachments.
+
+    Args:
+        params (dict): Query parameters of the search.
+    """
+    params["$select"] = "id,hasAttachments"
+    params["$expand"] = "attachments($select=id,name)"
+
+
+def attachment_matches(
+    attachment: dict, name_set: frozenset[str] | None, ext_set: frozenset[str] | None
+) -> bool:
+    """
+    Checks if an attachment satisfies both the filename and the extension criteria.
+
+    Args:
+        attachment (dict): Attachment returned by Microsoft Graph API, with its 'name'.
+        name_set (frozenset[str] | None): Accepted filenames, or None to accept any filename.
+        ext_set (frozenset[str] | None): Accepted lowercase extensions, or None to accept any extension.
+
+    Returns:
+        bool: True if the attachment matches the criteria, False otherwise.
+    """
+    attachment_name = attachment.get("name", "")
+    _, dot, tail = attachment_name.rpartition(".")
+    attachment_extension = tail.lower() if dot else ""
+
+    return (name_set is None or attachment_name in name_set) and (
+        ext_set is None or attachment_extension in ext_set
+    )
 
 
 def search_emails_ai(
@@ -178,7 +350,6 @@ def search_emails_ai(
         list: A list of email IDs that match the search criteria.
     """
     folder_url = f"{GRAPH_URL}me/mailFolders/"
-    message_ids = []
     params = {"$top": max_results, "$select": "id", "$count": "true"}
 
     # Populate search parameters
@@ -206,18 +377,6 @@ def search_emails_ai(
     if date_from:
         params["receivedDateTime"] = f"gt{date_from}T00:00:00Z"
 
-    def run_request(graph_endpoint: str):
-        """Function to run the email search request"""
-        try:
-            headers = {"Authorization": f"Bearer {access_token}"}
-            response = requests.get(graph_endpoint, headers=headers, params=params)
-            response.raise_for_status()
-            data: dict = response.json()
-            messages = data.get("value", [])
-            message_ids.extend([message["id"] for message in messages])
-        except Exception as e:
-            LOGGER.error(f"Failed to search emails with AI filled parameters: {str(e)}")
-
     # Build folder endpoints
     endpoints = {
         "spams": "junkemail/messages",
@@ -225,47 +384,39 @@ def search_emails_ai(
         "drafts": "drafts",
         "sent_emails": "sentitems",
     }
-    for folder in search_in:
-        if folder in endpoints and search_in[folder]:
-            graph_endpoint = f"{folder_url}{endpoints[folder]}"
-            run_request(graph_endpoint)
+    graph_endpoints = [
+        f"{folder_url}{endpoints[folder]}"
+        for folder in search_in
+        if folder in endpoints and search_in[folder]
+    ]
 
     # Also search in the inbox if specified
     if not any(search_in.values()):
-        graph_endpoint = f"{folder_url}inbox/messages"
-        run_request(graph_endpoint)
+        graph_endpoints.append(f"{folder_url}inbox/messages")
+
+    headers = {"Authorization": f"Bearer {access_token}"}
 
     if not filenames and not file_extensions:
-        return message_ids
+        messages = search_folders(graph_endpoints, headers, params, max_results)
+        return [message["id"] for message in messages]
 
     # Filter messages by attachment criteria (filenames and extensions)
-    filtered_message_ids = []
-
-    for email_id in message_ids:
-        attachments = fetch_attachments(access_token, email_id)
-
-        # Check if any attachment matches the filename or extension criteria
-        for attachment in attachments:
-            attachment_name = attachment.get("attachmentName", "")
-            attachment_extension = (
-                attachment_name.split(".")[-1].lower() if "." in attachment_name else ""
-            )
-
-            # Check filename matches, if specified
-            name_matches = filenames is None or any(
-                attachment_name == filename for filename in filenames
-            )
-            # Check extension matches, if specified
-            ext_matches = file_extensions is None or any(
-                attachment_extension == ext.lower() for ext in file_extensions
-            )
-
-            # If either name and extension match, add this email_id to filtered list
-            if name_matches and ext_matches:
-                filtered_message_ids.append(email_id)
-                break
+    expand_attachments(params)
+    messages = search_folders(graph_endpoints, headers, params, max_results)
+    name_set = frozenset(filenames) if filenames else None
+    ext_set = (
+        frozenset(ext.lower() for ext in file_extensions) if file_extensions else None
+    )
 
-    return filtered_message_ids
+    # Keep messages having at least one attachment matching the filename and extension criteria
+    return [
+        message["id"]
+        for message in messages
+        if any(
+            attachment_matches(attachment, name_set, ext_set)
+            for attachment in message.get("attachments", [])
+        )
+    ]
 
 
 def search_emails_manually(
@@ -304,20 +455,7 @@ def search_emails_manually(
     """
     headers = {"Authorization": f"Bearer {access_token}"}
     folder_url = f"{GRAPH_URL}me/mailFolders/"
-    graph_endpoint = f"{folder_url}inbox/messages"
-    message_ids = []
-
-    def run_request(graph_endpoint, params):
-        try:
-            response = requests.get(graph_endpoint, headers=headers, params=params)
-            response.raise_for_status()
-            data: dict = response.json()
-            messages = data.get("value", [])
-            message_ids.extend([message["id"] for message in messages])
-        except Exception as e:
-            LOGGER.error(
-                f"Failed to search_emails_manually for url: {graph_endpoint}: {str(e)}"
-            )
+    graph_endpoints = []
 
     try:
         params = {"$top": max_results, "$select": "id", "$count": "true"}
@@ -348,55 +486,39 @@ def search_emails_manually(
             }
             for folder in search_in or []:
                 if folder in endpoints and search_in[folder]:
-                    endpoint = f"{folder_url}{endpoints[folder]}"
-                    run_request(endpoint, params)
+                    graph_endpoints.append(f"{folder_url}{endpoints[folder]}")
         else:
-            # Simple search using `search_query`
-            filter_expression = f"""
-            contains(subject,'{search_query}') or 
-            contains(body/content,'{search_query}') or 
-            contains(sender/emailAddress/address,'{search_query}')
-            """
-            params["$filter"] = filter_expression
-
-        response = requests.get(graph_endpoint, headers=headers, params=params)
-        response.raise_for_status()
-        response_data: dict = response.json()
-        messages = response_data.get("value", [])
-        message_ids.extend([message["id"] for message in messages])
+            # Simple search using `search_query` on the mailbox search index
+            # $search covers the subject, body and sender and cannot be combined with $count
+            params["$search"] = f'"{escape_search_query(search_query)}"'
+            params.pop("$count")
+            headers["ConsistencyLevel"] = "eventual"
+
+        graph_endpoints.append(f"{folder_url}inbox/messages")
 
         # If no filename or extension filtering is specified, return results directly
         if not filenames and not file_extensions:
-            return message_ids
+            messages = search_folders(graph_endpoints, headers, params, max_results)
+            return [message["id"] for message in messages]
 
         # Filter messages by attachment criteria (both filenames and extensions required if specified)
-        filtered_message_ids = []
-
-        for email_id in message_ids:
-            attachments = fetch_attachments(access_token, email_id)
-
-            for attachment in attachments:
-                attachment_name = attachment.get("attachmentName", "")
-                attachment_extension = (
-                    attachment_name.split(".")[-1].lower()
-                    if "." in attachment_name
-                    else ""
-                )
-
-                # Check if both filename and extension criteria are satisfied
-                name_matches = filenames is None or any(
-                    attachment_name == filename for filename in filenames
-                )
-                ext_matches = file_extensions is None or any(
-                    attachment_extension == ext.lower() for ext in file_extensions
-                )
-
-                # If both conditions are met, consider this email ID a match
-                if name_matches and ext_matches:
-                    filtered_message_ids.append(email_id)
-                    break
+        expand_attachments(params)
+        messages = search_folders(graph_endpoints, headers, params, max_results)
+        name_set = frozenset(filenames) if filenames else None
+        ext_set = (
+            frozenset(ext.lower() for ext in file_extensions)
+            if file_extensions
+            else None
+        )
 
-        return filtered_message_ids
+        return [
+            message["id"]
+            for message in messages
+            if any(
+                attachment_matches(attachment, name_set, ext_set)
+                for attachment in message.get("attachments", [])
+            )
+        ]
 
     except Exception as e:
         LOGGER.error(f"Failed to search emails from Microsoft API: {str(e)}")
@@ -416,15 +538,18 @@ def get_demo_list(user: User, email: str) -> list[str]:
                    Returns an empty list if no messages are found.
     """
     url = f"{GRAPH_URL}me/mailFolders/inbox/messages"
-    access_token = refresh_access_token(get_social_api(user, email))
+    access_token = cached_access_token(get_social_api(user, email))
     headers = get_headers(access_token)
 
     params = {
         "$top": 5,
         "$select": "id",
     }
-    response = requests.get(url, headers=headers, params=params)
-    messages = response.json().get("value", [])
+    try:
+        messages = graph_get(url, headers, params).get("value", [])
+    except Exception as e:
+        LOGGER.error(f"Failed to retrieve demo emails from Microsoft API: {str(e)}")
+        return []
 
     return [msg["id"] for msg in messages] if messages else []
 
@@ -440,18 +565,28 @@ def fetch_attachments(social_api: SocialAPI, email_id: str) -> list:
     Returns:
         list: List of dictionaries, each containing 'attachmentId' and 'attachmentName'.
     """
-    access_token = refresh_access_token(social_api)
+    access_token = cached_access_token(social_api)
     headers = get_headers(access_token)
 
-    attachments_url = f"{GRAPH_URL}me/messages/{email_id}/attachments"
-    response = requests.get(attachments_url, headers=headers)
+    return fetch_attachments_with_headers(headers, email_id)
 
-    if response.status_code != 200:
-        raise Exception(
-            f"Failed to fetch attachments: {response.status_code}, {response.text}"
-        )
 
-    attachment_data = response.json().get("value", [])
+def fetch_attachments_with_headers(headers: dict, email_id: str) -> list:
+    """
+    Fetch attachments for a given email by ID with already built request headers.
+
+    Args:
+        headers (dict): Headers containing a valid access token.
+        email_id (str): ID of the specific email message.
+
+    Returns:
+        list: List of dictionaries, each containing 'attachmentId' and 'attachmentName'.
+    """
+    attachments_url = f"{GRAPH_URL}me/messages/{email_id}/attachments"
+    params = {"$select": "id,name"}
+    attachment_data = cached_graph_get(attachments_url, headers, params).get(
+        "value", []
+    )
     attachments = [
         {"attachmentId": att["id"], "attachmentName": att["name"]}
         for att in attachment_data
@@ -480,17 +615,13 @@ def get_mail_to_db(social_api: SocialAPI, email_id: str) -> dict:
             list[dict]: List of dictionaries containing details about each attachment (ID and name).
     """
     url = f"{GRAPH_URL}me/messages/{email_id}"
-    access_token = refresh_access_token(social_api)
+    access_token = cached_access_token(social_api)
     headers = get_headers(access_token)
 
-    response = requests.get(url, headers=headers)
-
-    if response.status_code != 200:
-        raise Exception(
-            f"Failed to fetch email: {response.status_code}, {response.text}"
-        )
-
-    message_data: dict = response.json()
+    params = {
+        "$select": "subject,from,ccRecipients,bccRecipients,sentDateTime,hasAttachments,body"
+    }
+    message_data = graph_get(url, headers, params)
 
     has_attachments = message_data.get("hasAttachments", False)
     subject: str = message_data.get("subject", "")
@@ -499,25 +630,19 @@ def get_mail_to_db(social_api: SocialAPI, email_id: str) -> dict:
     from_info = parse_name_and_email(sender)
 
     # Handling CC and BCC recipients
-    cc_info = [
-        parse_name_and_email(recipient)
-        for recipient in message_data.get("ccRecipients", [])
-    ]
-    bcc_info = [
-        parse_name_and_email(recipient)
-        for recipient in message_data.get("bccRecipients", [])
-    ]
+    cc_info = tuple(map(parse_name_and_email, message_data.get("ccRecipients") or ()))
+    bcc_info = tuple(map(parse_name_and_email, message_data.get("bccRecipients") or ()))
 
     # Parse the sent date
     sent_date_str = message_data.get("sentDateTime")
     sent_date = (
-        make_aware(datetime.datetime.strptime(sent_date_str, "%Y-%m-%dT%H:%M:%SZ"))
-        if sent_date_str
-        else None
+        datetime.datetime.fromisoformat(sent_date_str) if sent_date_str else None
     )
 
     # Retrieve attachments if they exist
-    attachments = fetch_attachments(social_api, email_id) if has_attachments else []
+    attachments = (
+        fetch_attachments_with_headers(headers, email_id) if has_attachments else []
+    )
 
     # Process the email body
     decoded_data = parse_message_body(message_data)
@@ -567,21 +692,24 @@ def get_mail(access_token: str, int_mail: int = None, id_mail: str = None) -> tu
     url = f"{GRAPH_URL}me/mailFolders/inbox/messages"
     headers = get_headers(access_token)
 
-    if int_mail:
-        response = requests.get(url, headers=headers)
-        response_data: dict = response.json()
-        messages = response_data.get("value", [])
+    if int_mail is not None:
+        params = {"$top": 1, "$skip": int_mail, "$select": "id"}
+        messages = graph_get(url, headers, params).get("value", [])
 
         if not messages:
             return None
 
-        email_id = messages[int_mail]["id"]
+        email_id = messages[0]["id"]
     elif id_mail:
         email_id = id_mail
+    else:
+        return None
 
     message_url = f"{url}/{email_id}"
-    response = requests.get(message_url, headers=headers)
-    message_data: dict = response.json()
+    params = {
+        "$select": "subject,from,ccRecipients,bccRecipients,sentDateTime,internetMessageHeaders,body"
+    }
+    message_data = graph_get(message_url, headers, params)
 
     subject = message_data.get("subject")
     sender = message_data.get("from")
@@ -592,14 +720,11 @@ def get_mail(access_token: str, int_mail: int = None, id_mail: str = None) -> tu
     sent_date = None
 
     if sent_date_str:
-        sent_date = datetime.datetime.strptime(sent_date_str, "%Y-%m-%dT%H:%M:%SZ")
-        sent_date = make_aware(sent_date)
+        sent_date = datetime.datetime.fromisoformat(sent_date_str)
 
     for header in message_data.get("internetMessageHeaders", []):
         if header["name"] == "Date":
-            sent_date = datetime.datetime.strptime(
-                header["value"], "%a, %d %b %Y %H:%M:%S %z"
-            )
+            sent_date = parsedate_to_datetime(header["value"])
             break
 
     decoded_data = parse_message_body(message_data)
@@ -615,8 +740,29 @@ def get_mail(access_token: str, int_mail: int = None, id_mail: str = None) -> tu
     )
 
 
+async def iter_response_chunks(response: requests.Response) -> AsyncIterator[bytes]:
+    """
+    Yields the body of a streamed response by chunks without blocking the event loop.
+
+    The upstream response is always closed, including when the client disconnects.
+
+    Args:
+        response (requests.Response): A response requested with stream=True.
+
+    Yields:
+        bytes: Chunks of ATTACHMENT_CHUNK_SIZE bytes at most.
+    """
+    chunks = response.iter_content(chunk_size=ATTACHMENT_CHUNK_SIZE)
+    read_chunk = sync_to_async(next, thread_sensitive=False)
+    try:
+        while (chunk := await read_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        response.close()
+
+
 def get_attachment_data(
-    social_api: SocialAPI, email_id: str, attachment_name: str
+    social_api: SocialAPI, email_id: str, attachment_name: str, stream: bool = False
 ) -> dict:
     """
     Retrieves the data for a specific attachment from an email using the Microsoft Graph API.
@@ -625,40 +771,46 @@ def get_attachment_data(
         social_api (SocialAPI): SocialAPI object containing authentication information.
         email_id (str): The ID of the email containing the attachment.
         attachment_name (str): The name of the attachment to retrieve.
+        stream (bool, optional): If True, the data is returned as an async iterator of chunks
+                                 instead of being loaded in memory. Defaults to False.
 
     Returns:
         dict: A dictionary containing:
             - attachmentName (str): The name of the attachment.
-            - data (bytes): The attachment data.
+            - data (bytes | AsyncIterator[bytes]): The attachment data.
+            - contentLength (int): The size of the attachment in bytes, 0 if unknown.
             - Returns an empty dictionary if the attachment is not found.
     """
     try:
-        access_token = refresh_access_token(social_api)
+        access_token = cached_access_token(social_api)
         headers = get_headers(access_token)
 
-        email = Email.objects.get(user=social_api.user, provider_id=email_id)
-        attachment = Attachment.objects.get(email=email, name=attachment_name)
+        attachment = Attachment.objects.only("id_api").get(
+            email__user=social_api.user,
+            email__provider_id=email_id,
+            name=attachment_name,
+        )
 
         attachment_url = (
             f"{GRAPH_URL}me/messages/{email_id}/attachments/{attachment.id_api}/$value"
         )
-        response = requests.get(attachment_url, headers=headers)
+        response = SESSION.get(attachment_url, headers=headers, stream=stream)
 
         if response.status_code != 200:
             LOGGER.error(
-                f"Failed to retrieve attachment data: {response.status_code}, {response.text}"
+                "Failed to retrieve attachment data: %s, %.512s",
+                response.status_code,
+                response.text,
             )
+            response.close()
             return {}
 
         return {
             "attachmentName": attachment_name,
-            "data": response.content,
+            "data": iter_response_chunks(response) if stream else response.content,
+            "contentLength": int(response.headers.get("Content-Length", 0)),
         }
 
-    except Email.DoesNotExist:
-        LOGGER.error(f"No email found with ID {email_id}.")
-        return {}
-
     except Attachment.DoesNotExist:
         LOGGER.error(
             f"No attachment found with name '{attachment_name}' for email ID {email_id}."
@@ -7,23 +7,38 @@ Endpoints:
 
 import base64
 import datetime
+import hashlib
 import logging
+import threading
 import time
-import requests
-from collections import defaultdict
+import orjson
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+from collections.abc import Iterator
 from django.contrib.auth.models import User
-from django.http import HttpRequest
+from django.core.cache import cache
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.request import Request
 from rest_framework.response import Response
 from aomail.utils.security import subscription
 from aomail.email_providers.microsoft.authentication import (
+    SESSION,
+    cached_access_token,
     get_headers,
     get_social_api,
-    refresh_access_token,
+    invalidate_access_token,
 )
 from aomail.utils import email_processing
-from aomail.constants import ALLOW_ALL, GRAPH_URL
+from aomail.constants import (
+    ALLOW_ALL,
+    GRAPH_PAGING_TIMEOUT,
+    GRAPH_URL,
+    MICROSOFT_EMAIL_CACHE_TTL,
+    MICROSOFT_LICENSE_CACHE_TTL,
+    PROFILE_IMAGE_CACHE_TTL,
+    PROFILE_IMAGE_CHUNK_SIZE,
+)
 from aomail.models import SocialAPI
 
 
@@ -31,6 +46,26 @@ from aomail.models import SocialAPI
 LOGGER = logging.getLogger(__name__)
 
 
+######################## ACCOUNT INFORMATION CACHE ########################
+ACCOUNT_CACHE_LOCK = threading.Lock()
+# hash of the access token -> result of verify_license / get_email
+LICENSE_CACHE = TTLCache(maxsize=10_000, ttl=MICROSOFT_LICENSE_CACHE_TTL)
+EMAIL_CACHE = TTLCache(maxsize=10_000, ttl=MICROSOFT_EMAIL_CACHE_TTL)
+
+
+def hash_access_token(access_token: str) -> bytes:
+    """
+    Returns the key identifying an access token in the account information caches.
+
+    Args:
+        access_token (str): The access token of the account.
+
+    Returns:
+        bytes: The hash of the access token, so tokens are not kept in memory as is.
+    """
+    return hashlib.blake2b(access_token.encode()).digest()
+
+
 def verify_license(access_token: str) -> bool:
     """
     Verifies if there is a license associated with the account.
@@ -41,17 +76,25 @@ def verify_license(access_token: str) -> bool:
     Returns:
         bool: True if a license is associated with the account, False otherwise.
     """
-    graph_endpoint = f"{GRAPH_URL}me/licenseDetails"
+    key = hash_access_token(access_token)
+    with ACCOUNT_CACHE_LOCK:
+        has_license = LICENSE_CACHE.get(key)
+    if has_license is not None:
+        return has_license
+
+    # A single license ID is enough to know whether one exists
+    graph_endpoint = f"{GRAPH_URL}me/licenseDetails?$top=1&$select=id"
     headers = get_headers(access_token)
-    response = requests.get(graph_endpoint, headers=headers)
+    response = SESSION.get(graph_endpoint, headers=headers)
 
-    if response.status_code == 200:
-        data: dict = response.json()
-        if data["value"] == []:
-            return False
-        else:
-            return True
-    return False
+    if response.status_code != 200:
+        return False
+
+    has_license = bool(orjson.loads(response.content).get("value"))
+    with ACCOUNT_CACHE_LOCK:
+        LICENSE_CACHE[key] = has_license
+
+    return has_license
 
 
 def get_email(access_token: str) -> dict:
@@ -68,14 +111,22 @@ def get_email(access_token: str) -> dict:
     if not access_token:
         return {"error": "Access token is missing"}
 
+    key = hash_access_token(access_token)
+    with ACCOUNT_CACHE_LOCK:
+        email = EMAIL_CACHE.get(key)
+    if email is not None:
+        return {"email": email}
+
     try:
         graph_api_endpoint = f"{GRAPH_URL}me"
         headers = get_headers(access_token)
-        response = requests.get(graph_api_endpoint, headers=headers)
-        json_data: dict = response.json()
+        response = SESSION.get(graph_api_endpoint, headers=headers)
+        json_data: dict = orjson.loads(response.content)
 
         if response.status_code == 200:
             email = json_data["mail"]
+            with ACCOUNT_CACHE_LOCK:
+                EMAIL_CACHE[key] = email
             return {"email": email}
         else:
             return {"error": "Failed to get email from Microsoft API"}
@@ -98,24 +149,32 @@ def get_info_contacts(access_token: str) -> list:
         list: A list of dictionaries containing contact names and their email addresses.
     """
     graph_endpoint = f"{GRAPH_URL}me/contacts"
+    params = {"$top": 1000, "$select": "displayName,emailAddresses"}
+    response = None
+    response_data = {}
+    names_emails = []
 
     try:
         headers = get_headers(access_token)
-        params = {"$top": 1000}
-
-        response = requests.get(graph_endpoint, headers=headers, params=params)
-        response.raise_for_status()
-        response_data: dict = response.json()
 
-        contacts: list[dict] = response_data.get("value", [])
-        names_emails = []
-
-        for contact in contacts:
-            name = contact.get("displayName")
-            email_addresses = [
-                email["address"] for email in contact.get("emailAddresses", [])
-            ]
-            names_emails.append({"name": name, "emails": email_addresses})
+        while graph_endpoint:
+            response = SESSION.get(graph_endpoint, headers=headers, params=params)
+            response.raise_for_status()
+            response_data = orjson.loads(response.content)
+
+            names_emails.extend(
+                {
+                    "name": contact.get("displayName"),
+                    "emails": [
+                        email["address"]
+                        for email in contact.get("emailAddresses") or ()
+                    ],
+                }
+                for contact in response_data.get("value", ())
+            )
+            # The next link already carries the query parameters
+            graph_endpoint = response_data.get("@odata.nextLink")
+            params = None
 
         return names_emails
 
@@ -131,14 +190,47 @@ def get_info_contacts(access_token: str) -> list:
         return []
 
 
-@api_view(["GET"])
+def encode_data_url(chunks: Iterator[bytes], mime_type: str = "image/png") -> str:
+    """
+    Encodes binary chunks into a base64 data URL without buffering the whole binary data.
+
+    Args:
+        chunks (Iterator[bytes]): The binary data, chunk by chunk.
+        mime_type (str, optional): The MIME type of the data. Defaults to "image/png".
+
+    Returns:
+        str: The data URL, or an empty string if there is no data.
+    """
+    prefix = f"data:{mime_type};base64,".encode("ascii")
+    data_url = bytearray(prefix)
+    remainder = b""
+
+    for chunk in chunks:
+        chunk = remainder + chunk
+        # base64 encodes groups of 3 bytes: keep the incomplete group for the next chunk
+        cut = len(chunk) - len(chunk) % 3
+        data_url += base64.b64encode(chunk[:cut])
+        remainder = chunk[cut:]
+
+    data_url += base64.b64encode(remainder)
+
+    if len(data_url) == len(prefix):
+        return ""
+    return data_url.decode("ascii")
+
+
+def get_profile_image_cache_key(social_api_id: int) -> str:
+    """Returns the cache key storing the ETag and data URL of the profile image of the given account."""
+    return f"msgraph:photo:{social_api_id}"
+
+
 @subscription(ALLOW_ALL)
-def get_profile_image(request: HttpRequest) -> Response:
+def get_profile_image(request: Request) -> Response:
     """
     Retrieves the profile image URL of the user from Microsoft Graph API.
 
     Args:
-        request (HttpRequest): The HTTP request object containing the user and email headers.
+        request (Request): The HTTP request object containing the user and email headers.
 
     Returns:
         Response: A JSON response containing the profile image URL or an error message.
@@ -153,40 +245,58 @@ def get_profile_image(request: HttpRequest) -> Response:
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    access_token = refresh_access_token(social_api)
+    access_token = cached_access_token(social_api)
 
     try:
         headers = get_headers(access_token)
-        graph_endpoint = f"{GRAPH_URL}me/photo/$value"
-        response = requests.get(graph_endpoint, headers=headers)
-
-        if response.status_code == 200:
-            photo_data = response.content
+        cache_key = get_profile_image_cache_key(social_api.id)
+        cached_photo: dict | None = cache.get(cache_key)
+        if cached_photo:
+            headers["If-None-Match"] = cached_photo["etag"]
 
-            if photo_data:
-                # Convert image to URL
-                photo_data_base64 = base64.b64encode(photo_data).decode("utf-8")
-                photo_url = f"data:image/png;base64,{photo_data_base64}"
+        graph_endpoint = f"{GRAPH_URL}me/photo/$value"
+        with SESSION.get(graph_endpoint, headers=headers, stream=True) as response:
+            if response.status_code == 304:
                 return Response(
-                    {"profileImageUrl": photo_url}, status=status.HTTP_200_OK
+                    {"profileImageUrl": cached_photo["data_url"]},
+                    status=status.HTTP_200_OK,
+                )
+
+            if response.status_code == 200:
+                # Convert image to URL while it is downloaded
+                photo_url = encode_data_url(
+                    response.iter_content(chunk_size=PROFILE_IMAGE_CHUNK_SIZE)
                 )
+
+                etag = response.headers.get("ETag")
+                if photo_url and etag:
+                    cache.set(
+                        cache_key,
+                        {"etag": etag, "data_url": photo_url},
+                        PROFILE_IMAGE_CACHE_TTL,
+                    )
+
+                if photo_url:
+                    return Response(
+                        {"profileImageUrl": photo_url}, status=status.HTTP_200_OK
+                    )
+                else:
+                    return Response(
+                        {"error": "Profile image not found"},
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
+
             else:
+                response_data: dict = response.json()
+                error = response_data.get("error_description", response.reason)
+                LOGGER.error(
+                    f"Failed to retrieve profile image for user ID {user.id}: {error}"
+                )
                 return Response(
-                    {"error": "Profile image not found"},
-                    status=status.HTTP_404_NOT_FOUND,
+                    {"error": f"Failed to retrieve profile image: {error}"},
+                    status=response.status_code,
                 )
 
-        else:
-            response_data: dict = response.json()
-            error = response_data.get("error_description", response.reason)
-            LOGGER.error(
-                f"Failed to retrieve profile image for user ID {user.id}: {error}"
-            )
-            return Response(
-                {"error": f"Failed to retrieve profile image: {error}"},
-                status=response.status_code,
-            )
-
     except Exception as e:
         LOGGER.error(
             f"Failed to retrieve profile image for user ID {user.id}: {str(e)}"
@@ -210,80 +320,102 @@ def set_all_contacts(user: User, email: str):
     )
     start = time.time()
 
+    social_api = get_social_api(user, email)
+
     def refresh_and_get_headers():
-        access_token = refresh_access_token(get_social_api(user, email))
+        access_token = cached_access_token(social_api)
         return get_headers(access_token)
 
     headers = refresh_and_get_headers()
     graph_api_contacts_endpoint = f"{GRAPH_URL}me/contacts"
-    graph_api_messages_endpoint = f"{GRAPH_URL}me/messages?$top=100"
+    # Most recent senders first, in wide pages of minimal documents
+    graph_api_messages_endpoint = (
+        f"{GRAPH_URL}me/messages?$top=999&$select=from&$orderby=receivedDateTime desc"
+    )
 
     try:
-        all_contacts = defaultdict(set)
-        message_count = 0
+        all_contacts: set[tuple[User, str, str, str]] = set()
 
         def make_request(endpoint):
+            # 429 and 5xx responses are retried with backoff by the session
             nonlocal headers
-            for attempt in range(2):
-                response = requests.get(endpoint, headers=headers)
-                if response.status_code == 401 and attempt == 0:
-                    LOGGER.warning("Access token expired, attempting to refresh.")
-                    headers = refresh_and_get_headers()
-                else:
-                    response.raise_for_status()
-                    return response.json()
-
-            LOGGER.error("Request failed after token refresh.")
-            raise Exception("Token refresh failed, cannot continue request.")
-
-        # Part 1: Retrieve contacts from Microsoft Contacts with pagination
-        contacts_endpoint = graph_api_contacts_endpoint
-        while contacts_endpoint:
-            response_data = make_request(contacts_endpoint)
-            contacts: list[dict] = response_data.get("value", [])
-
-            for contact in contacts:
-                name = contact.get("displayName", "")
-                email_address = contact.get("emailAddresses", [{}])[0].get(
-                    "address", ""
-                )
-                provider_id = contact.get("id", "")
-                all_contacts[(user, name, email_address, provider_id)].add(
-                    email_address
+            response = SESSION.get(
+                endpoint, headers=headers, timeout=GRAPH_PAGING_TIMEOUT
+            )
+            if response.status_code == 401:
+                LOGGER.warning("Access token expired, attempting to refresh.")
+                invalidate_access_token(social_api)
+                headers = refresh_and_get_headers()
+                response = SESSION.get(
+                    endpoint, headers=headers, timeout=GRAPH_PAGING_TIMEOUT
                 )
 
-            contacts_endpoint = response_data.get("@odata.nextLink")
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+        def fetch_contacts() -> list[dict]:
+            contacts = []
+            contacts_endpoint = graph_api_contacts_endpoint
+            while contacts_endpoint:
+                response_data = make_request(contacts_endpoint)
+                contacts.extend(response_data.get("value", []))
+                contacts_endpoint = response_data.get("@odata.nextLink")
+            return contacts
+
+        def fetch_messages() -> list[dict]:
+            messages = []
+            messages_endpoint = graph_api_messages_endpoint
+            while messages_endpoint and len(messages) < 5000:
+                data = make_request(messages_endpoint)
+                page: list[dict] = data.get("value", [])
+                messages.extend(page)
+
+                messages_endpoint = data.get("@odata.nextLink")
+                if not page:
+                    LOGGER.info("Fewer than 5,000 messages found; stopping early.")
+                    break
+            return messages[:5000]
 
-        # Part 2: Retrieve contacts from Outlook messages with pagination, up to 5,000 messages
-        messages_endpoint = graph_api_messages_endpoint
-        while messages_endpoint and message_count < 5000:
-            data = make_request(messages_endpoint)
-            messages: list[dict] = data.get("value", [])
+        # The contacts and the messages are paginated independently: fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            contacts_future = executor.submit(fetch_contacts)
+            messages_future = executor.submit(fetch_messages)
+            contacts = contacts_future.result()
+            messages = messages_future.result()
 
-            for message in messages:
-                if message_count >= 5000:
-                    break
-                sender: str = (
-                    message.get("from", {}).get("emailAddress", {}).get("address", "")
-                )
-                if sender:
-                    name = sender.split("@")[0]
-                    if (user, name, sender, "") not in all_contacts:
-                        all_contacts[(user, name, sender, "")].add(sender)
-                message_count += 1
+        senders: list[tuple[str, str, str]] = []
+
+        def save_contact(name: str, email_address: str, provider_id: str):
+            key = (user, name, email_address, provider_id)
+            if key in all_contacts:
+                return
+            all_contacts.add(key)
+            senders.append((name, email_address, provider_id))
 
-            messages_endpoint = data.get("@odata.nextLink")
-            if not messages:
-                LOGGER.info("Fewer than 5,000 messages found; stopping early.")
-                break
+        # Part 1: Save contacts from Microsoft Contacts
+        for contact in contacts:
+            name = contact.get("displayName", "")
+            try:
+                email_address = contact["emailAddresses"][0]["address"]
+            except (KeyError, IndexError, TypeError):
+                email_address = ""
+            provider_id = contact.get("id", "")
+            save_contact(name, email_address, provider_id)
+
+        # Part 2: Save contacts from Outlook messages, up to 5,000 messages
+        seen_senders: set[str] = set()
+        for message in messages:
+            try:
+                sender: str = message["from"]["emailAddress"]["address"]
+            except (KeyError, TypeError):
+                continue
+            if sender and sender not in seen_senders:
+                seen_senders.add(sender)
+                name = sender.split("@", 1)[0]
+                save_contact(name, sender, "")
 
         # Part 3: Save the contacts to the database
-        for contact_info, emails in all_contacts.items():
-            _, name, email_address, provider_id = contact_info
-            for _ in emails:
-                email_processing.save_email_sender(
-                    user, name, email_address, provider_id
-                )
+        email_processing.save_email_senders_bulk(user, senders)
 
         formatted_time = str(datetime.timedelta(seconds=time.time() - start))
         LOGGER.info(
@@ -296,43 +428,122 @@ def set_all_contacts(user: User, email: str):
         )
 
 
+def parse_count_body(body: int | str) -> int:
+    """
+    Parses the body of a $count response returned inside a JSON batch.
+
+    Graph returns non-JSON bodies of batched responses as base64 encoded strings.
+
+    Args:
+        body (int | str): The body of the batched response.
+
+    Returns:
+        int: The count.
+    """
+    if isinstance(body, int):
+        return body
+    if body.isdigit():
+        return int(body)
+    return int(base64.b64decode(body))
+
+
+def count_messages_batch(headers: dict, count_urls: dict[str, str]) -> dict[str, int]:
+    """
+    Counts messages for several filters in a single call to the JSON batching endpoint.
+
+    Args:
+        headers (dict): Headers containing a valid access token.
+        count_urls (dict[str, str]): Statistic name mapped to its $count URL relative to GRAPH_URL.
+
+    Returns:
+        dict[str, int]: Statistic name mapped to its count, 0 if the count failed.
+
+    Raises:
+        requests.HTTPError: If the batch request itself fails.
+    """
+    payload = {
+        "requests": [
+            {"id": key, "method": "GET", "url": f"/{url}"}
+            for key, url in count_urls.items()
+        ]
+    }
+    response = SESSION.post(f"{GRAPH_URL}$batch", headers=headers, json=payload)
+    response.raise_for_status()
+
+    data = {}
+    for batch_response in orjson.loads(response.content).get("responses", []):
+        if batch_response.get("status") != 200:
+            LOGGER.error(
+                f"Failed to count {batch_response['id']}: {batch_response.get('body')}"
+            )
+            data[batch_response["id"]] = 0
+        else:
+            data[batch_response["id"]] = parse_count_body(batch_response["body"])
+
+    return data
+
+
+def count_messages_concurrently(
+    headers: dict, count_urls: dict[str, str]
+) -> dict[str, int]:
+    """
+    Counts messages for several filters with concurrent requests.
+
+    Args:
+        headers (dict): Headers containing a valid access token.
+        count_urls (dict[str, str]): Statistic name mapped to its $count URL relative to GRAPH_URL.
+
+    Returns:
+        dict[str, int]: Statistic name mapped to its count.
+    """
+
+    def count(url: str) -> int:
+        response = SESSION.get(f"{GRAPH_URL}{url}", headers=headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    with ThreadPoolExecutor(max_workers=len(count_urls)) as executor:
+        counts = executor.map(count, count_urls.values())
+
+    return dict(zip(count_urls, counts))
+
+
 def get_data(social_api: SocialAPI) -> dict:
     """
     Retrieve email statistics for a given Microsoft social API.
 
+    All the counts are requested in a single call to the JSON batching endpoint,
+    falling back to concurrent requests if batching fails.
+
     Args:
         social_api (SocialAPI): The social API instance for the user.
 
     Returns:
         dict: A dictionary containing email statistics.
     """
-    access_token = refresh_access_token(social_api)
+    access_token = cached_access_token(social_api)
     headers = get_headers(access_token)
 
-    # Use the Microsoft Graph API to get counts directly
-    num_emails_received = requests.get(
-        f"{GRAPH_URL}/me/messages/$count", headers=headers
-    ).json()
-    num_emails_read = requests.get(
-        f"{GRAPH_URL}/me/messages/$count?$filter=isRead eq true", headers=headers
-    ).json()
-    num_emails_archived = requests.get(
-        f"{GRAPH_URL}/me/messages/$count?$filter=categories/any(c:c eq 'archive')",
-        headers=headers,
-    ).json()
-    num_emails_starred = requests.get(
-        f"{GRAPH_URL}/me/messages/$count?$filter=categories/any(c:c eq 'starred')",
-        headers=headers,
-    ).json()
-    num_emails_sent = requests.get(
-        f"{GRAPH_URL}/me/messages/$count?$filter=categories/any(c:c eq 'sent')",
-        headers=headers,
-    ).json()
-
-    return {
-        "num_emails_received": num_emails_received,
-        "num_emails_read": num_emails_read,
-        "num_emails_archived": num_emails_archived,
-        "num_emails_starred": num_emails_starred,
-        "num_emails_sent": num_emails_sent,
+    count_filters = {
+        "num_emails_received": None,
+        "num_emails_read": "isRead eq true",
+        "num_emails_archived": "categories/any(c:c eq 'archive')",
+        "num_emails_starred": "categories/any(c:c eq 'starred')",
+        "num_emails_sent": "categories/any(c:c eq 'sent')",
     }
+    count_urls = {
+        key: (
+            f"me/messages/$count?$filter={quote(count_filter)}"
+            if count_filter
+            else "me/messages/$count"
+        )
+        for key, count_filter in count_filters.items()
+    }
+
+    try:
+        return count_messages_batch(headers, count_urls)
+    except Exception as e:
+        LOGGER.warning(
+            f"Batched statistics failed for social API ID {social_api.id}, counting separately: {str(e)}"
+        )
+        return count_messages_concurrently(headers, count_urls)
@@ -6,13 +6,11 @@ Endpoints:
 - ✅ synchronize: Synchronizes Aomail database with Microsoft servers.
 """
 
-import json
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from django.http import HttpRequest
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.decorators import api_view
 from aomail.utils.security import subscription
 from aomail.constants import (
     ALLOWED_PLANS,
@@ -31,19 +29,18 @@ from aomail.email_providers.microsoft.webhook import (
 LOGGER = logging.getLogger(__name__)
 
 
-@api_view(["POST"])
 @subscription(ALLOWED_PLANS)
-def check_connectivity(request: HttpRequest) -> Response:
+def check_connectivity(request: Request) -> Response:
     """
     Checks the connectivity status of a user's linked email account.
 
     Args:
-        request (HttpRequest): The HTTP request object containing the user's email.
+        request (Request): The HTTP request object containing the user's email.
 
     Returns:
         Response: Contains the token validity status and the number of missed emails.
     """
-    parameters: dict = json.loads(request.body)
+    parameters: dict = request.data
     email = parameters["email"]
     user = request.user
     check_and_resubscribe_to_missing_resources(user, email)
@@ -75,20 +72,19 @@ def check_connectivity(request: HttpRequest) -> Response:
     )
 
 
-@api_view(["POST"])
 @subscription(ALLOWED_PLANS)
-def synchronize(request: HttpRequest) -> Response:
+def synchronize(request: Request) -> Response:
     """
     Synchronizes Aomail DB with Microsoft Graph API by fetching and processing email IDs.
 
     Args:
-        request (HttpRequest): The HTTP request object containing the user's email and
+        request (Request): The HTTP request object containing the user's email and
                                the number of missed emails.
 
     Returns:
         Response: Contains the number of emails processed from the user's inbox.
     """
-    parameters: dict = json.loads(request.body)
+    parameters: dict = request.data
     email = parameters["email"]
     nb_missed_emails = parameters["nbMissedEmails"]
     user = request.user
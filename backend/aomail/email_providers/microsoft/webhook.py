@@ -8,11 +8,15 @@ Endpoints:
 """
 
 import datetime
-import json
+import hmac
 import logging
 import threading
-import requests
+import orjson
+from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
@@ -20,22 +24,29 @@ from rest_framework import status
 from rest_framework.views import View
 from rest_framework.response import Response
 from aomail.email_providers.microsoft.authentication import (
+    SESSION,
+    get_cached_access_token,
     get_headers,
     get_social_api,
-    refresh_access_token,
 )
 from aomail.utils import email_processing
+from aomail.utils.security import is_user_blocked
 from aomail.constants import (
     BASE_URL,
+    CONTACTS_BULK_BATCH_SIZE,
+    GRAPH_BATCH_MAX_REQUESTS,
     GRAPH_URL,
     MICROSOFT_CLIENT_STATE,
+    MICROSOFT_CONTACT_NOTIFICATION_WINDOW,
+    MICROSOFT_EMAIL_NOTIFICATION_WINDOW,
+    MICROSOFT_LIFECYCLE_DEDUPE_WINDOW,
+    MICROSOFT_RESUBSCRIBE_LOCK_TTL,
+    MICROSOFT_WEBHOOK_MAX_WORKERS,
 )
 from aomail.models import (
     Contact,
     Email,
     MicrosoftListener,
-    SocialAPI,
-    Subscription,
 )
 from aomail.email_providers.utils import email_to_db
 from aomail.email_providers.microsoft import webhook as webhook_microsoft
@@ -45,6 +56,229 @@ from aomail.email_providers.microsoft import webhook as webhook_microsoft
 LOGGER = logging.getLogger(__name__)
 
 
+######################## SUBSCRIPTIONS ########################
+UTC = datetime.timezone.utc
+LIFECYCLE_NOTIFICATION_URL = (
+    f"{BASE_URL}aomail/microsoft/receive_subscription_notifications/"
+)
+# Static parts of the subscription bodies, only the expiration date changes between calls
+EMAIL_SUBSCRIPTION_TEMPLATE = {
+    "changeType": "created,deleted",
+    "notificationUrl": f"{BASE_URL}aomail/microsoft/receive_mail_notifications/",
+    "lifecycleNotificationUrl": LIFECYCLE_NOTIFICATION_URL,
+    "resource": "me/mailFolders('inbox')/messages",
+    "clientState": MICROSOFT_CLIENT_STATE,
+}
+CONTACT_SUBSCRIPTION_TEMPLATE = {
+    "changeType": "created,updated,deleted",
+    "notificationUrl": f"{BASE_URL}aomail/microsoft/receive_contact_notifications/",
+    "lifecycleNotificationUrl": LIFECYCLE_NOTIFICATION_URL,
+    "resource": "me/contacts",
+    "clientState": MICROSOFT_CLIENT_STATE,
+}
+
+
+######################## NOTIFICATIONS PROCESSING ########################
+EXECUTOR = ThreadPoolExecutor(max_workers=MICROSOFT_WEBHOOK_MAX_WORKERS)
+PENDING_EMAILS_LOCK = threading.Lock()
+# (user ID, email address) -> email IDs (ordered, deduplicated), waiting to be processed
+PENDING_EMAILS: dict[tuple[int, str], dict[str, None]] = {}
+PENDING_CONTACTS_LOCK = threading.Lock()
+# (user ID, email address) -> contact ID -> change type, waiting to be processed
+PENDING_CONTACTS: dict[tuple[int, str], dict[str, str]] = {}
+
+
+def submit_email_processing(user: User, email: str, email_id: str):
+    """
+    Queue a notified email for processing.
+
+    Notifications of the same mailbox received within MICROSOFT_EMAIL_NOTIFICATION_WINDOW are processed together,
+    and an email notified several times is processed once.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+        email_id (str): The Microsoft ID of the notified email.
+    """
+    key = (user.id, email)
+    with PENDING_EMAILS_LOCK:
+        pending = PENDING_EMAILS.get(key)
+        if pending is not None:
+            pending[email_id] = None
+            return
+        PENDING_EMAILS[key] = {email_id: None}
+
+    timer = threading.Timer(
+        MICROSOFT_EMAIL_NOTIFICATION_WINDOW,
+        EXECUTOR.submit,
+        args=(process_email_notifications, user, email),
+    )
+    timer.daemon = True
+    timer.start()
+
+
+def process_email_notifications(user: User, email: str):
+    """
+    Save the queued emails of a mailbox to the database.
+
+    Runs in the worker pool so the webhook can acknowledge Microsoft immediately.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+    """
+    close_old_connections()
+    with PENDING_EMAILS_LOCK:
+        email_ids = list(PENDING_EMAILS.pop((user.id, email), {}))
+
+    try:
+        social_api = get_social_api(user, email)
+        existing_ids = set(
+            Email.objects.filter(user=user, provider_id__in=email_ids).values_list(
+                "provider_id", flat=True
+            )
+        )
+
+        for email_id in email_ids:
+            if email_id in existing_ids:
+                continue
+            try:
+                email_to_db(social_api, email_id)
+            except Exception as e:
+                LOGGER.error(
+                    f"Error processing the Microsoft notification for email ID {email_id}: {str(e)}"
+                )
+    except Exception as e:
+        LOGGER.error(
+            f"Error processing the Microsoft notifications for user ID {user.id}: {str(e)}"
+        )
+    finally:
+        close_old_connections()
+
+
+def submit_contact_processing(
+    user: User, email: str, id_contact: str, change_type: str
+):
+    """
+    Queue a created or updated contact for processing.
+
+    Microsoft sends one notification per contact, often in bursts.
+    Notifications of the same mailbox received within MICROSOFT_CONTACT_NOTIFICATION_WINDOW are processed together.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+        id_contact (str): The Microsoft ID of the notified contact.
+        change_type (str): The type of change, either "created" or "updated".
+    """
+    key = (user.id, email)
+    with PENDING_CONTACTS_LOCK:
+        pending = PENDING_CONTACTS.get(key)
+        if pending is not None:
+            # A contact created then updated within the window still has to be created
+            pending.setdefault(id_contact, change_type)
+            return
+        PENDING_CONTACTS[key] = {id_contact: change_type}
+
+    timer = threading.Timer(
+        MICROSOFT_CONTACT_NOTIFICATION_WINDOW,
+        EXECUTOR.submit,
+        args=(process_contact_notifications, user, email),
+    )
+    timer.daemon = True
+    timer.start()
+
+
+def fetch_contacts_batch(headers: dict, contact_ids: list[str]) -> dict[str, dict]:
+    """
+    Fetches several contacts with calls to the JSON batching endpoint.
+
+    Args:
+        headers (dict): Headers containing a valid access token.
+        contact_ids (list[str]): The Microsoft IDs of the contacts.
+
+    Returns:
+        dict[str, dict]: Contact ID mapped to its data, for the contacts successfully retrieved.
+    """
+    contacts = {}
+    for i in range(0, len(contact_ids), GRAPH_BATCH_MAX_REQUESTS):
+        payload = {
+            "requests": [
+                {
+                    "id": id_contact,
+                    "method": "GET",
+                    "url": f"/me/contacts/{id_contact}?$select=displayName,emailAddresses",
+                }
+                for id_contact in contact_ids[i : i + GRAPH_BATCH_MAX_REQUESTS]
+            ]
+        }
+        response = SESSION.post(f"{GRAPH_URL}$batch", headers=headers, json=payload)
+        if response.status_code != 200:
+            LOGGER.error(f"Failed to retrieve contacts data: {response.reason}")
+            continue
+
+        for batch_response in response.json().get("responses", []):
+            if batch_response.get("status") == 200:
+                contacts[batch_response["id"]] = batch_response["body"]
+            else:
+                LOGGER.error(
+                    f"Failed to retrieve contact {batch_response['id']}: {batch_response.get('body')}"
+                )
+
+    return contacts
+
+
+def process_contact_notifications(user: User, email: str):
+    """
+    Save the queued created and updated contacts of a mailbox to the database.
+
+    Runs in the worker pool so the webhook can acknowledge Microsoft immediately.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+    """
+    close_old_connections()
+    with PENDING_CONTACTS_LOCK:
+        changes = PENDING_CONTACTS.pop((user.id, email), {})
+
+    try:
+        access_token = get_cached_access_token(user, email)
+        headers = get_headers(access_token)
+        contacts = fetch_contacts_batch(headers, list(changes))
+
+        created_contacts = []
+        updated_contacts = {}
+        for id_contact, contact_data in contacts.items():
+            name = contact_data.get("displayName")
+            email_addresses = contact_data.get("emailAddresses") or [{}]
+            email_address = email_addresses[0].get("address")
+
+            if changes[id_contact] == "created":
+                created_contacts.append((name, email_address, id_contact))
+            else:
+                updated_contacts[id_contact] = (name, email_address)
+
+        email_processing.save_email_senders_bulk(user, created_contacts)
+
+        contacts_to_update = list(
+            Contact.objects.filter(user=user, provider_id__in=updated_contacts)
+        )
+        for contact in contacts_to_update:
+            contact.username, contact.email = updated_contacts[contact.provider_id]
+        with transaction.atomic():
+            Contact.objects.bulk_update(
+                contacts_to_update,
+                ["username", "email"],
+                batch_size=CONTACTS_BULK_BATCH_SIZE,
+            )
+
+    except Exception as e:
+        LOGGER.error(f"An error occurred in handling contact notifications: {str(e)}")
+    finally:
+        close_old_connections()
+
+
 def calculate_expiration_date(days=0, hours=0, minutes=0) -> str:
     """
     Returns the expiration date as a string formatted in UTC.
@@ -57,25 +291,147 @@ def calculate_expiration_date(days=0, hours=0, minutes=0) -> str:
     Returns:
         str: Formatted expiration date string in UTC.
     """
-    expiration_date = datetime.datetime.now() + datetime.timedelta(
+    date = datetime.datetime.now(UTC) + datetime.timedelta(
         days=days, hours=hours, minutes=minutes
     )
-    expiration_date_str = expiration_date.strftime("%Y-%m-%dT%H:%M:%S.0000000Z")
-    return expiration_date_str
+    return f"{date.year:04d}-{date.month:02d}-{date.day:02d}T{date.hour:02d}:{date.minute:02d}:{date.second:02d}.0000000Z"
+
+
+def get_email_subscription_body() -> dict:
+    """Returns the body creating a subscription to the inbox messages."""
+    return {
+        **EMAIL_SUBSCRIPTION_TEMPLATE,
+        "expirationDateTime": calculate_expiration_date(minutes=4230),
+    }
+
+
+def get_contact_subscription_body() -> dict:
+    """Returns the body creating a subscription to the contacts."""
+    return {
+        **CONTACT_SUBSCRIPTION_TEMPLATE,
+        "expirationDateTime": calculate_expiration_date(minutes=4230),
+    }
+
+
+def subscribe_to_notifications_batch(
+    user: User, email: str, headers: dict, subscription_bodies: list[dict]
+) -> bool:
+    """
+    Create several subscriptions in a single call to the JSON batching endpoint.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+        headers (dict): Headers containing a valid access token.
+        subscription_bodies (list[dict]): The bodies of the subscriptions to create.
+
+    Returns:
+        bool: True if every subscription was created, False otherwise.
+    """
+    payload = {
+        "requests": [
+            {
+                "id": str(i),
+                "method": "POST",
+                "url": "/subscriptions",
+                "body": subscription_body,
+                "headers": {"Content-Type": "application/json"},
+            }
+            for i, subscription_body in enumerate(subscription_bodies)
+        ]
+    }
+
+    try:
+        response = SESSION.post(f"{GRAPH_URL}$batch", headers=headers, json=payload)
+        response.raise_for_status()
+
+        listeners = []
+        for batch_response in response.json().get("responses", []):
+            if batch_response.get("status") == 201:
+                listeners.append(
+                    MicrosoftListener(
+                        subscription_id=batch_response["body"]["id"],
+                        user=user,
+                        email=email,
+                    )
+                )
+            else:
+                LOGGER.error(
+                    f"Failed to subscribe to Microsoft notifications for user with ID: {user.id} and email {email}: {batch_response.get('body')}"
+                )
+
+        with transaction.atomic():
+            MicrosoftListener.objects.bulk_create(listeners)
+        LOGGER.info(
+            f"Successfully created {len(listeners)} Microsoft subscriptions for user ID: {user.id}"
+        )
+        return len(listeners) == len(subscription_bodies)
+
+    except Exception as e:
+        LOGGER.error(
+            f"An error occurred while subscribing to Microsoft notifications for user ID: {user.id}: {str(e)}"
+        )
+        return False
+
+
+def subscribe_to_all_notifications(user: User, email: str) -> bool:
+    """
+    Subscribe the user to both email and contact notifications via Microsoft Graph API.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+
+    Returns:
+        bool: True if both subscriptions were successful, False otherwise.
+    """
+    LOGGER.info(
+        f"Initiating subscription to Microsoft notifications for user ID: {user.id} with email: {email}"
+    )
+    access_token = get_cached_access_token(user, email)
+    headers = get_headers(access_token)
+    return subscribe_to_notifications_batch(
+        user,
+        email,
+        headers,
+        [get_email_subscription_body(), get_contact_subscription_body()],
+    )
 
 
 def check_and_resubscribe_to_missing_resources(user: User, email: str):
     """
     Check all subscriptions for the given user and resubscribe to missing resources (email or contacts).
 
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+    """
+    # Duplicated lifecycle events must not create duplicated subscriptions
+    lock_key = f"ms_resub:{user.id}:{email}"
+    if not cache.add(lock_key, 1, MICROSOFT_RESUBSCRIBE_LOCK_TTL):
+        LOGGER.info(
+            f"Resubscription already in progress for user ID: {user.id} and email: {email}"
+        )
+        return
+
+    try:
+        resubscribe_to_missing_resources(user, email)
+    finally:
+        cache.delete(lock_key)
+
+
+def resubscribe_to_missing_resources(user: User, email: str):
+    """
+    Resubscribe to the resources (email or contacts) without an active subscription.
+
     Args:
         user (User): The Django User object.
         email (str): The email address of the user.
     """
     url = f"{GRAPH_URL}subscriptions"
-    access_token = refresh_access_token(get_social_api(user, email))
+    access_token = get_cached_access_token(user, email)
     headers = get_headers(access_token)
-    response = requests.get(url, headers=headers)
+    response = SESSION.get(url, headers=headers)
 
     if response.status_code == 200:
         subscription_data = response.json()
@@ -91,10 +447,13 @@ def check_and_resubscribe_to_missing_resources(user: User, email: str):
             if "me/contacts" in resource:
                 active_contact_subscription = True
 
-        if not active_email_subscription:
+        if not active_email_subscription and not active_contact_subscription:
+            subscribe_to_all_notifications(user, email)
+
+        elif not active_email_subscription:
             webhook_microsoft.subscribe_to_email_notifications(user, email)
 
-        if not active_contact_subscription:
+        elif not active_contact_subscription:
             webhook_microsoft.subscribe_to_contact_notifications(user, email)
 
     else:
@@ -117,24 +476,13 @@ def subscribe_to_email_notifications(user: User, email: str) -> bool:
     LOGGER.info(
         f"Initiating subscription to Microsoft email notifications for user ID: {user.id} with email: {email}"
     )
-    access_token = refresh_access_token(get_social_api(user, email))
-    notification_url = f"{BASE_URL}aomail/microsoft/receive_mail_notifications/"
-    lifecycle_notification_url = (
-        f"{BASE_URL}aomail/microsoft/receive_subscription_notifications/"
-    )
-    subscription_body = {
-        "changeType": "created,deleted",
-        "notificationUrl": notification_url,
-        "lifecycleNotificationUrl": lifecycle_notification_url,
-        "resource": "me/mailFolders('inbox')/messages",
-        "expirationDateTime": calculate_expiration_date(minutes=4230),
-        "clientState": MICROSOFT_CLIENT_STATE,
-    }
+    access_token = get_cached_access_token(user, email)
+    subscription_body = get_email_subscription_body()
     url = f"{GRAPH_URL}subscriptions"
     headers = get_headers(access_token)
 
     try:
-        response = requests.post(url, json=subscription_body, headers=headers)
+        response = SESSION.post(url, json=subscription_body, headers=headers)
 
         if not status.is_success(response.status_code):
             LOGGER.error(
@@ -144,12 +492,9 @@ def subscribe_to_email_notifications(user: User, email: str) -> bool:
 
         response_data = response.json()
 
-        social_api = SocialAPI.objects.get(user=user, email=email)
-        subscription_id = response_data["id"]
-
         MicrosoftListener.objects.create(
-            subscription_id=subscription_id,
-            user=social_api.user,
+            subscription_id=response_data["id"],
+            user_id=user.id,
             email=email,
         )
 
@@ -185,32 +530,18 @@ def subscribe_to_contact_notifications(user: User, email: str) -> bool:
     LOGGER.info(
         f"Initiating subscription to Microsoft contact notifications for user ID: {user.id} with email: {email}"
     )
-    access_token = refresh_access_token(get_social_api(user, email))
-    notification_url = f"{BASE_URL}aomail/microsoft/receive_contact_notifications/"
-    lifecycle_notification_url = (
-        f"{BASE_URL}aomail/microsoft/receive_subscription_notifications/"
-    )
-    subscription_body = {
-        "changeType": "created,updated,deleted",
-        "notificationUrl": notification_url,
-        "lifecycleNotificationUrl": lifecycle_notification_url,
-        "resource": "me/contacts",
-        "expirationDateTime": calculate_expiration_date(minutes=4230),
-        "clientState": MICROSOFT_CLIENT_STATE,
-    }
+    access_token = get_cached_access_token(user, email)
+    subscription_body = get_contact_subscription_body()
     url = f"{GRAPH_URL}subscriptions"
     headers = get_headers(access_token)
 
     try:
-        response = requests.post(url, json=subscription_body, headers=headers)
+        response = SESSION.post(url, json=subscription_body, headers=headers)
         response_data = response.json()
 
-        social_api = SocialAPI.objects.get(user=user, email=email)
-        subscription_id = response_data["id"]
-
         MicrosoftListener.objects.create(
-            subscription_id=subscription_id,
-            user=social_api.user,
+            subscription_id=response_data["id"],
+            user_id=user.id,
             email=email,
         )
 
@@ -247,12 +578,12 @@ def delete_subscription(user: User, email: str, subscription_id: str) -> bool:
     LOGGER.info(
         f"Initiating Microsoft unsubscription for user ID: {user.id} and subscription ID: {subscription_id}"
     )
-    access_token = refresh_access_token(get_social_api(user, email))
+    access_token = get_cached_access_token(user, email)
     headers = get_headers(access_token)
     url = f"{GRAPH_URL}subscriptions/{subscription_id}"
 
     try:
-        response = requests.delete(url, headers=headers)
+        response = SESSION.delete(url, headers=headers)
 
         if response.status_code != 204:
             LOGGER.error(
@@ -282,14 +613,14 @@ def renew_subscription(user: User, email: str, subscription_id: str):
     LOGGER.info(
         f"Initiating renewal of Microsoft subscription for user ID: {user.id} and subscription ID: {subscription_id}"
     )
-    access_token = refresh_access_token(get_social_api(user, email))
+    access_token = get_cached_access_token(user, email)
     headers = get_headers(access_token)
     url = f"{GRAPH_URL}subscriptions/{subscription_id}"
     new_expiration_date = calculate_expiration_date(minutes=4_230)
 
     try:
         payload = {"expirationDateTime": new_expiration_date}
-        response = requests.patch(url, headers=headers, json=payload)
+        response = SESSION.patch(url, headers=headers, json=payload)
 
         if response.status_code == 200:
             LOGGER.info(
@@ -306,6 +637,64 @@ def renew_subscription(user: User, email: str, subscription_id: str):
         )
 
 
+def renew_subscriptions_batch(
+    user: User, email: str, subscription_ids: list[str]
+) -> int:
+    """
+    Renew several Microsoft subscriptions of an account with calls to the JSON batching endpoint.
+
+    Falls back to renewing the subscriptions one by one if a batch request fails.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+        subscription_ids (list[str]): The IDs of the subscriptions to renew.
+
+    Returns:
+        int: The number of subscriptions renewed by the batch requests.
+    """
+    access_token = get_cached_access_token(user, email)
+    headers = get_headers(access_token)
+    new_expiration_date = calculate_expiration_date(minutes=4_230)
+    nb_renewed = 0
+
+    for i in range(0, len(subscription_ids), GRAPH_BATCH_MAX_REQUESTS):
+        batch_ids = subscription_ids[i : i + GRAPH_BATCH_MAX_REQUESTS]
+        payload = {
+            "requests": [
+                {
+                    "id": subscription_id,
+                    "method": "PATCH",
+                    "url": f"/subscriptions/{subscription_id}",
+                    "body": {"expirationDateTime": new_expiration_date},
+                    "headers": {"Content-Type": "application/json"},
+                }
+                for subscription_id in batch_ids
+            ]
+        }
+
+        try:
+            response = SESSION.post(f"{GRAPH_URL}$batch", headers=headers, json=payload)
+            response.raise_for_status()
+        except Exception as e:
+            LOGGER.error(
+                f"Failed to renew the subscriptions of user ID: {user.id} in batch: {str(e)}"
+            )
+            for subscription_id in batch_ids:
+                renew_subscription(user, email, subscription_id)
+            continue
+
+        for batch_response in response.json().get("responses", []):
+            if batch_response.get("status") == 200:
+                nb_renewed += 1
+            else:
+                LOGGER.error(
+                    f"Failed to renew the subscription {batch_response['id']} for user ID: {user.id}: {batch_response.get('body')}"
+                )
+
+    return nb_renewed
+
+
 def reauthorize_subscription(user: User, email: str, subscription_id: str):
     """
     Reauthorize a Microsoft subscription.
@@ -318,12 +707,12 @@ def reauthorize_subscription(user: User, email: str, subscription_id: str):
     LOGGER.info(
         f"Initiating reauthorization of Microsoft subscription for user ID: {user.id} and subscription ID: {subscription_id}"
     )
-    access_token = refresh_access_token(get_social_api(user, email))
+    access_token = get_cached_access_token(user, email)
     headers = get_headers(access_token)
 
     try:
         url = f"{GRAPH_URL}subscriptions/{subscription_id}/reauthorize"
-        response = requests.post(url, headers=headers)
+        response = SESSION.post(url, headers=headers)
 
         if response.status_code == 200:
             LOGGER.info(
@@ -340,6 +729,67 @@ def reauthorize_subscription(user: User, email: str, subscription_id: str):
         )
 
 
+def resubscribe_removed_subscription(user: User, email: str, subscription_id: str):
+    """
+    Resubscribe to the resources of a removed subscription, or of one that missed notifications.
+
+    Args:
+        user (User): The Django User object.
+        email (str): The email address of the user.
+        subscription_id (str): The ID of the removed subscription.
+    """
+    check_and_resubscribe_to_missing_resources(user, email)
+
+
+# lifecycle event -> handler called with the user, the email address and the subscription ID
+LIFECYCLE_HANDLERS = {
+    "reauthorizationRequired": reauthorize_subscription,
+    "subscriptionRemoved": resubscribe_removed_subscription,
+    "missed": resubscribe_removed_subscription,
+}
+
+
+def is_client_state_valid(notification: dict) -> bool:
+    """
+    Checks the clientState of a notification against the secret sent when subscribing.
+
+    Args:
+        notification (dict): A notification sent by Microsoft Graph API.
+
+    Returns:
+        bool: True if the notification comes from one of our subscriptions, False otherwise.
+    """
+    client_state = notification.get("clientState")
+    if not client_state or not MICROSOFT_CLIENT_STATE:
+        return False
+    # Constant-time comparison so the secret cannot be guessed from response times
+    return hmac.compare_digest(client_state.encode(), MICROSOFT_CLIENT_STATE.encode())
+
+
+def answer_validation_handshake(view):
+    """
+    Wraps a notification view to answer the validation handshake of Microsoft Graph API before dispatching.
+
+    Microsoft validates a notification URL by sending a validationToken that must be echoed back as plain text.
+
+    Args:
+        view: The view handling the notifications.
+
+    Returns:
+        The wrapped view.
+    """
+
+    @csrf_exempt
+    @wraps(view)
+    def wrapped_view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        validation_token = request.GET.get("validationToken")
+        if validation_token:
+            return HttpResponse(validation_token, content_type="text/plain")
+        return view(request, *args, **kwargs)
+
+    return wrapped_view
+
+
 @method_decorator(csrf_exempt, name="dispatch")
 class MicrosoftSubscriptionNotification(View):
     """
@@ -361,71 +811,76 @@ class MicrosoftSubscriptionNotification(View):
 
         Returns:
             Response: JSON response indicating the status of the notification processing.
-                Returns a validation token if present or an error response for any issues encountered.
+                Returns an error response for any issues encountered.
         """
-        validation_token = request.GET.get("validationToken")
-        if validation_token:
-            return HttpResponse(validation_token, content_type="text/plain")
-
         try:
-            subscription_data = json.loads(request.body.decode("utf-8"))
+            subscription_data = orjson.loads(request.body)
 
-            if subscription_data["value"][0]["clientState"] == MICROSOFT_CLIENT_STATE:
+            if is_client_state_valid(subscription_data["value"][0]):
                 lifecycle_event = subscription_data["value"][0]["lifecycleEvent"]
                 expiration_date_str = subscription_data["value"][0][
                     "subscriptionExpirationDateTime"
                 ]
-                subscription_expiration_date = datetime.datetime.fromisoformat(
-                    expiration_date_str
-                )
                 subscription_id = subscription_data["value"][0]["subscriptionId"]
-                microsoft_listener = MicrosoftListener.objects.filter(
-                    subscription_id=subscription_id
+
+                # Microsoft often delivers the same lifecycle event several times
+                if not cache.add(
+                    f"ms_lifecycle:{subscription_id}:{lifecycle_event}",
+                    1,
+                    MICROSOFT_LIFECYCLE_DEDUPE_WINDOW,
+                ):
+                    return JsonResponse(
+                        {"status": "Notification received"},
+                        status=status.HTTP_202_ACCEPTED,
+                    )
+
+                listener = (
+                    MicrosoftListener.objects.select_related("user")
+                    .only("subscription_id", "email", "user__id")
+                    .filter(subscription_id=subscription_id)
+                    .first()
                 )
-                current_datetime = datetime.datetime.now(datetime.timezone.utc)
-                subscription = Subscription.objects.get(
-                    user=microsoft_listener.first().user
+                if listener is None:
+                    return JsonResponse(
+                        {"status": "Notification received"},
+                        status=status.HTTP_202_ACCEPTED,
+                    )
+
+                # Only parsed for notifications that are actually handled
+                subscription_expiration_date = datetime.datetime.fromisoformat(
+                    expiration_date_str
                 )
+                current_datetime = datetime.datetime.now(UTC)
 
-                if not microsoft_listener.exists():
-                    pass
-                elif subscription.is_block:
+                if is_user_blocked(listener.user_id):
                     LOGGER.info(
-                        f"User with email: {microsoft_listener.first().email} is blocked. Unsubscribing user from subscription {subscription_id}."
+                        f"User with email: {listener.email} is blocked. Unsubscribing user from subscription {subscription_id}."
                     )
                     delete_subscription(
-                        microsoft_listener.first().user,
-                        microsoft_listener.first().email,
-                        microsoft_listener.first().subscription_id,
+                        listener.user,
+                        listener.email,
+                        listener.subscription_id,
                     )
                 elif (
                     subscription_expiration_date - current_datetime
                     <= datetime.timedelta(minutes=15)
                 ):
                     renew_subscription(
-                        microsoft_listener.first().user,
-                        microsoft_listener.first().email,
+                        listener.user,
+                        listener.email,
                         subscription_id,
                     )
-                elif lifecycle_event == "reauthorizationRequired":
-                    reauthorize_subscription(
-                        microsoft_listener.first().user,
-                        microsoft_listener.first().email,
+                elif lifecycle_event in LIFECYCLE_HANDLERS:
+                    if lifecycle_event in ("subscriptionRemoved", "missed"):
+                        LOGGER.error(
+                            f"{lifecycle_event}: current time: {current_datetime}, expiration time: {expiration_date_str}"
+                        )
+                    LIFECYCLE_HANDLERS[lifecycle_event](
+                        listener.user,
+                        listener.email,
                         subscription_id,
                     )
 
-                elif (
-                    lifecycle_event == "subscriptionRemoved"
-                    or lifecycle_event == "missed"
-                ):
-                    LOGGER.error(
-                        f"{lifecycle_event}: current time: {current_datetime}, expiration time: {expiration_date_str}"
-                    )
-                    check_and_resubscribe_to_missing_resources(
-                        microsoft_listener.first().user,
-                        microsoft_listener.first().email,
-                    )
-
             return JsonResponse(
                 {"status": "Notification received"}, status=status.HTTP_202_ACCEPTED
             )
@@ -461,51 +916,50 @@ class MicrosoftEmailNotification(View):
 
         Returns:
             Response: JSON response indicating the status of the notification processing.
-                Returns a validation token if present, or an error response for any issues encountered.
+                Returns an error response for any issues encountered.
         """
-        validation_token = request.GET.get("validationToken")
-        if validation_token:
-            return HttpResponse(validation_token, content_type="text/plain")
-
         try:
             LOGGER.info(
                 "Email notification received from Microsoft Graph API. Starting email processing"
             )
 
-            email_data = json.loads(request.body.decode("utf-8"))
+            email_data = orjson.loads(request.body)
 
-            if email_data["value"][0]["clientState"] == MICROSOFT_CLIENT_STATE:
+            if is_client_state_valid(email_data["value"][0]):
                 change_type = email_data["value"][0]["changeType"]
                 email_id = email_data["value"][0]["resourceData"]["id"]
                 subscription_id = email_data["value"][0]["subscriptionId"]
-                microsoft_listener = MicrosoftListener.objects.filter(
-                    subscription_id=subscription_id
-                )
-                subscription = Subscription.objects.get(
-                    user=microsoft_listener.first().user
+                listener = (
+                    MicrosoftListener.objects.select_related("user")
+                    .only("subscription_id", "email", "user__id")
+                    .filter(subscription_id=subscription_id)
+                    .first()
                 )
+                if listener is None:
+                    return JsonResponse(
+                        {"status": "Notification received"},
+                        status=status.HTTP_202_ACCEPTED,
+                    )
 
-                if not microsoft_listener.exists():
-                    pass
-                elif subscription.is_block:
+                if is_user_blocked(listener.user_id):
                     LOGGER.info(
-                        f"User with email: {microsoft_listener.first().email} is blocked. Unsubscribing user from subscription {subscription_id}."
+                        f"User with email: {listener.email} is blocked. Unsubscribing user from subscription {subscription_id}."
                     )
                     delete_subscription(
-                        microsoft_listener.first().user,
-                        microsoft_listener.first().email,
-                        microsoft_listener.first().subscription_id,
+                        listener.user,
+                        listener.email,
+                        listener.subscription_id,
                     )
                 elif change_type == "deleted":
-                    Email.objects.get(provider_id=email_id).delete()
+                    Email.objects.filter(
+                        user_id=listener.user_id, provider_id=email_id
+                    ).delete()
                 else:
-                    social_api = get_social_api(
-                        microsoft_listener.first().user,
-                        microsoft_listener.first().email,
+                    submit_email_processing(
+                        listener.user,
+                        listener.email,
+                        email_id,
                     )
-                    threading.Thread(
-                        target=email_to_db, args=(social_api, email_id)
-                    ).start()
 
                 return JsonResponse(
                     {"status": "Notification received"}, status=status.HTTP_202_ACCEPTED
@@ -547,95 +1001,51 @@ class MicrosoftContactNotification(View):
 
         Returns:
             Response: JSON response indicating the status of the notification processing.
-                Returns a validation token if present, or an error response for any issues encountered.
+                Returns an error response for any issues encountered.
         """
-        validation_token = request.GET.get("validationToken")
-        if validation_token:
-            return HttpResponse(validation_token, content_type="text/plain")
-
         try:
             LOGGER.info(
                 "Contact notification received from Microsoft Graph API. Starting contact processing..."
             )
 
-            contact_data = json.loads(request.body.decode("utf-8"))
+            contact_data = orjson.loads(request.body)
 
-            if contact_data["value"][0]["clientState"] == MICROSOFT_CLIENT_STATE:
+            if is_client_state_valid(contact_data["value"][0]):
                 id_contact = contact_data["value"][0]["resourceData"]["id"]
                 subscription_id = contact_data["value"][0]["subscriptionId"]
-                microsoft_listener = MicrosoftListener.objects.filter(
-                    subscription_id=subscription_id
+                listener = (
+                    MicrosoftListener.objects.select_related("user")
+                    .only("subscription_id", "email", "user__id")
+                    .filter(subscription_id=subscription_id)
+                    .first()
                 )
+                if listener is None:
+                    return JsonResponse(
+                        {"status": "Notification received"},
+                        status=status.HTTP_202_ACCEPTED,
+                    )
                 change_type = contact_data["value"][0]["changeType"]
-                subscription = Subscription.objects.get(
-                    user=microsoft_listener.first().user
-                )
 
-                if not microsoft_listener.exists():
-                    pass
-                elif subscription.is_block:
+                if is_user_blocked(listener.user_id):
                     LOGGER.info(
-                        f"User with email: {microsoft_listener.first().email} is blocked. Unsubscribing user from subscription {subscription_id}."
+                        f"User with email: {listener.email} is blocked. Unsubscribing user from subscription {subscription_id}."
                     )
                     delete_subscription(
-                        microsoft_listener.first().user,
-                        microsoft_listener.first().email,
-                        microsoft_listener.first().subscription_id,
+                        listener.user,
+                        listener.email,
+                        listener.subscription_id,
                     )
                 elif change_type == "deleted":
-                    contact = Contact.objects.get(provider_id=id_contact)
-                    contact.delete()
+                    Contact.objects.filter(
+                        user_id=listener.user_id, provider_id=id_contact
+                    ).delete()
                 else:
-                    access_token = refresh_access_token(
-                        get_social_api(
-                            microsoft_listener.first().user,
-                            microsoft_listener.first().email,
-                        )
+                    submit_contact_processing(
+                        listener.user,
+                        listener.email,
+                        id_contact,
+                        change_type,
                     )
-                    url = f"https://graph.microsoft.com/v1.0/me/contacts/{id_contact}"
-                    headers = get_headers(access_token)
-
-                    try:
-                        response = requests.get(url, headers=headers)
-
-                        if response.status_code == 200:
-                            contact_data: dict[str, dict[str, dict]] = response.json()
-                            name = contact_data.get("displayName")
-                            email = contact_data.get("emailAddresses")[0].get("address")
-
-                            if change_type == "created":
-                                email_processing.save_email_sender(
-                                    microsoft_listener.first().user,
-                                    name,
-                                    email,
-                                    id_contact,
-                                )
-
-                            if change_type == "updated":
-                                contact = Contact.objects.get(provider_id=id_contact)
-                                contact.username = name
-                                contact.email = email
-                                contact.save()
-
-                        else:
-                            LOGGER.error(
-                                f"Failed to retrieve contact data: {response.reason}"
-                            )
-                            return Response(
-                                {
-                                    "error": f"Failed to retrieve contact data: {response.reason}"
-                                },
-                                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                            )
-
-                    except Exception as e:
-                        LOGGER.error(
-                            f"An error occurred in handling contact notification: {str(e)}"
-                        )
-                        return JsonResponse(
-                            {"error": "Internal server error"},
-                            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        )
 
                 return JsonResponse(
                     {"status": "Notification received"},
@@ -7,10 +7,8 @@ Endpoints:
 
 import logging
 from rest_framework import status
-from django.http import HttpRequest
-from rest_framework.decorators import api_view
+from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from aomail.utils.security import subscription
@@ -21,14 +19,13 @@ from aomail.email_providers.smtp.authentication import connect_to_smtp
 LOGGER = logging.getLogger(__name__)
 
 
-@api_view(["POST"])
 @subscription(ALLOW_ALL)
-def send_email(request: HttpRequest) -> Response:
+def send_email(request: Request) -> Response:
     """
     Sends an email using the Gmail API.
 
     Args:
-        request (HttpRequest): HTTP request object containing POST data with email details.
+        request (Request): HTTP request object containing POST data with email details.
 
     Returns:
         Response: Response indicating success or error.
@@ -34,11 +34,11 @@ from aomail.utils import email_processing
 from aomail.models import (
     Contact,
     KeyPoint,
-    Preference,
     Rule,
     SocialAPI,
     Category,
     Email,
+    EmailBody,
     Sender,
     CC_sender,
     BCC_sender,
@@ -58,7 +58,7 @@ from aomail.email_providers.imap import (
 )
 from aomail.ai_providers.utils import update_tokens_stats
 from aomail.controllers.labels import is_shipping_label, process_label
-from aomail.utils.security import encrypt_text
+from aomail.utils.security import encrypt_text, get_cached_preference
 from aomail.email_providers.google import labels as google_labels
 from aomail.email_providers.microsoft import labels as microsoft_labels
 from aomail.email_providers.google.compose_email import (
@@ -425,7 +425,8 @@ def process_email(email_data: dict, user: User, social_api: SocialAPI) -> dict:
     """
     try:
         user_description = social_api.user_description or ""
-        language = Preference.objects.get(user=user).language
+        preference = get_cached_preference(user.id)
+        language = preference.language
         category_dict = email_processing.get_db_categories(user)
 
         email_content = email_processing.preprocess_email(
@@ -434,7 +435,6 @@ def process_email(email_data: dict, user: User, social_api: SocialAPI) -> dict:
         search = Search(user.id)
 
         from_email = email_data["from_info"][1]
-        preference = Preference.objects.get(user=user)
 
         def get_summary():
             if email_data["is_reply"]:
@@ -545,39 +545,33 @@ def save_stats(email_ai: dict, user: User):
         email_ai (dict): A dictionary containing AI-generated information about the email.
         user (User): The user object whose statistics are being updated.
     """
-    statistics = Statistics.objects.get(user=user)
-
-    statistics.nb_emails_received += 1
-
-    statistics.nb_meeting += 1 if email_ai["flags"]["meeting"] else 0
-    statistics.nb_spam += 1 if email_ai["flags"]["spam"] else 0
-    statistics.nb_scam += 1 if email_ai["flags"]["scam"] else 0
-    statistics.nb_newsletter += 1 if email_ai["flags"]["newsletter"] else 0
-    statistics.nb_notification += 1 if email_ai["flags"]["notification"] else 0
-
-    statistics.nb_emails_important += 1 if email_ai["importance"] == IMPORTANT else 0
-    statistics.nb_emails_informative += (
-        1 if email_ai["importance"] == INFORMATIVE else 0
-    )
-    statistics.nb_emails_useless += 1 if email_ai["importance"] == USELESS else 0
-
-    statistics.nb_answer_required += 1 if email_ai["response"] == ANSWER_REQUIRED else 0
-    statistics.nb_might_require_answer += (
-        1 if email_ai["response"] == MIGHT_REQUIRE_ANSWER else 0
-    )
-    statistics.nb_no_answer_required += (
-        1 if email_ai["response"] == NO_ANSWER_REQUIRED else 0
-    )
-
-    statistics.nb_highly_relevant += (
-        1 if email_ai["relevance"] == HIGHLY_RELEVANT else 0
-    )
-    statistics.nb_possibly_relevant += (
-        1 if email_ai["relevance"] == POSSIBLY_RELEVANT else 0
+    flags = email_ai["flags"]
+    importance = email_ai["importance"]
+    response = email_ai["response"]
+    relevance = email_ai["relevance"]
+
+    counters = {
+        "nb_emails_received": True,
+        "nb_meeting": flags["meeting"],
+        "nb_spam": flags["spam"],
+        "nb_scam": flags["scam"],
+        "nb_newsletter": flags["newsletter"],
+        "nb_notification": flags["notification"],
+        "nb_emails_important": importance == IMPORTANT,
+        "nb_emails_informative": importance == INFORMATIVE,
+        "nb_emails_useless": importance == USELESS,
+        "nb_answer_required": response == ANSWER_REQUIRED,
+        "nb_might_require_answer": response == MIGHT_REQUIRE_ANSWER,
+        "nb_no_answer_required": response == NO_ANSWER_REQUIRED,
+        "nb_highly_relevant": relevance == HIGHLY_RELEVANT,
+        "nb_possibly_relevant": relevance == POSSIBLY_RELEVANT,
+        "nb_not_relevant": relevance == NOT_RELEVANT,
+    }
+
+    # increment in the database so concurrent ingests do not overwrite each other
+    Statistics.objects.filter(user=user).update(
+        **{field: models.F(field) + 1 for field, matched in counters.items() if matched}
     )
-    statistics.nb_not_relevant += 1 if email_ai["relevance"] == NOT_RELEVANT else 0
-
-    statistics.save()
 
 
 def process_email_entities(
@@ -599,11 +593,16 @@ def process_email_entities(
     category = Category.objects.get_or_create(name=topic, user=user)[0]
 
     sender_name, sender_email = from_info
-    sender, _ = Sender.objects.get_or_create(
-        email=sender_email, defaults={"name": sender_name or sender_email}
-    )
+    # addresses are case-insensitive: reuse a sender stored with another casing,
+    # new senders are stored lowercased
+    sender_email = sender_email.lower()
+    sender = Sender.objects.filter(email__iexact=sender_email).order_by("id").first()
+    if sender is None:
+        sender, _ = Sender.objects.get_or_create(
+            email=sender_email, defaults={"name": sender_name or sender_email}
+        )
 
-    if not Contact.objects.filter(user=user, email=sender_email).exists():
+    if not Contact.objects.filter(user=user, email__iexact=sender_email).exists():
         Contact.objects.get_or_create(
             user=user, email=sender_email, defaults={"username": sender_name}
         )
@@ -620,7 +619,7 @@ def create_email_entry(
     sender: Sender,
 ) -> Email:
     """
-    Create the main Email entry in the database.
+    Create the main Email entry and its body in the database.
 
     Args:
         email_ai (dict): Information provided by the AI processing.
@@ -633,7 +632,7 @@ def create_email_entry(
     Returns:
         Email: The created Email object.
     """
-    return Email.objects.create(
+    email_entry = Email.objects.create(
         social_api=social_api,
         provider_id=email_data["email_id"],
         email_provider=social_api.type_api,
@@ -644,12 +643,11 @@ def create_email_entry(
             EMAIL_ONE_LINE_SUMMARY_KEY,
             email_ai["summary"]["one_line"],
         ),
-        html_content=encrypt_text(
-            EMAIL_HTML_CONTENT_KEY, email_data.get("safe_html", "")
-        ),
         subject=email_data["subject"],
         priority=email_ai["importance"],
         sender=sender,
+        sender_email=sender.email,
+        sender_name=sender.name,
         category=category,
         user=user,
         date=email_data["sent_date"],
@@ -662,6 +660,13 @@ def create_email_entry(
         notification=email_ai["flags"]["notification"],
         meeting=email_ai["flags"]["meeting"],
     )
+    EmailBody.objects.create(
+        email=email_entry,
+        html_content=encrypt_text(
+            EMAIL_HTML_CONTENT_KEY, email_data.get("safe_html", "")
+        ),
+    )
+    return email_entry
 
 
 def create_keypoints(summary: dict, is_reply: bool, email_entry: Email):
@@ -673,21 +678,22 @@ def create_keypoints(summary: dict, is_reply: bool, email_entry: Email):
         is_reply (Email): The Email object to associate the keypoints with.
     """
     if is_reply:
-        keypoints = summary["keypoints"]
-        for index, keypoints_list in keypoints.items():
-            for keypoint in keypoints_list:
-                KeyPoint.objects.create(
-                    is_reply=True,
-                    position=index,
-                    category=summary["category"],
-                    organization=summary["organization"],
-                    topic=summary["topic"],
-                    content=keypoint,
-                    email=email_entry,
-                )
+        keypoints = [
+            KeyPoint(
+                is_reply=True,
+                position=index,
+                category=summary["category"],
+                organization=summary["organization"],
+                topic=summary["topic"],
+                content=keypoint,
+                email=email_entry,
+            )
+            for index, keypoints_list in summary["keypoints"].items()
+            for keypoint in keypoints_list
+        ]
     else:
-        for keypoint in summary["keypoints"]:
-            KeyPoint.objects.create(
+        keypoints = [
+            KeyPoint(
                 is_reply=False,
                 category=summary["category"],
                 organization=summary["organization"],
@@ -695,6 +701,9 @@ def create_keypoints(summary: dict, is_reply: bool, email_entry: Email):
                 content=keypoint,
                 email=email_entry,
             )
+            for keypoint in summary["keypoints"]
+        ]
+    KeyPoint.objects.bulk_create(keypoints)
 
 
 def create_cc_bcc_senders(processed_email: dict, email_entry: Email):
@@ -748,8 +757,11 @@ def create_cc_bcc_senders(processed_email: dict, email_entry: Email):
 
         return None, ""
 
-    def safe_create_sender(sender_info, creator_func):
-        """Helper function to safely create sender entries"""
+    cc_senders = []
+    bcc_senders = []
+
+    def safe_create_sender(sender_info, model, senders: list):
+        """Helper function to safely build sender entries"""
         try:
             email, name = extract_email_and_name(sender_info)
 
@@ -759,7 +771,7 @@ def create_cc_bcc_senders(processed_email: dict, email_entry: Email):
             if "@" not in email:
                 return
 
-            creator_func(email_object=email_entry, email=email, name=name)
+            senders.append(model(email_object=email_entry, email=email, name=name))
         except Exception as e:
             LOGGER.warning(f"Failed to create sender entry: {str(e)}")
 
@@ -767,23 +779,26 @@ def create_cc_bcc_senders(processed_email: dict, email_entry: Email):
         if isinstance(cc_info, dict):
             for email, name in cc_info.items():
                 if email and isinstance(email, str):
-                    safe_create_sender([email, name], CC_sender.objects.create)
+                    safe_create_sender([email, name], CC_sender, cc_senders)
         elif isinstance(cc_info, (list, tuple)):
             for sender in cc_info:
-                safe_create_sender(sender, CC_sender.objects.create)
+                safe_create_sender(sender, CC_sender, cc_senders)
         else:
-            safe_create_sender(cc_info, CC_sender.objects.create)
+            safe_create_sender(cc_info, CC_sender, cc_senders)
 
     if bcc_info:
         if isinstance(bcc_info, dict):
             for email, name in bcc_info.items():
                 if email and isinstance(email, str):
-                    safe_create_sender([email, name], BCC_sender.objects.create)
+                    safe_create_sender([email, name], BCC_sender, bcc_senders)
         elif isinstance(bcc_info, (list, tuple)):
             for sender in bcc_info:
-                safe_create_sender(sender, BCC_sender.objects.create)
+                safe_create_sender(sender, BCC_sender, bcc_senders)
         else:
-            safe_create_sender(bcc_info, BCC_sender.objects.create)
+            safe_create_sender(bcc_info, BCC_sender, bcc_senders)
+
+    CC_sender.objects.bulk_create(cc_senders)
+    BCC_sender.objects.bulk_create(bcc_senders)
 
 
 def create_pictures_and_attachments(processed_email: dict, email_entry: Email):
@@ -794,12 +809,19 @@ def create_pictures_and_attachments(processed_email: dict, email_entry: Email):
         processed_email (dict): A dictionary containing the processed email data.
         email_entry (Email): The Email object to associate the pictures and attachments with.
     """
-    for image_path in processed_email.get("image_files", []):
-        Picture.objects.create(email=email_entry, path=image_path)
-
-    for attachment in processed_email.get("attachments", []):
-        Attachment.objects.create(
-            email=email_entry,
-            name=attachment["attachmentName"],
-            id_api=attachment["attachmentId"],
-        )
+    Picture.objects.bulk_create(
+        [
+            Picture(email=email_entry, path=image_path)
+            for image_path in processed_email.get("image_files", [])
+        ]
+    )
+    Attachment.objects.bulk_create(
+        [
+            Attachment(
+                email=email_entry,
+                name=attachment["attachmentName"],
+                id_api=attachment["attachmentId"],
+            )
+            for attachment in processed_email.get("attachments", [])
+        ]
+    )
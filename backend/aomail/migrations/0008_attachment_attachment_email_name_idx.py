@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('aomail', '0007_socialapi_last_fetched_date'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='attachment',
+            index=models.Index(fields=['email', 'name'], name='attachment_email_name_idx'),
+        ),
+    ]
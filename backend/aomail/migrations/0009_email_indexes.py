@@ -0,0 +1,47 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('aomail', '0008_attachment_attachment_email_name_idx'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='email',
+            index=models.Index(fields=['user', 'archive', 'answer_later', '-date'], name='email_user_inbox_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='email',
+            index=models.Index(fields=['social_api', '-date'], name='email_social_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='email',
+            index=models.Index(fields=['user', 'priority'], name='email_user_prio_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='email',
+            index=models.Index(fields=['user', 'category'], name='email_user_cat_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='email',
+            index=models.Index(fields=['date'], name='email_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='contact',
+            index=models.Index(fields=['user', 'email'], name='contact_user_email_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='label',
+            index=models.Index(fields=['postage_deadline'], name='label_deadline_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='keypoint',
+            index=models.Index(fields=['email', 'category'], name='keypoint_email_cat_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('aomail', '0009_email_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='rule',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['domains'], name='rule_domains_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='rule',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['sender_emails'], name='rule_sender_emails_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='rule',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['categories'], name='rule_categories_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='rule',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['priorities'], name='rule_priorities_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='rule',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['flags'], name='rule_flags_gin'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Lower
+
+BACKFILL_BATCH_SIZE = 10000
+
+
+def backfill_sender_columns(apps, schema_editor):
+    Email = apps.get_model('aomail', 'Email')
+    Sender = apps.get_model('aomail', 'Sender')
+    senders = Sender.objects.filter(id=OuterRef('sender_id'))
+    max_id = Email.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+
+    # each batch is committed on its own since the migration is not atomic
+    for start in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+        Email.objects.filter(
+            id__gte=start, id__lt=start + BACKFILL_BATCH_SIZE, sender_email=''
+        ).update(
+            sender_email=Lower(Subquery(senders.values('email')[:1])),
+            sender_name=Subquery(senders.values('name')[:1]),
+        )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('aomail', '0010_rule_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='email',
+            name='sender_email',
+            field=models.CharField(default='', max_length=200),
+        ),
+        migrations.AddField(
+            model_name='email',
+            name='sender_name',
+            field=models.CharField(default='', max_length=200),
+        ),
+        migrations.RunPython(backfill_sender_columns, migrations.RunPython.noop),
+        AddIndexConcurrently(
+            model_name='email',
+            index=models.Index(fields=['sender_email'], name='email_sender_email_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aomail', '0011_email_sender_email_email_sender_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailBody',
+            fields=[
+                ('email', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='body', serialize=False, to='aomail.email')),
+                ('html_content', models.TextField(default='')),
+            ],
+        ),
+        migrations.RunSQL(
+            sql='INSERT INTO aomail_emailbody (email_id, html_content) SELECT id, html_content FROM aomail_email',
+            reverse_sql='UPDATE aomail_email SET html_content = aomail_emailbody.html_content FROM aomail_emailbody WHERE aomail_emailbody.email_id = aomail_email.id',
+        ),
+        migrations.RemoveField(
+            model_name='email',
+            name='html_content',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('aomail', '0012_emailbody'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='email',
+            index=models.Index(condition=models.Q(('read', False)), fields=['user', '-date'], name='email_user_unread_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+def keep_latest_last_used_agent(apps, schema_editor):
+    Agent = apps.get_model('aomail', 'Agent')
+    latest_ids = {}
+    for agent_id, user_id in Agent.objects.filter(last_used=True).order_by('id').values_list('id', 'user_id'):
+        latest_ids[user_id] = agent_id
+    Agent.objects.filter(last_used=True).exclude(id__in=latest_ids.values()).update(last_used=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aomail', '0013_email_email_user_unread_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_latest_last_used_agent, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='agent',
+            constraint=models.UniqueConstraint(condition=models.Q(('last_used', True)), fields=('user',), name='one_last_used_agent_per_user'),
+        ),
+    ]
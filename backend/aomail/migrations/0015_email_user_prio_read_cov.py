@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('aomail', '0014_agent_one_last_used_agent_per_user'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='email',
+            index=models.Index(fields=['user', 'priority', 'read', '-date'], include=('id',), name='email_user_prio_read_cov'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='email',
+            name='email_user_prio_idx',
+        ),
+    ]
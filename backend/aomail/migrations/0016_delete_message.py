@@ -0,0 +1,16 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('aomail', '0015_email_user_prio_read_cov'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='Message',
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('aomail', '0016_delete_message'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='email',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('subject'), name='gin_trgm_ops'), name='email_subject_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='email',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('sender_email'), name='gin_trgm_ops'), name='email_sender_email_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='email',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('sender_name'), name='gin_trgm_ops'), name='email_sender_name_trgm'),
+        ),
+    ]
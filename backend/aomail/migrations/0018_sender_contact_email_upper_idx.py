@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-16 10:00
+
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('aomail', '0017_email_trigram_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='sender',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='sender_email_upper_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='contact',
+            index=models.Index(models.F('user'), django.db.models.functions.text.Upper('email'), name='contact_user_email_upper_idx'),
+        ),
+    ]
@@ -5,8 +5,11 @@ Each model corresponds to a database table, storing data and implementing securi
 """
 
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 
 
 class Subscription(models.Model):
@@ -54,18 +57,18 @@ class Statistics(models.Model):
     nb_meeting = models.IntegerField(default=0)
 
 
-class Message(models.Model):
-    """Model for storing text messages."""
-
-    text = models.CharField(max_length=200)
-
-
 class Sender(models.Model):
     """Model for storing sender information."""
 
     email = models.CharField(max_length=200, unique=True)
     name = models.CharField(max_length=200)
 
+    class Meta:
+        indexes = [
+            # serves the case-insensitive sender lookup of the email ingestion
+            models.Index(Upper("email"), name="sender_email_upper_idx"),
+        ]
+
 
 class Contact(models.Model):
     """Stores contacts of an email account"""
@@ -75,6 +78,14 @@ class Contact(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     provider_id = models.CharField(max_length=320, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "email"], name="contact_user_email_idx"),
+            models.Index(
+                F("user"), Upper("email"), name="contact_user_email_upper_idx"
+            ),
+        ]
+
 
 class Category(models.Model):
     """Model for storing category information."""
@@ -194,6 +205,15 @@ class Rule(models.Model):
     # --- AI actions --- #
     action_reply_prompt = models.CharField(max_length=1000, null=True)  # user prompt
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=["domains"], name="rule_domains_gin"),
+            GinIndex(fields=["sender_emails"], name="rule_sender_emails_gin"),
+            GinIndex(fields=["categories"], name="rule_categories_gin"),
+            GinIndex(fields=["priorities"], name="rule_priorities_gin"),
+            GinIndex(fields=["flags"], name="rule_flags_gin"),
+        ]
+
 
 class MicrosoftListener(models.Model):
     """Stores information about Microsoft subscriptions"""
@@ -215,6 +235,13 @@ class GoogleListener(models.Model):
     )
 
 
+class EmailManager(models.Manager):
+    """Manager that joins the foreign keys read alongside most emails."""
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("category", "social_api")
+
+
 class Email(models.Model):
     """Model for storing email information."""
 
@@ -226,7 +253,6 @@ class Email(models.Model):
     email_provider = models.CharField(max_length=50)
     short_summary = models.TextField()
     one_line_summary = models.CharField(max_length=1000)
-    html_content = models.TextField(default="")
     subject = models.CharField(max_length=800)
     priority = models.CharField(max_length=50)
     read = models.BooleanField(default=False)
@@ -236,6 +262,9 @@ class Email(models.Model):
     sender = models.ForeignKey(
         Sender, on_delete=models.CASCADE, related_name="related_emails"
     )
+    # copies of the sender columns so email lists do not join Sender
+    sender_email = models.CharField(max_length=200, default="")
+    sender_name = models.CharField(max_length=200, default="")
     date = models.DateTimeField(null=True, blank=True)
     has_attachments = models.BooleanField(default=False)
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
@@ -247,6 +276,54 @@ class Email(models.Model):
     notification = models.BooleanField(default=False)
     meeting = models.BooleanField(default=False)
 
+    objects = EmailManager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "archive", "answer_later", "-date"],
+                name="email_user_inbox_idx",
+            ),
+            models.Index(fields=["social_api", "-date"], name="email_social_date_idx"),
+            # covers the id listing of the email search so it can be an index-only scan
+            models.Index(
+                fields=["user", "priority", "read", "-date"],
+                include=["id"],
+                name="email_user_prio_read_cov",
+            ),
+            models.Index(fields=["user", "category"], name="email_user_cat_idx"),
+            models.Index(fields=["date"], name="email_date_idx"),
+            models.Index(fields=["sender_email"], name="email_sender_email_idx"),
+            models.Index(
+                fields=["user", "-date"],
+                condition=models.Q(read=False),
+                name="email_user_unread_idx",
+            ),
+            # trigram indexes serving the icontains filters of the email search,
+            # which PostgreSQL receives as UPPER(column) LIKE UPPER(pattern)
+            GinIndex(
+                OpClass(Upper("subject"), name="gin_trgm_ops"),
+                name="email_subject_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("sender_email"), name="gin_trgm_ops"),
+                name="email_sender_email_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("sender_name"), name="gin_trgm_ops"),
+                name="email_sender_name_trgm",
+            ),
+        ]
+
+
+class EmailBody(models.Model):
+    """Model for storing the HTML content of an email apart from its metadata."""
+
+    email = models.OneToOneField(
+        Email, on_delete=models.CASCADE, primary_key=True, related_name="body"
+    )
+    html_content = models.TextField(default="")
+
 
 class Filter(models.Model):
     """Model for storing filter information"""
@@ -279,6 +356,11 @@ class Label(models.Model):
     label_name = models.CharField(max_length=250)
     postage_deadline = models.DateTimeField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["postage_deadline"], name="label_deadline_idx"),
+        ]
+
 
 class Attachment(models.Model):
     """Model for storing email attachment information."""
@@ -289,6 +371,11 @@ class Attachment(models.Model):
     name = models.CharField(max_length=200)
     id_api = models.CharField(max_length=500)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["email", "name"], name="attachment_email_name_idx"),
+        ]
+
 
 class CC_sender(models.Model):
     """Model for storing CC sender information."""
@@ -330,6 +417,11 @@ class KeyPoint(models.Model):
     content = models.TextField(max_length=50)
     email = models.ForeignKey(Email, on_delete=models.CASCADE)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["email", "category"], name="keypoint_email_cat_idx"),
+        ]
+
 
 class Signature(models.Model):
     """Model for storing user email signatures."""
@@ -358,11 +450,22 @@ class Agent(models.Model):
     )  # To update
     icon_name = models.TextField(default="")  # img name + file ext
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(last_used=True),
+                name="one_last_used_agent_per_user",
+            ),
+        ]
+
     def __str__(self):
         return self.agent_name
 
     def save(self, *args, **kwargs):
         if self.last_used:
-            # Set all other agents' last_used to False
-            Agent.objects.filter(user=self.user, last_used=True).update(last_used=False)
+            # Set the other agents' last_used to False
+            Agent.objects.filter(user_id=self.user_id, last_used=True).exclude(
+                pk=self.pk
+            ).update(last_used=False)
         super().save(*args, **kwargs)
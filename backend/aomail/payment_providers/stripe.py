@@ -247,13 +247,15 @@ def handle_checkout_session_completed(event: dict):
         subscription.save()
 
         # Resubscribe user to email notifications in case
-        social_apis = SocialAPI.objects.filter(user=user)
+        social_apis = SocialAPI.objects.filter(user=user).only(
+            "email", "type_api", "imap_config_id"
+        )
         for social_api in social_apis:
-            if social_api.type_api == GOOGLE and not social_api.imap_config:
+            if social_api.type_api == GOOGLE and not social_api.imap_config_id:
                 webhook_google.check_and_resubscribe_to_missing_resources(
                     user, social_api.email
                 )
-            elif social_api.type_api == MICROSOFT and not social_api.imap_config:
+            elif social_api.type_api == MICROSOFT and not social_api.imap_config_id:
                 webhook_microsoft.check_and_resubscribe_to_missing_resources(
                     user, social_api.email
                 )
@@ -327,13 +329,15 @@ def handle_updated_subscription(event: dict):
         subscription.save()
 
         # Resubscribe user to email notifications in case
-        social_apis = SocialAPI.objects.filter(user=subscription.user)
+        social_apis = SocialAPI.objects.filter(user=subscription.user).only(
+            "email", "type_api", "imap_config_id"
+        )
         for social_api in social_apis:
-            if social_api.type_api == GOOGLE and not social_api.imap_config:
+            if social_api.type_api == GOOGLE and not social_api.imap_config_id:
                 webhook_google.check_and_resubscribe_to_missing_resources(
                     subscription.user, social_api.email
                 )
-            elif social_api.type_api == MICROSOFT and not social_api.imap_config:
+            elif social_api.type_api == MICROSOFT and not social_api.imap_config_id:
                 webhook_microsoft.check_and_resubscribe_to_missing_resources(
                     subscription.user, social_api.email
                 )
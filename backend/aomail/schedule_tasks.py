@@ -6,8 +6,9 @@ import logging
 import time
 from django.utils import timezone
 from datetime import timedelta
-from aomail.models import GoogleListener
+from aomail.models import GoogleListener, MicrosoftListener
 from aomail.email_providers.google import webhook as google_webhook
+from aomail.email_providers.microsoft import webhook as microsoft_webhook
 from aomail.constants import ENV
 
 
@@ -66,3 +67,46 @@ def renew_gmail_subscriptions():
     minutes, seconds = divmod(remainder, 60)
     formatted_time = f"{int(hours):02}:{int(minutes):02}:{int(seconds):02}"
     LOGGER.info(f"Renewed {nb_subrenew} subscriptions in {formatted_time}.")
+
+
+def renew_microsoft_subscriptions():
+    """
+    Renew all Microsoft subscriptions, grouped by account to use batch requests.
+
+    Microsoft subscriptions expire after about 3 days: renewing them daily keeps them alive
+    without waiting for a lifecycle notification per subscription.
+    """
+    start_time = timezone.now().strftime("%Y-%m-%d %H:%M:%S")
+    LOGGER.info(
+        f"{start_time} - [{ENV}] Starting the subscription renewal process for Microsoft accounts."
+    )
+    start_time = time.time()
+
+    microsoft_listeners = (
+        MicrosoftListener.objects.select_related("user")
+        .exclude(user__subscription__is_block=True)
+        .order_by("user_id", "email")
+    )
+
+    # (user, email address) -> subscription IDs
+    subscriptions: dict[tuple, list[str]] = {}
+    for microsoft_listener in microsoft_listeners:
+        key = (microsoft_listener.user, microsoft_listener.email)
+        subscriptions.setdefault(key, []).append(microsoft_listener.subscription_id)
+
+    nb_subrenew = 0
+    for (user, email), subscription_ids in subscriptions.items():
+        try:
+            nb_subrenew += microsoft_webhook.renew_subscriptions_batch(
+                user, email, subscription_ids
+            )
+        except Exception as e:
+            LOGGER.error(
+                f"Failed to renew the Microsoft subscriptions of user ID: {user.id} and email: {email}: {str(e)}"
+            )
+
+    elapsed_time = time.time() - start_time
+    hours, remainder = divmod(elapsed_time, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    formatted_time = f"{int(hours):02}:{int(minutes):02}:{int(seconds):02}"
+    LOGGER.info(f"Renewed {nb_subrenew} Microsoft subscriptions in {formatted_time}.")
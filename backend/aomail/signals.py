@@ -0,0 +1,32 @@
+"""
+Handles model signals keeping cached data consistent with the database.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from aomail.models import Preference, Subscription
+from aomail.utils.security import (
+    get_block_cache_key,
+    get_preference_cache_key,
+    get_subscription_cache_key,
+)
+
+
+@receiver(post_save, sender=Subscription)
+@receiver(post_delete, sender=Subscription)
+def invalidate_subscription_block_cache(sender, instance: Subscription, **kwargs):
+    """Removes the cached subscription of the user when it changes."""
+    cache.delete_many(
+        [
+            get_block_cache_key(instance.user_id),
+            get_subscription_cache_key(instance.user_id),
+        ]
+    )
+
+
+@receiver(post_save, sender=Preference)
+@receiver(post_delete, sender=Preference)
+def invalidate_preference_cache(sender, instance: Preference, **kwargs):
+    """Removes the cached preferences of the user when they change."""
+    cache.delete(get_preference_cache_key(instance.user_id))
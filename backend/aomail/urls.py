@@ -128,9 +128,9 @@ urlpatterns = [
     path('microsoft/auth_url/', auth_microsoft.generate_auth_url, name='microsoft_auth_url'),
     path('microsoft/auth_url_link_email/', auth_microsoft.auth_url_link_email, name='microsoft_auth_url_link_email'),
     path('microsoft/auth_url_regrant/', auth_microsoft.auth_url_regrant, name='microsoft_auth_url_regrant'),
-    path('microsoft/receive_mail_notifications/', webhook_microsoft.MicrosoftEmailNotification.as_view(), name='receive_mail_notifications'),
-    path('microsoft/receive_contact_notifications/', webhook_microsoft.MicrosoftContactNotification.as_view(), name='receive_contact_notifications'),
-    path('microsoft/receive_subscription_notifications/', webhook_microsoft.MicrosoftSubscriptionNotification.as_view(), name='receive_subscription_notifications'),
+    path('microsoft/receive_mail_notifications/', webhook_microsoft.answer_validation_handshake(webhook_microsoft.MicrosoftEmailNotification.as_view()), name='receive_mail_notifications'),
+    path('microsoft/receive_contact_notifications/', webhook_microsoft.answer_validation_handshake(webhook_microsoft.MicrosoftContactNotification.as_view()), name='receive_contact_notifications'),
+    path('microsoft/receive_subscription_notifications/', webhook_microsoft.answer_validation_handshake(webhook_microsoft.MicrosoftSubscriptionNotification.as_view()), name='receive_subscription_notifications'),
     path('google/auth_url/', auth_google.generate_auth_url, name='google_auth_url'),
     path('google/auth_url_link_email/', auth_google.auth_url_link_email, name='google_auth_url_link_email'),
     path('google/auth_url_regrant/', auth_google.auth_url_regrant, name='google_auth_url_regrant'), # dev
@@ -5,7 +5,7 @@ Handles conversations with prompt engineering for user/AI interaction.
 from django.contrib.auth.models import User
 from langchain_community.chat_message_histories import ChatMessageHistory
 from aomail.ai_providers import llm_functions
-from aomail.models import Preference
+from aomail.utils.security import get_cached_preference
 from aomail.ai_providers.prompts import (
     IMPROVE_EMAIL_DRAFT_PROMPT,
     IMPROVE_EMAIL_RESPONSE_PROMPT,
@@ -64,7 +64,7 @@ class EmailReplyConversation:
                 tokens_input (int): The number of tokens used for the input.
                 tokens_output (int): The number of tokens used for the output.
         """
-        preference = Preference.objects.get(user=self.user)
+        preference = get_cached_preference(self.user.id)
         base_prompt = (
             preference.improve_email_response_prompt
             if preference.improve_email_response_prompt
@@ -149,7 +149,7 @@ class GenerateEmailConversation:
                 tokens_input (int): The number of tokens used for the input.
                 tokens_output (int): The number of tokens used for the output.
         """
-        preference = Preference.objects.get(user=self.user)
+        preference = get_cached_preference(self.user.id)
         base_prompt = (
             preference.improve_email_draft_prompt
             if preference.improve_email_draft_prompt
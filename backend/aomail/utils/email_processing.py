@@ -5,8 +5,8 @@ Utility Functions for Email Processing
 import logging
 import re
 import base64
-from django.db import IntegrityError
-from aomail.constants import DEFAULT_CATEGORY
+from django.db import IntegrityError, transaction
+from aomail.constants import CONTACTS_BULK_BATCH_SIZE, DEFAULT_CATEGORY
 from aomail.models import Category, Contact
 from bs4 import BeautifulSoup
 from django.contrib.auth.models import User
@@ -98,6 +98,45 @@ def save_email_sender(
             return False
 
 
+def save_email_senders_bulk(user: User, senders: list[tuple[str, str, str]]) -> int:
+    """
+    Saves several email senders at once, skipping no-reply addresses and already saved contacts.
+
+    Args:
+        user (User): The authenticated user object.
+        senders (list[tuple[str, str, str]]): Name, email address and provider ID of each sender.
+
+    Returns:
+        int: The number of contacts created.
+    """
+    # Keep the first sender seen for each email address
+    new_senders: dict[str, tuple[str, str]] = {}
+    for sender_name, sender_email, sender_id in senders:
+        if sender_email not in new_senders and not is_no_reply_email(sender_email):
+            new_senders[sender_email] = (sender_name, sender_id)
+
+    existing_emails = set(
+        Contact.objects.filter(user=user, email__in=new_senders).values_list(
+            "email", flat=True
+        )
+    )
+    contacts = [
+        Contact(
+            email=sender_email,
+            username=sender_name,
+            user=user,
+            provider_id=sender_id,
+        )
+        for sender_email, (sender_name, sender_id) in new_senders.items()
+        if sender_email not in existing_emails
+    ]
+
+    with transaction.atomic():
+        Contact.objects.bulk_create(contacts, batch_size=CONTACTS_BULK_BATCH_SIZE)
+
+    return len(contacts)
+
+
 # ----------------------- SAVE CONTACTS AFTER SENDING EMAIL -----------------------#
 def save_contacts(user: User, all_recipients: list[str]):
     """
@@ -108,7 +147,7 @@ def save_contacts(user: User, all_recipients: list[str]):
         all_recipients (list[str]): A list of recipient email addresses to be saved as contacts.
     """
     for recipient_email in all_recipients:
-        contact = Contact.objects.filter(email=recipient_email)
+        contact = Contact.objects.filter(user=user, email=recipient_email)
 
         if not is_no_reply_email(recipient_email):
             if not contact.exists():
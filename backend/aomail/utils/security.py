@@ -5,6 +5,7 @@ Handles all functions linked with logging and encryption.
 import logging
 import base64
 from functools import wraps
+from django.core.cache import cache
 from django.http import HttpRequest
 from datetime import timedelta
 from django.utils import timezone
@@ -13,11 +14,16 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.fernet import Fernet
 from rest_framework.decorators import permission_classes
 from rest_framework.permissions import IsAuthenticated
-from aomail.models import Subscription
+from aomail.models import Preference, Subscription
 from rest_framework.response import Response
 from rest_framework import status
-from aomail.constants import EMAIL_ADMIN, INACTIVE
-
+from aomail.constants import (
+    EMAIL_ADMIN,
+    INACTIVE,
+    PREFERENCE_CACHE_TTL,
+    SUBSCRIPTION_BLOCK_CACHE_TTL,
+    SUBSCRIPTION_CACHE_TTL,
+)
 
 ######################## LOGGING CONFIGURATION ########################
 LOGGER = logging.getLogger(__name__)
@@ -52,6 +58,94 @@ def get_ip_with_port(request: HttpRequest) -> str | None:
         return None
 
 
+# ----------------------- SUBSCRIPTION -----------------------#
+def get_block_cache_key(user_id: int) -> str:
+    """Returns the cache key storing the block status of the given user."""
+    return f"sub_block:{user_id}"
+
+
+def is_user_blocked(user_id: int) -> bool:
+    """
+    Returns the block status of the user's subscription, cached for SUBSCRIPTION_BLOCK_CACHE_TTL seconds.
+
+    The cache entry is invalidated whenever the subscription is saved or deleted.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        bool: True if the user is blocked, False otherwise.
+
+    Raises:
+        Subscription.DoesNotExist: If the user has no subscription.
+    """
+    key = get_block_cache_key(user_id)
+    blocked = cache.get(key)
+    if blocked is None:
+        blocked = Subscription.objects.values_list("is_block", flat=True).get(
+            user_id=user_id
+        )
+        cache.set(key, blocked, SUBSCRIPTION_BLOCK_CACHE_TTL)
+    return blocked
+
+
+def get_subscription_cache_key(user_id: int) -> str:
+    """Returns the cache key storing the subscription of the given user."""
+    return f"sub:{user_id}"
+
+
+def get_cached_subscription(user_id: int) -> Subscription:
+    """
+    Returns the user's subscription, cached for SUBSCRIPTION_CACHE_TTL seconds.
+
+    The returned instance is read-only: load the subscription from the database before saving it.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        Subscription: The subscription of the user.
+
+    Raises:
+        Subscription.DoesNotExist: If the user has no subscription.
+    """
+    key = get_subscription_cache_key(user_id)
+    subscription = cache.get(key)
+    if subscription is None:
+        subscription = Subscription.objects.get(user_id=user_id)
+        cache.set(key, subscription, SUBSCRIPTION_CACHE_TTL)
+    return subscription
+
+
+# ----------------------- PREFERENCE -----------------------#
+def get_preference_cache_key(user_id: int) -> str:
+    """Returns the cache key storing the preferences of the given user."""
+    return f"pref:{user_id}"
+
+
+def get_cached_preference(user_id: int) -> Preference:
+    """
+    Returns the user's preferences, cached for PREFERENCE_CACHE_TTL seconds.
+
+    The returned instance is read-only: load the preferences from the database before saving them.
+
+    Args:
+        user_id (int): The ID of the user.
+
+    Returns:
+        Preference: The preferences of the user.
+
+    Raises:
+        Preference.DoesNotExist: If the user has no preferences.
+    """
+    key = get_preference_cache_key(user_id)
+    preference = cache.get(key)
+    if preference is None:
+        preference = Preference.objects.get(user_id=user_id)
+        cache.set(key, preference, PREFERENCE_CACHE_TTL)
+    return preference
+
+
 # ----------------------- DECORATOR -----------------------#
 def block_user(view_func):
     @wraps(view_func)
@@ -64,8 +158,7 @@ def block_user(view_func):
                       Otherwise, returns a 403 response with an error message.
         """
         user = request.user
-        subscription = Subscription.objects.get(user=user)
-        if subscription.is_block:
+        if is_user_blocked(user.id):
             return Response(
                 {
                     "error": f"You have been blocked. Send an email at: {EMAIL_ADMIN} to get more informations"
@@ -93,7 +186,7 @@ def subscription(allowed_plans: list):
         @permission_classes([IsAuthenticated])
         def _wrapped_view(request: HttpRequest, *args, **kwargs):
             user = request.user
-            subscription = Subscription.objects.get(user=user)
+            subscription = get_cached_subscription(user.id)
 
             if not INACTIVE in allowed_plans:
                 if subscription.is_trial:
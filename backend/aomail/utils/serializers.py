@@ -7,7 +7,6 @@ A serializer is an object that requires specific parameters and is used to check
 from rest_framework import serializers
 from django.contrib.auth.models import User
 from aomail.models import (
-    Message,
     Category,
     Email,
     Rule,
@@ -243,12 +242,20 @@ class RuleSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class SenderListSerializer(serializers.ListSerializer):
+    """Serializer creating several 'Sender' rows with a single INSERT."""
+
+    def create(self, validated_data):
+        return Sender.objects.bulk_create([Sender(**data) for data in validated_data])
+
+
 class SenderSerializer(serializers.ModelSerializer):
     """Serializer for handling 'Sender' model data in API interactions."""
 
     class Meta:
         model = Sender
         fields = ["id", "email", "name"]
+        list_serializer_class = SenderListSerializer
 
 
 class NewEmailAISerializer(serializers.Serializer):
@@ -268,14 +275,6 @@ class EmailAIRecommendationsSerializer(serializers.Serializer):
 
 
 # ----------------------- EMAIL SERIALIZER -----------------------#
-class MessageSerializer(serializers.ModelSerializer):
-    """Serializer for the 'Message' model to handle API data."""
-
-    class Meta:
-        model = Message
-        fields = ["text"]
-
-
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for the 'User' model to handle API data."""
 
@@ -5,8 +5,8 @@ Handles AI-driven search to extract data from emails and help Ao to answer user
 import json
 import logging
 from aomail.ai_providers import llm_functions
-from aomail.models import KeyPoint, Preference
-
+from aomail.models import KeyPoint
+from aomail.utils.security import get_cached_preference
 
 ######################## LOGGING CONFIGURATION ########################
 LOGGER = logging.getLogger(__name__)
@@ -138,7 +138,7 @@ class Search:
             dict: A dictionary mapping highly relevant category names to their corresponding organizations.
         """
         try:
-            preference = Preference.objects.get(user_id=self.user_id)
+            preference = get_cached_preference(self.user_id)
             result_json = llm_functions.select_categories(
                 json.dumps(self.categories),
                 self.question,
@@ -165,7 +165,7 @@ class Search:
             dict[str, str]: A dictionary containing the answer and a boolean indicating if the answer is likely to be good.
         """
         try:
-            preference = Preference.objects.get(user_id=self.user_id)
+            preference = get_cached_preference(self.user_id)
             result_json = llm_functions.get_answer(
                 keypoints,
                 self.question,
@@ -197,7 +197,7 @@ class Search:
             dict: A dictionary containing the category, organization, topic, and keypoints of the email.
         """
         try:
-            preference = Preference.objects.get(user_id=self.user_id)
+            preference = get_cached_preference(self.user_id)
             result_json = llm_functions.summarize_conversation(
                 subject,
                 body,
@@ -231,7 +231,7 @@ class Search:
             dict: A dictionary containing the category, organization, topic, and keypoints of the email.
         """
         try:
-            preference = Preference.objects.get(user_id=self.user_id)
+            preference = get_cached_preference(self.user_id)
             result_json = llm_functions.summarize_email(
                 subject,
                 body,
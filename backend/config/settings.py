@@ -23,6 +23,11 @@ DATABASE_CONFIG = {
         "PASSWORD": os.getenv("DJANGO_DB_PASSWORD"),
         "HOST": os.getenv("DJANGO_DB_HOST"),
         "PORT": os.getenv("DJANGO_DB_PORT"),
+        # persistent connections are not reused under ASGI: pool with PgBouncer instead
+        "CONN_MAX_AGE": int(os.getenv("DJANGO_DB_CONN_MAX_AGE", 0)),
+        "CONN_HEALTH_CHECKS": True,
+        # PgBouncer in transaction mode does not support server-side cursors
+        "DISABLE_SERVER_SIDE_CURSORS": os.getenv("DJANGO_DB_PGBOUNCER") == "true",
     }
 }
 BACKEND_LOG_PATH = "backend.log"
@@ -217,4 +222,5 @@ AUTH_PASSWORD_VALIDATORS = [
 # https://crontab.guru/
 CRONJOBS = [
     ("0 3 * * *", "aomail.schedule_tasks.renew_gmail_subscriptions"),
+    ("30 3 * * *", "aomail.schedule_tasks.renew_microsoft_subscriptions"),
 ]
@@ -1,7 +1,11 @@
+import pytest
+from django.contrib.auth.models import User
+from aomail.models import Contact
 from aomail.utils.email_processing import (
     camel_to_snake,
     is_no_reply_email,
     preprocess_email,
+    save_email_senders_bulk,
     validate_email_address,
     snake_to_camel,
     contains_html,
@@ -74,3 +78,25 @@ def test_concat_text():
     assert concat_text("existing", "append") == "existingappend"
     assert concat_text(None, b"bytes text") == "bytes text"
     assert concat_text("existing", b"bytes append") == "existingbytes append"
+
+
+@pytest.mark.django_db
+def test_save_email_senders_bulk(user: User):
+    Contact.objects.create(user=user, email="known@example.com", username="known")
+
+    created = save_email_senders_bulk(
+        user,
+        [
+            ("alice", "alice@example.com", "1"),
+            ("alice bis", "alice@example.com", "2"),
+            ("known", "known@example.com", ""),
+            ("robot", "noreply@example.com", ""),
+        ],
+    )
+
+    assert created == 1
+    alice = Contact.objects.get(user=user, email="alice@example.com")
+    assert alice.username == "alice"
+    assert alice.provider_id == "1"
+    assert Contact.objects.filter(user=user, email="known@example.com").count() == 1
+    assert not Contact.objects.filter(user=user, email="noreply@example.com").exists()
@@ -1,6 +1,14 @@
 import pytest
 from django.contrib.auth.models import User
-from aomail.models import Category, Email, Rule, Sender, SocialAPI, Statistics
+from aomail.models import (
+    Category,
+    Email,
+    EmailBody,
+    Rule,
+    Sender,
+    SocialAPI,
+    Statistics,
+)
 from aomail.constants import (
     ANSWER_REQUIRED,
     DEFAULT_CATEGORY,
@@ -117,7 +125,7 @@ def sender():
 
 @pytest.fixture
 def email_entry(sender: Sender, social_api: SocialAPI):
-    return Email.objects.create(
+    email = Email.objects.create(
         social_api=social_api,
         provider_id="email_id",
         email_provider=social_api.type_api,
@@ -128,9 +136,6 @@ def email_entry(sender: Sender, social_api: SocialAPI):
             "XP6XNlULLDpZnZvskYE_dvJ3PPpXsmtFAv37Dlt3ak4=",
             "one line summary",
         ),
-        html_content=encrypt_text(
-            "XP6XNlULLDpZnZvskYE_dvJ3PPpXsmtFAv37Dlt3ak4=", "html content"
-        ),
         subject="subject",
         priority=IMPORTANT,
         sender=sender,
@@ -146,6 +151,13 @@ def email_entry(sender: Sender, social_api: SocialAPI):
         notification=True,
         meeting=True,
     )
+    EmailBody.objects.create(
+        email=email,
+        html_content=encrypt_text(
+            "XP6XNlULLDpZnZvskYE_dvJ3PPpXsmtFAv37Dlt3ak4=", "html content"
+        ),
+    )
+    return email
 
 
 @pytest.fixture
@@ -244,7 +256,7 @@ def test_save_email_to_db(processed_email: dict, social_api: SocialAPI, sender:
 
     assert email_entry.short_summary != "short summary"
     assert email_entry.one_line_summary != "one line summary"
-    assert email_entry.html_content != "html content"
+    assert email_entry.body.html_content != "html content"
     assert email_entry.subject == "subject"
     assert email_entry.priority == IMPORTANT
     assert email_entry.sender == sender
@@ -1,5 +1,7 @@
 import pytest
-from aomail.utils.security import encrypt_text, decrypt_text
+from django.contrib.auth.models import User
+from aomail.models import Preference
+from aomail.utils.security import encrypt_text, decrypt_text, get_cached_preference
 
 
 @pytest.fixture
@@ -13,3 +15,16 @@ def test_encrypt_text(encryption_key: str):
 
 def test_decrypt_text(encryption_key: str):
     assert decrypt_text(encryption_key, encrypt_text(encryption_key, "test")) == "test"
+
+
+@pytest.mark.django_db
+def test_get_cached_preference(user: User):
+    Preference.objects.get_or_create(user=user, defaults={"language": "english"})
+
+    assert get_cached_preference(user.id).language == "english"
+
+    preference = Preference.objects.get(user=user)
+    preference.language = "french"
+    preference.save()
+
+    assert get_cached_preference(user.id).language == "french"